@@ -0,0 +1,62 @@
+"""Compare sync and async processing of Type B orders with simulated I/O latency.
+
+Every API call and database write of the fake backends waits a fixed
+latency. Run from the ``src`` directory, optionally passing the order count
+and the latency in seconds:
+
+    python -m benchmarks.bench_async_order_service [2000] [0.005]
+"""
+import asyncio
+import sys
+import time
+from unittest.mock import patch
+
+from benchmarks.fake_backends import FakeAPIClient, FakeAsyncAPIClient, FakeOrderRepository
+from benchmarks.order_generators import generate_orders
+from constants.constants import OrderType
+from services.async_order_service import AsyncOrderService
+from services.order_service import OrderService
+
+DEFAULT_ORDER_COUNT = 2000
+DEFAULT_LATENCY = 0.005
+SYNC_WORKERS = 16
+ASYNC_CONCURRENCY = [16, 100, 500]
+
+
+def build_orders(count: int):
+    return list(generate_orders(count, type_mix={OrderType.B: 1.0}))
+
+
+def report(label: str, count: int, elapsed: float, baseline: float = None):
+    speedup = f", x{baseline / elapsed:.1f}" if baseline else ""
+    print(f"{label:>22}: {elapsed:.3f}s ({count / elapsed:,.0f} orders/s{speedup})")
+
+
+def main(count: int, latency: float):
+    # Database writes are sped up tenfold, so that API latency dominates
+    repository = FakeOrderRepository(latency=latency / 10)
+    with patch.object(OrderService, "order_repository", repository), patch.object(
+        OrderService, "api_client", FakeAPIClient(latency)
+    ), patch.object(AsyncOrderService, "api_client", FakeAsyncAPIClient(latency)):
+        sequential_count = count // 10
+        start = time.perf_counter()
+        OrderService.process_orders(build_orders(sequential_count))
+        sequential = (time.perf_counter() - start) * count / sequential_count
+        report("sync (extrapolated)", count, sequential)
+
+        start = time.perf_counter()
+        OrderService.process_orders(build_orders(count), max_workers=SYNC_WORKERS)
+        report(f"sync max_workers={SYNC_WORKERS}", count, time.perf_counter() - start, sequential)
+
+        for concurrency in ASYNC_CONCURRENCY:
+            with patch.object(AsyncOrderService, "max_concurrency", concurrency):
+                start = time.perf_counter()
+                asyncio.run(AsyncOrderService.process_orders(build_orders(count)))
+                report(f"async concurrency={concurrency}", count, time.perf_counter() - start, sequential)
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_ORDER_COUNT,
+        float(sys.argv[2]) if len(sys.argv) > 2 else DEFAULT_LATENCY,
+    )
@@ -0,0 +1,52 @@
+"""Compare scalar process_orders against batch classification of priority and Type C status.
+
+Run from the ``src`` directory, optionally passing the order count:
+
+    python -m benchmarks.bench_batch_classification [1000000]
+"""
+import sys
+import time
+from unittest.mock import patch
+
+from constants.constants import OrderType
+from models.order_batch import OrderBatch
+from models.order_model import Order
+from services import order_batch_classifier
+from services.order_batch_classifier import OrderBatchClassifier
+from services.order_service import OrderService
+
+DEFAULT_ORDER_COUNT = 1_000_000
+
+
+def build_orders(count: int):
+    return [Order(id=i, type=OrderType.C, amount=float(i % 400), is_special=i % 3 == 0) for i in range(count)]
+
+
+def report(label: str, count: int, elapsed: float, baseline: float = None):
+    speedup = f", x{baseline / elapsed:.1f}" if baseline else ""
+    print(f"{label:>14}: {elapsed:.3f}s ({count / elapsed:,.0f} orders/s{speedup})")
+
+
+def main(count: int):
+    orders = build_orders(count)
+    with patch.object(OrderService, "update_order", lambda order: True):
+        start = time.perf_counter()
+        OrderService.process_orders(orders)
+        scalar = time.perf_counter() - start
+    report("scalar", count, scalar)
+
+    batch = OrderBatch.from_orders(build_orders(count))
+    start = time.perf_counter()
+    OrderBatchClassifier.classify(batch, use_numpy=False)
+    report("batch (python)", count, time.perf_counter() - start, scalar)
+
+    if order_batch_classifier.np is not None:
+        start = time.perf_counter()
+        OrderBatchClassifier.classify(batch, use_numpy=True)
+        report("batch (numpy)", count, time.perf_counter() - start, scalar)
+    else:
+        print("NumPy is not installed, skipping the vectorized run")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_ORDER_COUNT)
@@ -0,0 +1,54 @@
+"""Benchmark per-row vs. bulk order updates against the SQLite stand-in.
+
+Run from the ``src`` directory, optionally passing the order counts:
+
+    python -m benchmarks.bench_db_bulk_update [10000 100000 1000000]
+"""
+import sys
+import time
+from unittest.mock import patch
+
+from constants.constants import DEFAULT_DB_BATCH_SIZE, OrderStatus, OrderType
+from models.order_model import Order
+from repositories.sqlite_order_repository import SQLiteOrderRepository
+from services.order_service import OrderService
+
+DEFAULT_SIZES = [10_000, 100_000, 1_000_000]
+
+
+def build_orders(count: int):
+    return [Order(id=i, type=OrderType.C, amount=float(i % 300), is_special=False) for i in range(count)]
+
+
+def run(count: int, bulk: bool) -> float:
+    repository = SQLiteOrderRepository()
+    orders = build_orders(count)
+    repository.insert_orders(orders, user_id=1)
+    for order in orders:
+        order.status = OrderStatus.COMPLETED
+
+    with patch.object(OrderService, "order_repository", repository):
+        start = time.perf_counter()
+        if bulk:
+            OrderService.update_orders(orders, DEFAULT_DB_BATCH_SIZE)
+        else:
+            for order in orders:
+                OrderService.update_order(order)
+        elapsed = time.perf_counter() - start
+
+    repository.close()
+    return elapsed
+
+
+def main(sizes):
+    for count in sizes:
+        per_row = run(count, bulk=False)
+        bulk = run(count, bulk=True)
+        print(
+            f"{count:>9} orders: per-row {per_row:.3f}s ({count / per_row:,.0f}/s), "
+            f"bulk {bulk:.3f}s ({count / bulk:,.0f}/s), x{per_row / bulk:.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or DEFAULT_SIZES)
@@ -0,0 +1,42 @@
+"""Compare bytes written and export throughput of every registered export format.
+
+Run from the ``src`` directory, optionally passing the row count:
+
+    python -m benchmarks.bench_export_formats [200000]
+"""
+import os
+import sys
+import tempfile
+import time
+
+from constants.constants import OrderType
+from models.order_model import Order
+from services.order_service import OrderService, TYPE_A_EXPORT_COLUMNS
+from utils.exporters.base_exporter import BaseExporter
+
+DEFAULT_ORDER_COUNT = 200_000
+
+
+def build_rows(count: int):
+    orders = (Order(id=i, type=OrderType.A, amount=float(i % 300) + 0.25, is_special=i % 4 == 0) for i in range(count))
+    return [row for order in orders for row in OrderService._build_type_a_rows(order)]
+
+
+def main(count: int):
+    rows = build_rows(count)
+    with tempfile.TemporaryDirectory() as directory:
+        for format_name in BaseExporter.formats():
+            exporter = BaseExporter.get_exporter(format_name)
+            path = os.path.join(directory, f"orders{exporter.extension}")
+            start = time.perf_counter()
+            exporter.export(rows, path, columns=TYPE_A_EXPORT_COLUMNS)
+            elapsed = time.perf_counter() - start
+            size = os.path.getsize(path)
+            print(
+                f"{format_name:>9}: {size / 2**20:7.2f} MiB ({size / len(rows):5.1f} B/row), "
+                f"{len(rows) / elapsed:,.0f} rows/s"
+            )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_ORDER_COUNT)
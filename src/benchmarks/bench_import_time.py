@@ -0,0 +1,84 @@
+"""Measure the import time of the order processing entry points with ``-X importtime``.
+
+Each module is imported in a fresh interpreter, several times, and the best
+cumulative time is reported along with the slowest modules it pulled in.
+The run fails when a module exceeds its budget or imports one of the
+backends that are meant to load lazily, so it can be used as a regression
+check. Run from the ``src`` directory:
+
+    python -m benchmarks.bench_import_time [--budget-ms 150] [--repeat 5]
+"""
+import argparse
+import subprocess
+import sys
+
+MODULES = ["services.order_service", "services.cli"]
+# Backends that a bare import must not load
+LAZY_MODULES = [
+    "http.client",
+    "concurrent.futures.process",
+    "sqlite3",
+    "csv",
+    "gzip",
+    "json",
+    "routers.order_api_client",
+    "utils.exporters.background_export_writer",
+    "utils.exporters.csv_exporter",
+    "utils.exporters.gzip_csv_exporter",
+    "utils.exporters.jsonl_exporter",
+    "utils.exporters.columnar_exporter",
+]
+
+
+def import_times(module: str) -> dict:
+    """Return the cumulative import time in microseconds of every module imported by ``module``."""
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        # The header line has no numbers
+        if cumulative.strip().isdigit():
+            times[name.strip()] = int(cumulative)
+    return times
+
+
+def main(args: argparse.Namespace) -> int:
+    failed = False
+    for module in MODULES:
+        runs = [import_times(module) for _ in range(args.repeat)]
+        best = min(runs, key=lambda times: times[module])
+        total_ms = best[module] / 1000
+        print(f"{module}: {total_ms:.1f}ms")
+
+        slowest = sorted((name for name in best if name != module), key=best.get, reverse=True)[: args.top]
+        for name in slowest:
+            print(f"    {name}: {best[name] / 1000:.1f}ms")
+
+        eager = [name for name in LAZY_MODULES if name in best]
+        if eager:
+            print(f"    imported eagerly: {', '.join(eager)}")
+            failed = True
+        if total_ms > args.budget_ms:
+            print(f"    over the {args.budget_ms:.0f}ms budget")
+            failed = True
+
+    return 1 if failed else 0
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--budget-ms", type=float, default=150.0, help="maximum cumulative import time per module")
+    parser.add_argument("--repeat", type=int, default=5, help="imports per module, the best one is reported")
+    parser.add_argument("--top", type=int, default=5, help="number of slowest imported modules shown")
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    sys.exit(main(parse_args()))
@@ -0,0 +1,66 @@
+"""Measure how fast order files are parsed, sequentially and on worker processes.
+
+Writes the same synthetic orders as a CSV file and as a binary order file
+into a temporary directory, then reports GB/s and orders/s for parsing each
+of them into order batches. Run from the ``src`` directory:
+
+    python -m benchmarks.bench_order_ingestion [--orders 1000000]
+        [--workers 1 4] [--chunk-size BYTES] [--seed 0]
+"""
+import argparse
+import os
+import tempfile
+import time
+
+from benchmarks.order_generators import generate_orders
+from constants.constants import DEFAULT_INGEST_CHUNK_SIZE
+from models.order_batch import OrderBatch
+from utils.ingestion.binary_order_file_reader import BinaryOrderFileReader
+from utils.ingestion.csv_order_file_reader import CSVOrderFileReader
+
+
+def write_files(directory: str, args: argparse.Namespace) -> dict:
+    batch = OrderBatch.from_orders(generate_orders(args.orders, seed=args.seed))
+
+    csv_path = os.path.join(directory, "orders.csv")
+    with open(csv_path, "w") as file_handler:
+        file_handler.write("id,type,amount,is_special\n")
+        file_handler.writelines(
+            f"{order.id},{order.type},{order.amount!r},{str(order.is_special).lower()}\n" for order in batch
+        )
+
+    binary_path = os.path.join(directory, "orders.ordb")
+    BinaryOrderFileReader.write(binary_path, batch)
+    return {"csv": (CSVOrderFileReader, csv_path), "binary": (BinaryOrderFileReader, binary_path)}
+
+
+def run_once(reader, workers: int) -> tuple:
+    start = time.perf_counter()
+    count = sum(len(batch) for batch in reader.iter_batches(workers=workers if workers > 1 else None))
+    return count, time.perf_counter() - start
+
+
+def main(args: argparse.Namespace) -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        for name, (reader_class, path) in write_files(directory, args).items():
+            size = os.path.getsize(path)
+            reader = reader_class(path, chunk_size=args.chunk_size)
+            for workers in args.workers:
+                count, elapsed = run_once(reader, workers)
+                print(
+                    f"{name:>6} {workers:>2} worker(s): {size / elapsed / 1e9:6.3f} GB/s, "
+                    f"{count / elapsed:>12,.0f} orders/s ({size / 2**20:.1f} MiB, {count:,} orders)"
+                )
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--orders", type=int, default=1_000_000)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, os.cpu_count() or 1])
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_INGEST_CHUNK_SIZE, help="bytes per parsed chunk")
+    parser.add_argument("--seed", type=int, default=0)
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    main(parse_args())
@@ -0,0 +1,55 @@
+"""Measure bytes per order for dict-backed, slotted and columnar representations.
+
+Run from the ``src`` directory, optionally passing the order count:
+
+    python -m benchmarks.bench_order_memory [1000000]
+"""
+import sys
+import tracemalloc
+
+from constants.constants import OrderPriority, OrderStatus, OrderType
+from models.order_batch import OrderBatch
+from models.order_model import Order
+
+DEFAULT_ORDER_COUNT = 1_000_000
+ORDER_TYPES = [OrderType.A, OrderType.B, OrderType.C]
+
+
+class DictOrder:
+    """The previous dict-backed Order layout, kept for comparison."""
+
+    def __init__(self, id, type, amount, is_special):
+        self.id = id
+        self.type = type
+        self.amount = amount
+        self.is_special = is_special
+        self.status = OrderStatus.NEW
+        self.priority = OrderPriority.LOW
+
+
+def order_args(count: int):
+    for i in range(count):
+        yield i, ORDER_TYPES[i % 3], float(i % 300) + 0.5, i % 5 == 0
+
+
+def measure(build, count: int) -> float:
+    tracemalloc.start()
+    container = build(count)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del container
+    return current / count
+
+
+def main(count: int):
+    results = {
+        "dict Order": measure(lambda n: [DictOrder(*args) for args in order_args(n)], count),
+        "__slots__ Order": measure(lambda n: [Order(*args) for args in order_args(n)], count),
+        "OrderBatch": measure(lambda n: OrderBatch.from_orders(Order(*args) for args in order_args(n)), count),
+    }
+    for label, per_order in results.items():
+        print(f"{label:>16}: {per_order:.1f} bytes/order ({count} orders)")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_ORDER_COUNT)
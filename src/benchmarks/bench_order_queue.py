@@ -0,0 +1,130 @@
+"""Load test of the order queue: HIGH priority latency while workers are saturated.
+
+A producer thread enqueues orders at ``--overload`` times what the workers
+can process, given the fake API and database latencies, with a share of
+HIGH priority orders. Once the producer stops, the workers are stopped and
+the throughput and queue latency of each priority are reported. Each run
+is repeated with a FIFO queue, where every priority shares one rank, as the
+baseline.
+
+Run from the ``src`` directory:
+
+    python -m benchmarks.bench_order_queue [--workers 8] [--duration 5]
+        [--overload 2] [--high-ratio 0.05] [--api-latency SECONDS]
+        [--db-latency SECONDS] [--lease-size 10] [--backend memory sqlite]
+"""
+import argparse
+import os
+import random
+import tempfile
+import threading
+import time
+from unittest.mock import patch
+
+from benchmarks.fake_backends import FakeAPIClient, FakeOrderRepository, NullExporter
+from benchmarks.order_generators import DEFAULT_TYPE_MIX, generate_orders
+from constants.constants import OrderAmountThreshold, OrderPriority, OrderType
+from repositories.in_memory_order_queue import InMemoryOrderQueue
+from repositories.sqlite_order_queue import SQLiteOrderQueue
+from services.order_service import OrderService
+from utils.exporters.base_exporter import BaseExporter
+
+FIFO_RANKS = {OrderPriority.HIGH: 0, OrderPriority.LOW: 0}
+TICK_SECONDS = 0.01
+
+
+def produce(args: argparse.Namespace, rate: float, stop: threading.Event) -> None:
+    """Enqueue orders at ``rate`` per second until the test duration is over."""
+    rng = random.Random(args.seed)
+    orders = generate_orders(
+        10**9, seed=args.seed, max_amount=OrderAmountThreshold.PRIORITY_THRESHOLD, special_ratio=0.5
+    )
+    start = time.perf_counter()
+    enqueued = 0
+    while True:
+        elapsed = time.perf_counter() - start
+        if elapsed >= args.duration:
+            break
+        batch = []
+        for order in orders:
+            if len(batch) >= int(rate * elapsed) - enqueued:
+                break
+            if rng.random() < args.high_ratio:
+                order.amount = OrderAmountThreshold.PRIORITY_THRESHOLD * (1 + rng.random())
+            batch.append(order)
+        enqueued += OrderService.enqueue_orders(batch)
+        time.sleep(TICK_SECONDS)
+    stop.set()
+
+
+def run_once(queue, args: argparse.Namespace) -> dict:
+    # Every order costs a database write, and Type B orders an API call as well
+    type_b_share = DEFAULT_TYPE_MIX[OrderType.B] / sum(DEFAULT_TYPE_MIX.values())
+    rate = args.overload * args.workers / max(args.db_latency + type_b_share * args.api_latency, 1e-4)
+    stop = threading.Event()
+
+    with patch.object(OrderService, "api_client", FakeAPIClient(args.api_latency, seed=args.seed)), patch.object(
+        OrderService, "order_repository", FakeOrderRepository(latency=args.db_latency)
+    ), patch.object(OrderService, "order_queue", queue), patch.object(
+        OrderService, "export_format", NullExporter.format_name
+    ), patch.dict(
+        BaseExporter._registry, {NullExporter.format_name: NullExporter}
+    ):
+        producer = threading.Thread(target=produce, args=(args, rate, stop))
+        producer.start()
+        stats = OrderService.process_order_queue(
+            workers=args.workers, run_id="bench", lease_size=args.lease_size, idle_timeout=None, stop=stop
+        )
+        producer.join()
+
+    return {"offered_rate": rate, "backlog": len(queue), **stats.to_dict()}
+
+
+def make_queue(backend: str, path: str, priority_ranks: dict):
+    if backend == "sqlite":
+        return SQLiteOrderQueue(path, priority_ranks=priority_ranks)
+    return InMemoryOrderQueue(priority_ranks=priority_ranks)
+
+
+def main(args: argparse.Namespace) -> list:
+    runs = []
+    with tempfile.TemporaryDirectory() as directory:
+        for backend in args.backend:
+            for mode, priority_ranks in (("priority", None), ("fifo", FIFO_RANKS)):
+                queue = make_queue(backend, os.path.join(directory, f"{mode}.db"), priority_ranks)
+                run = {"backend": backend, "mode": mode, **run_once(queue, args)}
+                if backend == "sqlite":
+                    queue.close()
+                runs.append(run)
+
+                print(
+                    f"{backend:>6} {mode:>8}: offered {run['offered_rate']:,.0f} orders/s, "
+                    f"backlog {run['backlog']:,}"
+                )
+                for priority in (OrderPriority.HIGH, OrderPriority.LOW):
+                    latency = run["queue_latency"].get(priority)
+                    if latency is None:
+                        continue
+                    print(
+                        f"{priority:>15}: {run['throughput'][priority]:>9,.0f} orders/s, queue latency "
+                        f"p50 {latency['p50'] * 1000:8.2f}ms p99 {latency['p99'] * 1000:8.2f}ms"
+                    )
+    return runs
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--duration", type=float, default=5.0, help="seconds the producer runs")
+    parser.add_argument("--overload", type=float, default=2.0, help="offered load over worker capacity")
+    parser.add_argument("--high-ratio", type=float, default=0.05, help="share of HIGH priority orders")
+    parser.add_argument("--api-latency", type=float, default=0.001, help="seconds per API call")
+    parser.add_argument("--db-latency", type=float, default=0.002, help="seconds per database write")
+    parser.add_argument("--lease-size", type=int, default=10)
+    parser.add_argument("--backend", nargs="+", choices=["memory", "sqlite"], default=["memory"])
+    parser.add_argument("--seed", type=int, default=0)
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    main(parse_args())
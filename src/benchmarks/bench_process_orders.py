@@ -0,0 +1,145 @@
+"""Measure process_orders throughput, latency and peak memory on synthetic orders.
+
+Orders come from the seeded generator and are processed against fake API,
+database and export backends, in each scenario at each size. For every run
+the suite reports orders/s, percentiles of the per-order latency (from the
+order being pulled off the input until its database write) and of each
+instrumented stage, and the peak traced memory, measured in a second pass
+because tracemalloc slows processing down.
+
+Run from the ``src`` directory:
+
+    python -m benchmarks.bench_process_orders [--sizes 1000 100000 1000000]
+        [--scenarios sequential batched concurrent] [--api-latency SECONDS]
+        [--db-latency SECONDS] [--export-latency SECONDS] [--seed 0]
+        [--output results.json] [--compare baseline.json] [--skip-memory]
+"""
+import argparse
+import json
+import platform
+import time
+import tracemalloc
+from unittest.mock import patch
+
+from benchmarks.fake_backends import FakeAPIClient, FakeOrderRepository, NullExporter
+from benchmarks.order_generators import AMOUNT_DISTRIBUTIONS, generate_orders
+from services.order_service import OrderService
+from utils.exporters.base_exporter import BaseExporter
+from utils.instrumentation.in_memory_collector import InMemoryCollector, LatencyHistogram
+
+DEFAULT_SIZES = [1_000, 100_000, 1_000_000]
+SCENARIOS = {
+    "sequential": {},
+    "batched": {"batch_export": True, "api_batch_size": 100, "db_batch_size": 500},
+    "concurrent": {"background_export": True, "max_workers": 8, "api_batch_size": 100, "db_batch_size": 500},
+}
+
+
+def run_once(size: int, options: dict, args: argparse.Namespace) -> dict:
+    collector = InMemoryCollector()
+    order_latency = LatencyHistogram()
+    started = {}
+
+    def track(orders):
+        for order in orders:
+            started[order.id] = time.perf_counter()
+            yield order
+
+    def on_update(orders):
+        now = time.perf_counter()
+        for order in orders:
+            order_latency.record(now - started.pop(order.id))
+
+    orders = generate_orders(
+        size, seed=args.seed, amount_distribution=args.amount_distribution, special_ratio=args.special_ratio
+    )
+    with patch.object(OrderService, "api_client", FakeAPIClient(args.api_latency, seed=args.seed)), patch.object(
+        OrderService, "order_repository", FakeOrderRepository(latency=args.db_latency, on_update=on_update)
+    ), patch.object(OrderService, "instrumentation", collector), patch.object(
+        OrderService, "export_format", NullExporter.format_name
+    ), patch.object(
+        NullExporter, "latency", args.export_latency
+    ), patch.dict(
+        BaseExporter._registry, {NullExporter.format_name: NullExporter}
+    ):
+        start = time.perf_counter()
+        success = OrderService.process_orders(track(orders), user_id=1, run_id="bench", **options)
+        elapsed = time.perf_counter() - start
+
+    return {
+        "success": success,
+        "seconds": elapsed,
+        "orders_per_second": size / elapsed,
+        "order_latency": order_latency.summary(),
+        "stages": collector.snapshot()["stages"],
+    }
+
+
+def measure_peak_memory(size: int, options: dict, args: argparse.Namespace) -> int:
+    tracemalloc.start()
+    try:
+        run_once(size, options, args)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def compare(results: list, baseline_path: str) -> None:
+    with open(baseline_path) as file_handler:
+        baseline = {(run["scenario"], run["orders"]): run for run in json.load(file_handler)["runs"]}
+
+    for run in results:
+        previous = baseline.get((run["scenario"], run["orders"]))
+        if previous is None:
+            continue
+        change = run["orders_per_second"] / previous["orders_per_second"] - 1
+        print(f"{run['scenario']:>10} {run['orders']:>9,}: {change:+.1%} orders/s vs baseline")
+
+
+def main(args: argparse.Namespace) -> dict:
+    runs = []
+    for scenario in args.scenarios:
+        for size in args.sizes:
+            run = {"scenario": scenario, "orders": size, **run_once(size, SCENARIOS[scenario], args)}
+            if not args.skip_memory:
+                run["peak_memory_bytes"] = measure_peak_memory(size, SCENARIOS[scenario], args)
+            runs.append(run)
+
+            latency = run["order_latency"]
+            memory = f", peak {run['peak_memory_bytes'] / 2**20:.2f} MiB" if "peak_memory_bytes" in run else ""
+            print(
+                f"{scenario:>10} {size:>9,}: {run['orders_per_second']:>10,.0f} orders/s, "
+                f"p50 {latency['p50'] * 1000:.3f}ms p99 {latency['p99'] * 1000:.3f}ms{memory}"
+            )
+
+    report = {
+        "python": platform.python_version(),
+        "settings": {name: value for name, value in vars(args).items() if name not in ("output", "compare")},
+        "runs": runs,
+    }
+    if args.output:
+        with open(args.output, "w") as file_handler:
+            json.dump(report, file_handler, indent=2, sort_keys=True)
+    if args.compare:
+        compare(runs, args.compare)
+    return report
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--scenarios", nargs="+", choices=sorted(SCENARIOS), default=list(SCENARIOS))
+    parser.add_argument("--api-latency", type=float, default=0.0, help="seconds per API call")
+    parser.add_argument("--db-latency", type=float, default=0.0, help="seconds per database write")
+    parser.add_argument("--export-latency", type=float, default=0.0, help="seconds per exporter write")
+    parser.add_argument("--amount-distribution", choices=AMOUNT_DISTRIBUTIONS, default="uniform")
+    parser.add_argument("--special-ratio", type=float, default=0.5)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="write the results as JSON to this file")
+    parser.add_argument("--compare", help="print the throughput change against an earlier JSON output")
+    parser.add_argument("--skip-memory", action="store_true", help="skip the peak memory pass")
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    main(parse_args())
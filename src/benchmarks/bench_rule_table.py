@@ -0,0 +1,111 @@
+"""Compare the compiled rule table against the if/elif chain it replaced.
+
+Each order is dispatched on its type, then gets its status from the Type B
+or Type C decision and its priority. Run from the ``src`` directory,
+optionally passing the order count:
+
+    python -m benchmarks.bench_rule_table [1000000]
+"""
+import random
+import sys
+import time
+
+from constants.constants import (
+    OrderType,
+    OrderStatus,
+    OrderPriority,
+    OrderHandler,
+    APIStatus,
+    OrderAmountThreshold,
+    ORDER_API_RESPONSE_THRESHOLD,
+    DEFAULT_ORDER_RULES,
+)
+from models.order_model import Order
+from responses.api_response import APIResponse
+from services.order_rule_table import OrderRuleTable
+
+DEFAULT_ORDER_COUNT = 1_000_000
+
+
+def build_orders(count: int):
+    rng = random.Random(0)
+    order_types = [OrderType.A, OrderType.B, OrderType.C, "INVALID_TYPE"]
+    return [
+        Order(id=i, type=rng.choice(order_types), amount=rng.uniform(0, 400), is_special=rng.random() < 0.5)
+        for i in range(count)
+    ]
+
+
+def decide_with_chain(orders, api_response):
+    for order in orders:
+        if order.type == OrderType.A:
+            pass
+        elif order.type == OrderType.B:
+            if api_response.status == APIStatus.SUCCESS:
+                if (
+                    api_response.data >= ORDER_API_RESPONSE_THRESHOLD
+                    and order.amount < OrderAmountThreshold.PROCESSED_ORDER_THRESHOLD
+                ):
+                    order.status = OrderStatus.PROCESSED
+                elif api_response.data < ORDER_API_RESPONSE_THRESHOLD or order.is_special:
+                    order.status = OrderStatus.PENDING
+                else:
+                    order.status = OrderStatus.ERROR
+            else:
+                order.status = OrderStatus.API_ERROR
+        elif order.type == OrderType.C:
+            if order.is_special:
+                order.status = OrderStatus.COMPLETED
+            else:
+                order.status = OrderStatus.IN_PROGRESS
+        else:
+            order.status = OrderStatus.UNKNOWN_TYPE
+
+        if order.amount > OrderAmountThreshold.PRIORITY_THRESHOLD:
+            order.priority = OrderPriority.HIGH
+        else:
+            order.priority = OrderPriority.LOW
+
+
+def decide_with_table(orders, api_response, rule_table):
+    handlers = rule_table.handlers
+    type_b_status = rule_table["type_b_status"]
+    type_c_status = rule_table["type_c_status"]
+    priority = rule_table["priority"]
+    for order in orders:
+        handler = handlers.get(order.type)
+        if handler is None:
+            order.status = OrderStatus.UNKNOWN_TYPE
+        elif handler == OrderHandler.TYPE_B:
+            order.status = type_b_status(order, api_response)
+        elif handler == OrderHandler.TYPE_C:
+            order.status = type_c_status(order)
+        order.priority = priority(order)
+
+
+def main(count: int):
+    orders = build_orders(count)
+    api_response = APIResponse(APIStatus.SUCCESS, ORDER_API_RESPONSE_THRESHOLD)
+
+    start = time.perf_counter()
+    rule_table = OrderRuleTable.from_config(DEFAULT_ORDER_RULES)
+    print(f"   compile: {(time.perf_counter() - start) * 1000:.2f}ms")
+
+    start = time.perf_counter()
+    decide_with_chain(orders, api_response)
+    chain = time.perf_counter() - start
+    expected = [(order.status, order.priority) for order in orders]
+    print(f"     chain: {chain:.3f}s ({count / chain:,.0f} orders/s)")
+
+    for order in orders:
+        order.status = OrderStatus.NEW
+    start = time.perf_counter()
+    decide_with_table(orders, api_response, rule_table)
+    table = time.perf_counter() - start
+    print(f"     table: {table:.3f}s ({count / table:,.0f} orders/s, x{chain / table:.2f})")
+
+    assert [(order.status, order.priority) for order in orders] == expected
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_ORDER_COUNT)
@@ -0,0 +1,50 @@
+"""Compare peak memory of materialized vs. paginated order fetching with tracemalloc.
+
+Run from the ``src`` directory, optionally passing the order count:
+
+    python -m benchmarks.bench_streaming_fetch [200000]
+"""
+import sys
+import time
+import tracemalloc
+from unittest.mock import patch
+
+from constants.constants import DEFAULT_FETCH_PAGE_SIZE, OrderType
+from models.order_model import Order
+from repositories.sqlite_order_repository import SQLiteOrderRepository
+from services.order_service import OrderService
+
+DEFAULT_ORDER_COUNT = 200_000
+USER_ID = 1
+
+
+def seed(count: int) -> SQLiteOrderRepository:
+    repository = SQLiteOrderRepository()
+    repository.insert_orders(
+        (Order(id=i, type=OrderType.C, amount=float(i % 300), is_special=i % 3 == 0) for i in range(count)),
+        user_id=USER_ID,
+    )
+    return repository
+
+
+def run(repository: SQLiteOrderRepository, page_size: int = None):
+    with patch.object(OrderService, "order_repository", repository):
+        tracemalloc.start()
+        start = time.perf_counter()
+        OrderService.process_order_by_user_id(USER_ID, page_size=page_size, db_batch_size=500)
+        elapsed = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    return elapsed, peak
+
+
+def main(count: int):
+    repository = seed(count)
+    for label, page_size in [("materialized", None), (f"page_size={DEFAULT_FETCH_PAGE_SIZE}", DEFAULT_FETCH_PAGE_SIZE)]:
+        elapsed, peak = run(repository, page_size)
+        print(f"{label:>16}: {count} orders in {elapsed:.2f}s, peak traced memory {peak / 2**20:.1f} MiB")
+    repository.close()
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_ORDER_COUNT)
@@ -0,0 +1,52 @@
+"""Benchmark sequential vs. concurrent Type B dispatch against a slow fake API.
+
+Run from the ``src`` directory:
+
+    python -m benchmarks.bench_type_b_concurrency
+"""
+import time
+from unittest.mock import patch
+
+from constants.constants import APIStatus, OrderType
+from models.order_model import Order
+from responses.api_response import APIResponse
+from routers.order_api_client import OrderAPIClient
+from services.order_service import OrderService
+
+ORDER_COUNT = 200
+API_LATENCY = 0.01
+WORKER_COUNTS = [4, 16, 64]
+
+
+def fake_call_api(self, order_id: int) -> APIResponse:
+    time.sleep(API_LATENCY)
+    return APIResponse(status=APIStatus.SUCCESS, data=order_id % 100)
+
+
+def build_orders():
+    return [
+        Order(id=i, type=OrderType.B, amount=float(i % 300), is_special=i % 2 == 0)
+        for i in range(ORDER_COUNT)
+    ]
+
+
+def run(max_workers: int = None) -> float:
+    orders = build_orders()
+    start = time.perf_counter()
+    OrderService.process_orders(orders, max_workers=max_workers)
+    return time.perf_counter() - start
+
+
+def main():
+    with patch.object(OrderAPIClient, "call_api", fake_call_api), patch.object(
+        OrderService, "update_order"
+    ):
+        baseline = run()
+        print(f"sequential: {baseline:.3f}s ({ORDER_COUNT} orders, {API_LATENCY * 1000:.0f}ms latency)")
+        for workers in WORKER_COUNTS:
+            elapsed = run(workers)
+            print(f"max_workers={workers}: {elapsed:.3f}s (x{baseline / elapsed:.1f})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""Fake API, database and exporter backends with tunable latency for the benchmarks."""
+import asyncio
+import random
+import time
+from typing import Callable, Dict, Iterable, List
+
+from constants.constants import APIStatus
+from models.order_model import Order
+from repositories.base_order_repository import BaseOrderRepository
+from responses.api_response import APIResponse
+from routers.base_api_client import BaseAPIClient
+from routers.base_async_api_client import BaseAsyncAPIClient
+from utils.exporters.base_exporter import BaseExporter
+
+
+class FakeAPIClient(BaseAPIClient):
+    """API client answering every call after ``latency`` seconds.
+
+    A batch call costs one ``latency``, like a real bulk endpoint. A share
+    ``error_ratio`` of the responses have the ERROR status.
+    """
+
+    def __init__(self, latency: float = 0.0, error_ratio: float = 0.0, seed: int = 0) -> None:
+        self.latency = latency
+        self.error_ratio = error_ratio
+        self._rng = random.Random(seed)
+
+    def _response(self, order_id: int) -> APIResponse:
+        if self.error_ratio and self._rng.random() < self.error_ratio:
+            return APIResponse(status=APIStatus.ERROR, data=None)
+        return APIResponse(status=APIStatus.SUCCESS, data=order_id % 100)
+
+    def call_api(self, order_id: int) -> APIResponse:
+        if self.latency:
+            time.sleep(self.latency)
+        return self._response(order_id)
+
+    def call_api_batch(self, ids: List[int]) -> Dict[int, APIResponse]:
+        if self.latency:
+            time.sleep(self.latency)
+        return {order_id: self._response(order_id) for order_id in ids}
+
+
+class FakeOrderRepository(BaseOrderRepository):
+    """Order repository keeping nothing, whose every write takes ``latency`` seconds.
+
+    ``on_update`` is called with the orders of each successful write.
+    """
+
+    def __init__(
+        self,
+        orders: List[Order] = None,
+        latency: float = 0.0,
+        on_update: Callable[[List[Order]], None] = None,
+    ) -> None:
+        self.orders = orders or []
+        self.latency = latency
+        self.on_update = on_update
+
+    def fetch_orders_page(self, user_id: int, after_id: int = None, limit: int = 1000) -> List[Order]:
+        orders = [order for order in self.orders if after_id is None or order.id > after_id]
+        return orders[:limit]
+
+    def update_order(self, order: Order) -> bool:
+        self.update_orders([order])
+        return True
+
+    def update_orders(self, orders: List[Order]) -> int:
+        if self.latency:
+            time.sleep(self.latency)
+        if self.on_update is not None:
+            self.on_update(orders)
+        return len(orders)
+
+
+class NullExporter(BaseExporter):
+    """Exporter discarding its rows, taking ``latency`` seconds per ``write_rows`` call.
+
+    It is not registered; benchmarks add it to the registry while they run.
+    """
+
+    format_name = "null"
+    extension = ".null"
+    supports_append = True
+    latency = 0.0
+
+    def open(self) -> "NullExporter":
+        return self
+
+    def write_rows(self, rows: Iterable[list]) -> None:
+        for _ in rows:
+            pass
+        if self.latency:
+            time.sleep(self.latency)
+
+    def close(self) -> None:
+        pass
+
+
+class FakeAsyncAPIClient(BaseAsyncAPIClient):
+    """Async counterpart of FakeAPIClient, waiting ``latency`` seconds without blocking."""
+
+    def __init__(self, latency: float = 0.0, error_ratio: float = 0.0, seed: int = 0) -> None:
+        self._client = FakeAPIClient(error_ratio=error_ratio, seed=seed)
+        self.latency = latency
+
+    async def call_api(self, order_id: int) -> APIResponse:
+        await asyncio.sleep(self.latency)
+        return self._client._response(order_id)
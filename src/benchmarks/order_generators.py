@@ -0,0 +1,63 @@
+"""Seeded synthetic order generators shared by the benchmarks."""
+import random
+from typing import Dict, Iterator
+
+from constants.constants import OrderType, OrderAmountThreshold
+from models.order_model import Order
+
+DEFAULT_TYPE_MIX = {OrderType.A: 0.3, OrderType.B: 0.4, OrderType.C: 0.25, "INVALID_TYPE": 0.05}
+AMOUNT_DISTRIBUTIONS = ("uniform", "lognormal", "thresholds")
+
+
+def generate_orders(
+    count: int,
+    seed: int = 0,
+    type_mix: Dict[str, float] = None,
+    amount_distribution: str = "uniform",
+    max_amount: float = 2 * OrderAmountThreshold.PRIORITY_THRESHOLD,
+    special_ratio: float = 0.5,
+    start_id: int = 1,
+) -> Iterator[Order]:
+    """Lazily generate ``count`` orders, the same ones for the same arguments.
+
+    Args:
+            count (int): Number of orders
+            seed (int): Seed of the random generator
+            type_mix (Dict[str, float]): Relative weight of each order type,
+                    ``DEFAULT_TYPE_MIX`` when None
+            amount_distribution (str): ``uniform`` over [0, max_amount],
+                    ``lognormal`` with its median at a quarter of max_amount,
+                    or ``thresholds`` to pick the amount thresholds and their
+                    neighbours, which exercises every decision boundary
+            max_amount (float): Upper bound of the uniform distribution
+            special_ratio (float): Share of special orders
+            start_id (int): ID of the first order
+    """
+    if amount_distribution not in AMOUNT_DISTRIBUTIONS:
+        raise ValueError(f"Unknown amount distribution {amount_distribution!r}, expected one of {AMOUNT_DISTRIBUTIONS}")
+
+    rng = random.Random(seed)
+    type_mix = type_mix or DEFAULT_TYPE_MIX
+    order_types = list(type_mix)
+    weights = list(type_mix.values())
+    thresholds = [
+        OrderAmountThreshold.PROCESSED_ORDER_THRESHOLD,
+        OrderAmountThreshold.HIGH_VALUE_ORDER_THRESHOLD,
+        OrderAmountThreshold.PRIORITY_THRESHOLD,
+    ]
+    boundary_amounts = [amount + delta for amount in thresholds for delta in (-0.01, 0.0, 0.01)]
+
+    for order_id in range(start_id, start_id + count):
+        if amount_distribution == "uniform":
+            amount = rng.uniform(0, max_amount)
+        elif amount_distribution == "lognormal":
+            amount = rng.lognormvariate(0, 1) * max_amount / 4
+        else:
+            amount = rng.choice(boundary_amounts)
+
+        yield Order(
+            id=order_id,
+            type=rng.choices(order_types, weights)[0],
+            amount=round(amount, 2),
+            is_special=rng.random() < special_ratio,
+        )
@@ -38,6 +38,14 @@ class OrderAmountThreshold:
     PROCESSED_ORDER_THRESHOLD = 100
 
 
+class OrderHandler:
+    """Enum for the OrderService methods an order type can be routed to."""
+
+    TYPE_A = "process_type_a_orders"
+    TYPE_B = "process_type_b_orders"
+    TYPE_C = "process_type_c_orders"
+
+
 class APIStatus:
     """Enum for API statuses."""
 
@@ -47,3 +55,92 @@ class APIStatus:
 
 
 ORDER_API_RESPONSE_THRESHOLD = 50
+
+DEFAULT_API_BATCH_SIZE = 100
+
+ORDER_API_BASE_URL = "http://localhost:8000"
+DEFAULT_API_POOL_SIZE = 10
+DEFAULT_API_TIMEOUT = 10
+DEFAULT_DB_BATCH_SIZE = 500
+DEFAULT_FETCH_PAGE_SIZE = 1000
+DEFAULT_API_CACHE_SIZE = 10000
+DEFAULT_API_CACHE_TTL = 60
+DEFAULT_API_NEGATIVE_CACHE_TTL = 5
+DEFAULT_API_RETRIES = 2
+DEFAULT_API_BACKOFF = 0.1
+DEFAULT_API_MAX_BACKOFF = 2
+DEFAULT_CIRCUIT_FAILURE_THRESHOLD = 5
+DEFAULT_CIRCUIT_RECOVERY_TIME = 30
+DEFAULT_EXPORT_QUEUE_SIZE = 10000
+DEFAULT_EXPORT_FLUSH_ROWS = 5000
+DEFAULT_EXPORT_FLUSH_INTERVAL = 1.0
+DEFAULT_EXPORT_BUFFER_SIZE = 1 << 20
+DEFAULT_COLUMNAR_ROW_GROUP_SIZE = 1 << 16
+DEFAULT_STATE_STORE_CHUNK_SIZE = 500
+DEFAULT_ASYNC_CONCURRENCY = 100
+DEFAULT_INGEST_CHUNK_SIZE = 16 << 20
+DEFAULT_CHECKPOINT_INTERVAL = 1000
+DEFAULT_QUEUE_SHARDS = 4
+DEFAULT_QUEUE_LEASE_SIZE = 10
+DEFAULT_QUEUE_LEASE_SECONDS = 30.0
+DEFAULT_QUEUE_POLL_INTERVAL = 0.01
+DEFAULT_QUEUE_MAX_ATTEMPTS = 3
+DEFAULT_QUEUE_RETRY_DELAY = 0.1
+DEFAULT_QUEUE_MAX_RETRY_DELAY = 60.0
+
+# Rank of each priority in the order queues, lower ranks are leased first
+QUEUE_PRIORITY_RANKS = {OrderPriority.HIGH: 0, OrderPriority.LOW: 1}
+
+# Statuses after which an order with unchanged inputs needs no reprocessing
+SETTLED_ORDER_STATUSES = (OrderStatus.EXPORTED, OrderStatus.COMPLETED, OrderStatus.PROCESSED)
+
+# Handlers an OrderRuleTable accepts
+ORDER_HANDLERS = (OrderHandler.TYPE_A, OrderHandler.TYPE_B, OrderHandler.TYPE_C)
+
+# Decision tables every OrderRuleTable needs
+ORDER_RULE_TABLES = ("type_b_status", "type_c_status", "priority")
+
+# Order routing and decision rules, compiled by OrderRuleTable. Handlers map
+# an order type to the OrderService method processing it, one of ORDER_HANDLERS. Each table is a
+# list of rules checked in order; the first rule whose conditions all hold
+# gives the result, and a rule without conditions always matches.
+DEFAULT_ORDER_RULES = {
+    "handlers": {
+        OrderType.A: OrderHandler.TYPE_A,
+        OrderType.B: OrderHandler.TYPE_B,
+        OrderType.C: OrderHandler.TYPE_C,
+    },
+    "tables": {
+        "type_b_status": [
+            {
+                "when": {
+                    "response.status": ["==", APIStatus.SUCCESS],
+                    "response.data": [">=", ORDER_API_RESPONSE_THRESHOLD],
+                    "order.amount": ["<", OrderAmountThreshold.PROCESSED_ORDER_THRESHOLD],
+                },
+                "result": OrderStatus.PROCESSED,
+            },
+            {
+                "when": {
+                    "response.status": ["==", APIStatus.SUCCESS],
+                    "response.data": ["<", ORDER_API_RESPONSE_THRESHOLD],
+                },
+                "result": OrderStatus.PENDING,
+            },
+            {
+                "when": {"response.status": ["==", APIStatus.SUCCESS], "order.is_special": ["truthy"]},
+                "result": OrderStatus.PENDING,
+            },
+            {"when": {"response.status": ["==", APIStatus.SUCCESS]}, "result": OrderStatus.ERROR},
+            {"result": OrderStatus.API_ERROR},
+        ],
+        "type_c_status": [
+            {"when": {"order.is_special": ["truthy"]}, "result": OrderStatus.COMPLETED},
+            {"result": OrderStatus.IN_PROGRESS},
+        ],
+        "priority": [
+            {"when": {"order.amount": [">", OrderAmountThreshold.PRIORITY_THRESHOLD]}, "result": OrderPriority.HIGH},
+            {"result": OrderPriority.LOW},
+        ],
+    },
+}
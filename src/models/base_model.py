@@ -4,6 +4,9 @@ from abc import ABC, abstractmethod
 class BaseModel(ABC):
     """Abstract base class for all models in the application."""
 
+    # Empty so that subclasses declaring __slots__ don't get an instance __dict__
+    __slots__ = ()
+
     @abstractmethod
     def __init__(self, **kwargs):
         """Initialize the model instance with provided attributes."""
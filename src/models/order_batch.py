@@ -0,0 +1,118 @@
+from array import array
+from typing import Iterable, Iterator, List
+
+from constants.constants import OrderType, OrderStatus, OrderPriority
+from .order_model import Order
+
+
+def _enum_values(enum_class) -> tuple:
+    """Return the values of a constants class in definition order."""
+    return tuple(value for name, value in vars(enum_class).items() if not name.startswith("_"))
+
+
+# Code tables: the integer code of a value is its index in the table
+ORDER_TYPES = _enum_values(OrderType)
+ORDER_STATUSES = _enum_values(OrderStatus)
+ORDER_PRIORITIES = _enum_values(OrderPriority)
+
+_TYPE_CODES = {value: code for code, value in enumerate(ORDER_TYPES)}
+_STATUS_CODES = {value: code for code, value in enumerate(ORDER_STATUSES)}
+_PRIORITY_CODES = {value: code for code, value in enumerate(ORDER_PRIORITIES)}
+
+
+class OrderBatch:
+    """Columnar container for a large number of orders.
+
+    IDs and amounts are kept in typed arrays, and type, status and priority
+    are kept as one-byte codes indexing the ``ORDER_TYPES``, ``ORDER_STATUSES``
+    and ``ORDER_PRIORITIES`` tables. Order types outside ``OrderType`` get
+    codes past the end of ``ORDER_TYPES`` that are local to the batch.
+
+    Attributes:
+            ids (array): Order IDs
+            amounts (array): Order amounts
+            is_special (array): 1 for special orders, 0 otherwise
+            type_codes (array): Order type codes
+            status_codes (array): Order status codes
+            priority_codes (array): Order priority codes
+    """
+
+    def __init__(self) -> None:
+        self.ids = array("q")
+        self.amounts = array("d")
+        self.is_special = array("b")
+        self.type_codes = array("b")
+        self.status_codes = array("b")
+        self.priority_codes = array("b")
+        self._extra_types = []
+
+    @classmethod
+    def from_orders(cls, orders: Iterable[Order]) -> "OrderBatch":
+        """Build a batch from order objects."""
+        batch = cls()
+        batch.extend(orders)
+        return batch
+
+    def type_code(self, order_type: str) -> int:
+        """Return the code of an order type, registering unknown types on the batch."""
+        code = _TYPE_CODES.get(order_type)
+        if code is None:
+            if order_type not in self._extra_types:
+                self._extra_types.append(order_type)
+            code = len(ORDER_TYPES) + self._extra_types.index(order_type)
+        return code
+
+    def append(self, order: Order) -> None:
+        self.ids.append(order.id)
+        self.amounts.append(order.amount)
+        self.is_special.append(1 if order.is_special else 0)
+        self.type_codes.append(self.type_code(order.type))
+        self.status_codes.append(_STATUS_CODES[order.status])
+        self.priority_codes.append(_PRIORITY_CODES[order.priority])
+
+    def extend(self, orders: Iterable[Order]) -> None:
+        for order in orders:
+            self.append(order)
+
+    @property
+    def type_names(self) -> List[str]:
+        """Order types in code order, including the types local to the batch."""
+        return list(ORDER_TYPES) + self._extra_types
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def order_type(self, index: int) -> str:
+        code = self.type_codes[index]
+        return ORDER_TYPES[code] if code < len(ORDER_TYPES) else self._extra_types[code - len(ORDER_TYPES)]
+
+    def status(self, index: int) -> str:
+        return ORDER_STATUSES[self.status_codes[index]]
+
+    def set_status(self, index: int, status: str) -> None:
+        self.status_codes[index] = _STATUS_CODES[status]
+
+    def priority(self, index: int) -> str:
+        return ORDER_PRIORITIES[self.priority_codes[index]]
+
+    def set_priority(self, index: int, priority: str) -> None:
+        self.priority_codes[index] = _PRIORITY_CODES[priority]
+
+    def __getitem__(self, index: int) -> Order:
+        """Materialize the order at ``index`` as an Order object."""
+        order = Order(
+            id=self.ids[index],
+            type=self.order_type(index),
+            amount=self.amounts[index],
+            is_special=bool(self.is_special[index]),
+        )
+        order.status = self.status(index)
+        order.priority = self.priority(index)
+        return order
+
+    def __iter__(self) -> Iterator[Order]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def to_orders(self) -> List[Order]:
+        return list(self)
@@ -5,6 +5,8 @@ from .base_model import BaseModel
 class Order(BaseModel):
     """Represents an order in the system."""
 
+    __slots__ = ("id", "type", "amount", "is_special", "status", "priority")
+
     def __init__(self, id: int, type: str, amount: float, is_special: bool):
         self.id = id
         self.type = type
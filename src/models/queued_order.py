@@ -0,0 +1,33 @@
+from .base_model import BaseModel
+from .order_model import Order
+
+
+class QueuedOrder(BaseModel):
+    """An order in an order queue, as handed out by a lease.
+
+    Attributes:
+            entry_id (int): ID of the queue entry
+            order (Order): The queued order
+            priority (str): OrderPriority the order was enqueued with
+            shard (int): Shard holding the entry
+            enqueued_at (float): Epoch time the order was enqueued at
+            attempts (int): Number of times the entry was leased, the current
+                    lease included
+            lease_id (str): ID of the lease holding the entry, None while it
+                    waits in the queue
+            leased_at (float): Epoch time of the lease, None while it waits
+    """
+
+    __slots__ = ("entry_id", "order", "priority", "shard", "enqueued_at", "attempts", "lease_id", "leased_at")
+
+    def __init__(
+        self, entry_id: int, order: Order, priority: str, shard: int, enqueued_at: float, attempts: int = 0
+    ):
+        self.entry_id = entry_id
+        self.order = order
+        self.priority = priority
+        self.shard = shard
+        self.enqueued_at = enqueued_at
+        self.attempts = attempts
+        self.lease_id = None
+        self.leased_at = None
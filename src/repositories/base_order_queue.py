@@ -0,0 +1,137 @@
+from abc import ABC, abstractmethod
+from typing import Dict, Iterable, List, Tuple
+
+from constants.constants import DEFAULT_QUEUE_SHARDS, DEFAULT_QUEUE_MAX_RETRY_DELAY, QUEUE_PRIORITY_RANKS
+from models.order_model import Order
+from models.queued_order import QueuedOrder
+
+
+class BaseOrderQueue(ABC):
+    """Abstract base class for priority-aware, sharded order queues.
+
+    Orders are spread over ``shards`` by ID and wait in their shard until a
+    worker leases them. A lease hands out the waiting orders with the lowest
+    priority rank first, and the oldest first within a rank. Leased orders
+    are acknowledged once processed, which removes them, or released back to
+    the queue, optionally not to be leased again before a backoff delay that
+    doubles with every attempt. A lease that is neither acknowledged nor
+    released before it expires is handed out again, so every order is
+    processed at least once even if its worker dies. Entries count the leases
+    they were handed out in, so that callers can move orders that keep
+    failing to the dead letters of the queue, where they are kept for
+    inspection.
+
+    Args:
+            shards (int): Number of shards
+            priority_ranks (Dict[str, int]): Rank of each OrderPriority;
+                    priorities sharing a rank are leased in enqueue order
+    """
+
+    def __init__(self, shards: int = DEFAULT_QUEUE_SHARDS, priority_ranks: Dict[str, int] = None) -> None:
+        if shards < 1:
+            raise ValueError("An order queue needs at least one shard")
+        self.shards = shards
+        self.priority_ranks = dict(priority_ranks or QUEUE_PRIORITY_RANKS)
+        self.ranks = sorted(set(self.priority_ranks.values()))
+
+    def shard_of(self, order: Order) -> int:
+        return order.id % self.shards
+
+    def rank_of(self, priority: str) -> int:
+        try:
+            return self.priority_ranks[priority]
+        except KeyError:
+            raise ValueError(f"Unknown priority {priority!r}, expected one of {sorted(self.priority_ranks)}")
+
+    def visible_at(self, entry: QueuedOrder, now: float, retry_delay: float) -> float:
+        """Return the epoch time a released entry may be leased again, backing off exponentially per attempt."""
+        if retry_delay <= 0:
+            return now
+        return now + min(retry_delay * 2 ** max(entry.attempts - 1, 0), DEFAULT_QUEUE_MAX_RETRY_DELAY)
+
+    def shard_order(self, shard: int) -> List[int]:
+        """Return every shard, starting with ``shard`` and going round from there."""
+        return [(shard + offset) % self.shards for offset in range(self.shards)]
+
+    @abstractmethod
+    def enqueue(self, entries: Iterable[Tuple[Order, str]]) -> int:
+        """Add ``(order, priority)`` pairs to the queue.
+
+        Returns:
+                int: Number of orders enqueued
+
+        Raises:
+                ValueError: If a priority has no rank
+        """
+        pass
+
+    @abstractmethod
+    def lease(self, shard: int, limit: int, lease_seconds: float) -> List[QueuedOrder]:
+        """Lease up to ``limit`` waiting orders for ``lease_seconds``.
+
+        Orders of the lowest rank are taken first from any shard, starting
+        with ``shard`` so that workers with different home shards rarely
+        contend. Expired leases are handed out again, and released orders
+        once their retry delay is over.
+
+        Args:
+                shard (int): Home shard of the worker
+                limit (int): Maximum number of orders leased
+                lease_seconds (float): Time after which unacknowledged orders
+                        are handed out again
+
+        Returns:
+                List[QueuedOrder]: The leased orders, empty when none are waiting
+        """
+        pass
+
+    @abstractmethod
+    def ack(self, entries: List[QueuedOrder]) -> int:
+        """Remove processed orders of a lease from the queue.
+
+        Entries whose lease expired and was handed out again are left alone.
+
+        Returns:
+                int: Number of orders removed
+        """
+        pass
+
+    @abstractmethod
+    def release(self, entries: List[QueuedOrder], retry_delay: float = 0.0) -> int:
+        """Hand leased orders back to the queue.
+
+        Entries whose lease expired and was handed out again are left alone.
+
+        Args:
+                entries (List[QueuedOrder]): Leased orders to release
+                retry_delay (float): Seconds before an order released after its
+                        first attempt may be leased again, doubled for every
+                        further attempt; released orders are leased again right
+                        away if 0
+
+        Returns:
+                int: Number of orders released
+        """
+        pass
+
+    @abstractmethod
+    def dead_letter(self, entries: List[QueuedOrder]) -> int:
+        """Move leased orders that can't be processed to the dead letters of the queue.
+
+        Orders are kept with the status they failed in. Entries whose lease
+        expired and was handed out again are left alone.
+
+        Returns:
+                int: Number of orders dead-lettered
+        """
+        pass
+
+    @abstractmethod
+    def dead_letters(self) -> List[QueuedOrder]:
+        """Return the dead-lettered orders, oldest entry first."""
+        pass
+
+    @abstractmethod
+    def __len__(self) -> int:
+        """Return the number of waiting, delayed and leased orders, dead letters excluded."""
+        pass
@@ -0,0 +1,46 @@
+from abc import ABC, abstractmethod
+from typing import List
+
+from models.order_model import Order
+
+
+class BaseOrderRepository(ABC):
+    """Abstract base class for order storage backends."""
+
+    @abstractmethod
+    def fetch_orders_page(self, user_id: int, after_id: int = None, limit: int = 1000) -> List[Order]:
+        """Fetch the next page of a user's orders, ordered by ID.
+
+        Pages are keyed on the last order ID seen rather than an offset, so
+        updates made while iterating don't shift later pages.
+
+        Args:
+                user_id (int): ID of the user
+                after_id (int): Only return orders with a greater ID, or all
+                        orders when None
+                limit (int): Maximum number of orders returned
+
+        Raises:
+                DatabaseException: If there's an error accessing the database
+        """
+        pass
+
+    @abstractmethod
+    def update_order(self, order: Order) -> bool:
+        """Persist the status and priority of a single order in its own transaction.
+
+        Raises:
+                DatabaseException: If there's an error updating the database
+        """
+        pass
+
+    @abstractmethod
+    def update_orders(self, orders: List[Order]) -> int:
+        """Persist the status and priority of several orders in one transaction.
+
+        Either every order of the call is written or none is.
+
+        Raises:
+                DatabaseException: If there's an error updating the database
+        """
+        pass
@@ -0,0 +1,143 @@
+import heapq
+import threading
+import time
+from collections import deque
+from itertools import count
+from typing import Dict, Iterable, List, Tuple
+
+from constants.constants import DEFAULT_QUEUE_SHARDS
+from models.order_model import Order
+from models.queued_order import QueuedOrder
+from .base_order_queue import BaseOrderQueue
+
+
+class InMemoryOrderQueue(BaseOrderQueue):
+    """Order queue kept in process memory, for workers on threads of one process.
+
+    Each shard has its own lock, a FIFO per priority rank, a heap of the
+    entries returned to it by visibility time and the leases it handed out,
+    so workers leasing from different shards don't contend.
+    """
+
+    def __init__(self, shards: int = DEFAULT_QUEUE_SHARDS, priority_ranks: Dict[str, int] = None) -> None:
+        super().__init__(shards, priority_ranks)
+        self._locks = [threading.Lock() for _ in range(shards)]
+        self._waiting = [{rank: deque() for rank in self.ranks} for _ in range(shards)]
+        # Leased entries by entry ID, and their expiry times in lease order
+        self._leased = [{} for _ in range(shards)]
+        self._expiries = [deque() for _ in range(shards)]
+        # Returned entries by the time they may be leased again
+        self._returned = [[] for _ in range(shards)]
+        self._dead_letters = []
+        self._dead_letters_lock = threading.Lock()
+        self._entry_ids = count(1)
+        self._lease_ids = count(1)
+
+    def enqueue(self, entries: Iterable[Tuple[Order, str]]) -> int:
+        enqueued = 0
+        for order, priority in entries:
+            rank = self.rank_of(priority)
+            shard = self.shard_of(order)
+            entry = QueuedOrder(next(self._entry_ids), order, priority, shard, time.time())
+            with self._locks[shard]:
+                self._waiting[shard][rank].append(entry)
+            enqueued += 1
+        return enqueued
+
+    def lease(self, shard: int, limit: int, lease_seconds: float) -> List[QueuedOrder]:
+        leased = []
+        lease_id = str(next(self._lease_ids))
+        now = time.time()
+        shards = self.shard_order(shard)
+
+        for rank in self.ranks:
+            for current in shards:
+                with self._locks[current]:
+                    self._reclaim_expired(current, now)
+                    self._restore_visible(current, now)
+                    waiting = self._waiting[current][rank]
+                    while waiting and len(leased) < limit:
+                        entry = waiting.popleft()
+                        entry.lease_id = lease_id
+                        entry.leased_at = now
+                        entry.attempts += 1
+                        self._leased[current][entry.entry_id] = entry
+                        self._expiries[current].append((now + lease_seconds, entry.entry_id, lease_id))
+                        leased.append(entry)
+                if len(leased) >= limit:
+                    return leased
+
+        return leased
+
+    def _reclaim_expired(self, shard: int, now: float) -> None:
+        """Return the entries of expired leases to their shard, with the shard lock held."""
+        expiries = self._expiries[shard]
+        leased = self._leased[shard]
+        while expiries and expiries[0][0] <= now:
+            _, entry_id, lease_id = expiries.popleft()
+            entry = leased.get(entry_id)
+            # Skip entries acknowledged, released or leased again since
+            if entry is not None and entry.lease_id == lease_id:
+                del leased[entry_id]
+                self._return_entry(entry, now)
+
+    def _return_entry(self, entry: QueuedOrder, visible_at: float) -> None:
+        """Keep an entry aside until ``visible_at``, with the shard lock held."""
+        # A new entry, so that the holder of the old lease can't acknowledge the next one
+        entry = QueuedOrder(
+            entry.entry_id, entry.order, entry.priority, entry.shard, entry.enqueued_at, entry.attempts
+        )
+        heapq.heappush(self._returned[entry.shard], (visible_at, entry.entry_id, entry))
+
+    def _restore_visible(self, shard: int, now: float) -> None:
+        """Put the returned entries visible at ``now`` back at the front of their shard, with the shard lock held."""
+        returned = self._returned[shard]
+        visible = []
+        while returned and returned[0][0] <= now:
+            visible.append(heapq.heappop(returned)[2])
+        # Oldest entries last, so that they end up first
+        for entry in sorted(visible, key=lambda entry: entry.entry_id, reverse=True):
+            self._waiting[shard][self.rank_of(entry.priority)].appendleft(entry)
+
+    def _take_leased(self, entries: List[QueuedOrder]) -> List[QueuedOrder]:
+        """Remove entries from the leases still holding them and return those entries."""
+        taken = []
+        for entry in entries:
+            with self._locks[entry.shard]:
+                current = self._leased[entry.shard].get(entry.entry_id)
+                if current is not None and current.lease_id == entry.lease_id:
+                    del self._leased[entry.shard][entry.entry_id]
+                    taken.append(current)
+        return taken
+
+    def ack(self, entries: List[QueuedOrder]) -> int:
+        return len(self._take_leased(entries))
+
+    def release(self, entries: List[QueuedOrder], retry_delay: float = 0.0) -> int:
+        taken = self._take_leased(entries)
+        now = time.time()
+        for entry in taken:
+            with self._locks[entry.shard]:
+                self._return_entry(entry, self.visible_at(entry, now, retry_delay))
+        return len(taken)
+
+    def dead_letter(self, entries: List[QueuedOrder]) -> int:
+        taken = self._take_leased(entries)
+        with self._dead_letters_lock:
+            self._dead_letters.extend(
+                QueuedOrder(entry.entry_id, entry.order, entry.priority, entry.shard, entry.enqueued_at, entry.attempts)
+                for entry in taken
+            )
+        return len(taken)
+
+    def dead_letters(self) -> List[QueuedOrder]:
+        with self._dead_letters_lock:
+            return sorted(self._dead_letters, key=lambda entry: entry.entry_id)
+
+    def __len__(self) -> int:
+        size = 0
+        for shard in range(self.shards):
+            with self._locks[shard]:
+                size += len(self._leased[shard]) + len(self._returned[shard])
+                size += sum(len(waiting) for waiting in self._waiting[shard].values())
+        return size
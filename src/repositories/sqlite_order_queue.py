@@ -0,0 +1,209 @@
+import sqlite3
+import threading
+import time
+import uuid
+from typing import Dict, Iterable, List, Tuple
+
+from constants.constants import DEFAULT_QUEUE_SHARDS
+from models.order_model import Order
+from models.queued_order import QueuedOrder
+from utils.exceptions.database_exception import DatabaseException
+from .base_order_queue import BaseOrderQueue
+
+
+class SQLiteOrderQueue(BaseOrderQueue):
+    """Order queue kept in a SQLite file, used as a local message broker stand-in.
+
+    Worker processes sharing the file lease from the same queue. A lease
+    claims its entries with a single ``UPDATE ... RETURNING`` statement, so
+    two workers never lease the same entry at once. Dead-lettered orders are
+    moved to the ``order_queue_dead_letters`` table.
+    """
+
+    CREATE_TABLE = """
+        CREATE TABLE IF NOT EXISTS order_queue (
+            entry_id INTEGER PRIMARY KEY AUTOINCREMENT,
+            shard INTEGER NOT NULL,
+            priority_rank INTEGER NOT NULL,
+            order_id INTEGER NOT NULL,
+            type TEXT NOT NULL,
+            amount REAL NOT NULL,
+            is_special INTEGER NOT NULL,
+            status TEXT NOT NULL,
+            order_priority TEXT NOT NULL,
+            queue_priority TEXT NOT NULL,
+            enqueued_at REAL NOT NULL,
+            attempts INTEGER NOT NULL DEFAULT 0,
+            visible_at REAL NOT NULL DEFAULT 0,
+            lease_id TEXT,
+            leased_until REAL
+        )
+    """
+    CREATE_DEAD_LETTER_TABLE = """
+        CREATE TABLE IF NOT EXISTS order_queue_dead_letters (
+            entry_id INTEGER PRIMARY KEY,
+            shard INTEGER NOT NULL,
+            order_id INTEGER NOT NULL,
+            type TEXT NOT NULL,
+            amount REAL NOT NULL,
+            is_special INTEGER NOT NULL,
+            status TEXT NOT NULL,
+            order_priority TEXT NOT NULL,
+            queue_priority TEXT NOT NULL,
+            enqueued_at REAL NOT NULL,
+            attempts INTEGER NOT NULL,
+            dead_lettered_at REAL NOT NULL
+        )
+    """
+    CREATE_INDEX = "CREATE INDEX IF NOT EXISTS order_queue_lease ON order_queue (shard, priority_rank, entry_id)"
+    INSERT_ENTRY = (
+        "INSERT INTO order_queue "
+        "(shard, priority_rank, order_id, type, amount, is_special, status, order_priority, queue_priority, "
+        "enqueued_at) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+    )
+    LEASE_ENTRIES = """
+        UPDATE order_queue SET lease_id = ?, leased_until = ?, attempts = attempts + 1
+        WHERE entry_id IN (
+            SELECT entry_id FROM order_queue
+            WHERE shard = ? AND priority_rank = ? AND (leased_until IS NULL OR leased_until <= ?) AND visible_at <= ?
+            ORDER BY entry_id LIMIT ?
+        )
+        RETURNING entry_id, order_id, type, amount, is_special, status, order_priority, queue_priority, enqueued_at,
+            attempts
+    """
+    DELETE_ENTRY = "DELETE FROM order_queue WHERE entry_id = ? AND lease_id = ?"
+    RELEASE_ENTRY = (
+        "UPDATE order_queue SET lease_id = NULL, leased_until = NULL, visible_at = ? "
+        "WHERE entry_id = ? AND lease_id = ?"
+    )
+    INSERT_DEAD_LETTER = (
+        "INSERT INTO order_queue_dead_letters "
+        "(entry_id, shard, order_id, type, amount, is_special, status, order_priority, queue_priority, enqueued_at, "
+        "attempts, dead_lettered_at) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+    )
+    SELECT_DEAD_LETTERS = (
+        "SELECT entry_id, order_id, type, amount, is_special, status, order_priority, queue_priority, enqueued_at, "
+        "attempts, shard FROM order_queue_dead_letters ORDER BY entry_id"
+    )
+
+    def __init__(
+        self, database: str = ":memory:", shards: int = DEFAULT_QUEUE_SHARDS, priority_ranks: Dict[str, int] = None
+    ) -> None:
+        super().__init__(shards, priority_ranks)
+        self.connection = sqlite3.connect(database, check_same_thread=False)
+        # sqlite3 connections are not safe to share across threads without a lock
+        self._lock = threading.Lock()
+        self._execute(lambda cursor: cursor.execute(self.CREATE_TABLE))
+        self._execute(lambda cursor: cursor.execute(self.CREATE_INDEX))
+        self._execute(lambda cursor: cursor.execute(self.CREATE_DEAD_LETTER_TABLE))
+
+    def _execute(self, operation):
+        """Run ``operation`` with a cursor inside a single transaction."""
+        with self._lock:
+            try:
+                with self.connection:
+                    return operation(self.connection.cursor())
+            except sqlite3.Error as e:
+                raise DatabaseException(f"SQLite operation failed: {e}")
+
+    def enqueue(self, entries: Iterable[Tuple[Order, str]]) -> int:
+        now = time.time()
+        rows = [
+            (
+                self.shard_of(order),
+                self.rank_of(priority),
+                order.id,
+                order.type,
+                order.amount,
+                int(order.is_special),
+                order.status,
+                order.priority,
+                priority,
+                now,
+            )
+            for order, priority in entries
+        ]
+        return self._execute(lambda cursor: cursor.executemany(self.INSERT_ENTRY, rows).rowcount)
+
+    def lease(self, shard: int, limit: int, lease_seconds: float) -> List[QueuedOrder]:
+        leased = []
+        lease_id = uuid.uuid4().hex
+        now = time.time()
+        shards = self.shard_order(shard)
+
+        for rank in self.ranks:
+            for current in shards:
+                parameters = (lease_id, now + lease_seconds, current, rank, now, now, limit - len(leased))
+                rows = self._execute(lambda cursor: cursor.execute(self.LEASE_ENTRIES, parameters).fetchall())
+                # RETURNING doesn't keep the order of the subquery
+                for row in sorted(rows):
+                    leased.append(self._to_entry(row, current, lease_id, now))
+                if len(leased) >= limit:
+                    return leased
+
+        return leased
+
+    @staticmethod
+    def _to_entry(row: tuple, shard: int, lease_id: str = None, leased_at: float = None) -> QueuedOrder:
+        entry_id, order_id, order_type, amount, is_special, status, order_priority, *queue_fields = row
+        priority, enqueued_at, attempts = queue_fields
+        order = Order(id=order_id, type=order_type, amount=amount, is_special=bool(is_special))
+        order.status = status
+        order.priority = order_priority
+        entry = QueuedOrder(entry_id, order, priority, shard, enqueued_at, attempts)
+        entry.lease_id = lease_id
+        entry.leased_at = leased_at
+        return entry
+
+    def ack(self, entries: List[QueuedOrder]) -> int:
+        rows = [(entry.entry_id, entry.lease_id) for entry in entries]
+        return self._execute(lambda cursor: cursor.executemany(self.DELETE_ENTRY, rows).rowcount)
+
+    def release(self, entries: List[QueuedOrder], retry_delay: float = 0.0) -> int:
+        now = time.time()
+        rows = [(self.visible_at(entry, now, retry_delay), entry.entry_id, entry.lease_id) for entry in entries]
+        return self._execute(lambda cursor: cursor.executemany(self.RELEASE_ENTRY, rows).rowcount)
+
+    def dead_letter(self, entries: List[QueuedOrder]) -> int:
+        now = time.time()
+
+        def move(cursor):
+            moved = 0
+            for entry in entries:
+                # Entries whose lease was handed out again are no longer deleted, and stay in the queue
+                if not cursor.execute(self.DELETE_ENTRY, (entry.entry_id, entry.lease_id)).rowcount:
+                    continue
+                order = entry.order
+                cursor.execute(
+                    self.INSERT_DEAD_LETTER,
+                    (
+                        entry.entry_id,
+                        entry.shard,
+                        order.id,
+                        order.type,
+                        order.amount,
+                        int(order.is_special),
+                        order.status,
+                        order.priority,
+                        entry.priority,
+                        entry.enqueued_at,
+                        entry.attempts,
+                        now,
+                    ),
+                )
+                moved += 1
+            return moved
+
+        return self._execute(move)
+
+    def dead_letters(self) -> List[QueuedOrder]:
+        rows = self._execute(lambda cursor: cursor.execute(self.SELECT_DEAD_LETTERS).fetchall())
+        return [self._to_entry(row[:-1], row[-1]) for row in rows]
+
+    def __len__(self) -> int:
+        return self._execute(lambda cursor: cursor.execute("SELECT COUNT(*) FROM order_queue").fetchone()[0])
+
+    def close(self) -> None:
+        self.connection.close()
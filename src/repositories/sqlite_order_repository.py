@@ -0,0 +1,83 @@
+import sqlite3
+import threading
+from typing import List
+
+from models.order_model import Order
+from utils.exceptions.database_exception import DatabaseException
+from .base_order_repository import BaseOrderRepository
+
+
+class SQLiteOrderRepository(BaseOrderRepository):
+    """Order repository backed by SQLite, used as a local database stand-in."""
+
+    CREATE_TABLE = """
+        CREATE TABLE IF NOT EXISTS orders (
+            id INTEGER PRIMARY KEY,
+            user_id INTEGER,
+            type TEXT NOT NULL,
+            amount REAL NOT NULL,
+            is_special INTEGER NOT NULL,
+            status TEXT NOT NULL,
+            priority TEXT NOT NULL
+        )
+    """
+    INSERT_ORDER = (
+        "INSERT OR REPLACE INTO orders (id, user_id, type, amount, is_special, status, priority) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?)"
+    )
+    UPDATE_ORDER = "UPDATE orders SET status = ?, priority = ? WHERE id = ?"
+    SELECT_ORDERS_PAGE = (
+        "SELECT id, type, amount, is_special, status, priority FROM orders "
+        "WHERE user_id = ? AND id > ? ORDER BY id LIMIT ?"
+    )
+
+    def __init__(self, database: str = ":memory:") -> None:
+        self.connection = sqlite3.connect(database, check_same_thread=False)
+        # sqlite3 connections are not safe to share across threads without a lock
+        self._lock = threading.Lock()
+        self._execute(lambda cursor: cursor.execute(self.CREATE_TABLE))
+
+    def _execute(self, operation):
+        """Run ``operation`` with a cursor inside a single transaction."""
+        with self._lock:
+            try:
+                with self.connection:
+                    return operation(self.connection.cursor())
+            except sqlite3.Error as e:
+                raise DatabaseException(f"SQLite operation failed: {e}")
+
+    def insert_orders(self, orders: List[Order], user_id: int = None) -> int:
+        """Insert or replace orders, e.g. to seed the stand-in database."""
+        rows = [
+            (order.id, user_id, order.type, order.amount, int(order.is_special), order.status, order.priority)
+            for order in orders
+        ]
+        return self._execute(lambda cursor: cursor.executemany(self.INSERT_ORDER, rows).rowcount)
+
+    def fetch_orders_page(self, user_id: int, after_id: int = None, limit: int = 1000) -> List[Order]:
+        after_id = -(2**63) if after_id is None else after_id
+        rows = self._execute(
+            lambda cursor: cursor.execute(self.SELECT_ORDERS_PAGE, (user_id, after_id, limit)).fetchall()
+        )
+
+        orders = []
+        for id, type, amount, is_special, status, priority in rows:
+            order = Order(id=id, type=type, amount=amount, is_special=bool(is_special))
+            order.status = status
+            order.priority = priority
+            orders.append(order)
+
+        return orders
+
+    def update_order(self, order: Order) -> bool:
+        rowcount = self._execute(
+            lambda cursor: cursor.execute(self.UPDATE_ORDER, (order.status, order.priority, order.id)).rowcount
+        )
+        return rowcount == 1
+
+    def update_orders(self, orders: List[Order]) -> int:
+        rows = [(order.status, order.priority, order.id) for order in orders]
+        return self._execute(lambda cursor: cursor.executemany(self.UPDATE_ORDER, rows).rowcount)
+
+    def close(self) -> None:
+        self.connection.close()
@@ -0,0 +1,102 @@
+import hashlib
+import sqlite3
+import threading
+from typing import Dict, Iterable, List, Tuple
+
+from constants.constants import DEFAULT_STATE_STORE_CHUNK_SIZE
+from models.order_model import Order
+from utils.exceptions.database_exception import DatabaseException
+
+
+class SQLiteOrderStateStore:
+    """Fingerprints of already processed orders, kept in a local SQLite file.
+
+    A fingerprint covers the inputs of processing, i.e. the type, amount and
+    special flag of an order, so an order whose fingerprint is unchanged
+    would be processed to the same result again and can be skipped.
+
+    The store also keeps the checkpoint of each run, the offset in the run's
+    input up to which every order is committed, so that a rerun can resume
+    after it.
+    """
+
+    CREATE_TABLE = """
+        CREATE TABLE IF NOT EXISTS order_fingerprints (
+            order_id INTEGER PRIMARY KEY,
+            fingerprint TEXT NOT NULL,
+            status TEXT NOT NULL
+        )
+    """
+    CREATE_CHECKPOINT_TABLE = """
+        CREATE TABLE IF NOT EXISTS run_checkpoints (
+            run_id TEXT PRIMARY KEY,
+            order_offset INTEGER NOT NULL
+        )
+    """
+    UPSERT_FINGERPRINT = "INSERT OR REPLACE INTO order_fingerprints (order_id, fingerprint, status) VALUES (?, ?, ?)"
+    DELETE_FINGERPRINT = "DELETE FROM order_fingerprints WHERE order_id = ?"
+    SELECT_FINGERPRINTS = "SELECT order_id, fingerprint FROM order_fingerprints WHERE order_id IN ({})"
+    UPSERT_CHECKPOINT = "INSERT OR REPLACE INTO run_checkpoints (run_id, order_offset) VALUES (?, ?)"
+    SELECT_CHECKPOINT = "SELECT order_offset FROM run_checkpoints WHERE run_id = ?"
+
+    def __init__(self, database: str = ":memory:") -> None:
+        self.connection = sqlite3.connect(database, check_same_thread=False)
+        # sqlite3 connections are not safe to share across threads without a lock
+        self._lock = threading.Lock()
+        self._execute(lambda cursor: cursor.execute(self.CREATE_TABLE))
+        self._execute(lambda cursor: cursor.execute(self.CREATE_CHECKPOINT_TABLE))
+
+    @staticmethod
+    def fingerprint(order: Order) -> str:
+        """Return the content fingerprint of an order's processing inputs."""
+        content = f"{order.type}\x1f{float(order.amount)!r}\x1f{bool(order.is_special)}"
+        return hashlib.blake2b(content.encode(), digest_size=16).hexdigest()
+
+    def _execute(self, operation):
+        """Run ``operation`` with a cursor inside a single transaction."""
+        with self._lock:
+            try:
+                with self.connection:
+                    return operation(self.connection.cursor())
+            except sqlite3.Error as e:
+                raise DatabaseException(f"SQLite operation failed: {e}")
+
+    def get_fingerprints(self, order_ids: List[int]) -> Dict[int, str]:
+        """Return the stored fingerprint of each given order that has one."""
+        fingerprints = {}
+        # Stay under SQLite's limit on the number of bound parameters
+        for start in range(0, len(order_ids), DEFAULT_STATE_STORE_CHUNK_SIZE):
+            chunk = order_ids[start : start + DEFAULT_STATE_STORE_CHUNK_SIZE]
+            query = self.SELECT_FINGERPRINTS.format(", ".join("?" * len(chunk)))
+            fingerprints.update(self._execute(lambda cursor: cursor.execute(query, chunk).fetchall()))
+        return fingerprints
+
+    def save_fingerprints(self, entries: Iterable[Tuple[int, str, str]]) -> int:
+        """Store ``(order_id, fingerprint, status)`` entries, replacing older ones."""
+        rows = list(entries)
+        return self._execute(lambda cursor: cursor.executemany(self.UPSERT_FINGERPRINT, rows).rowcount)
+
+    def forget_orders(self, order_ids: List[int]) -> None:
+        """Drop the fingerprints of the given orders, e.g. after they failed to process."""
+        rows = [(order_id,) for order_id in order_ids]
+        self._execute(lambda cursor: cursor.executemany(self.DELETE_FINGERPRINT, rows))
+
+    def clear(self) -> None:
+        """Forget every fingerprint, so that all orders are processed again."""
+        self._execute(lambda cursor: cursor.execute("DELETE FROM order_fingerprints"))
+
+    def get_checkpoint(self, run_id: str) -> int:
+        """Return the checkpoint offset of a run, 0 when it has none."""
+        row = self._execute(lambda cursor: cursor.execute(self.SELECT_CHECKPOINT, (run_id,)).fetchone())
+        return row[0] if row else 0
+
+    def save_checkpoint(self, run_id: str, offset: int) -> None:
+        """Store the offset up to which every input order of a run is committed."""
+        self._execute(lambda cursor: cursor.execute(self.UPSERT_CHECKPOINT, (run_id, offset)))
+
+    def clear_checkpoint(self, run_id: str) -> None:
+        """Drop the checkpoint of a run, so that a rerun starts from its first order."""
+        self._execute(lambda cursor: cursor.execute("DELETE FROM run_checkpoints WHERE run_id = ?", (run_id,)))
+
+    def close(self) -> None:
+        self.connection.close()
@@ -1,9 +1,33 @@
 from abc import ABC, abstractmethod
+from typing import Dict, List
 
 from responses.api_response import APIResponse
+from utils.exceptions.api_exception import APIException
 
 
 class BaseAPIClient(ABC):
     @abstractmethod
     def call_api(self, *args, **kwargs) -> APIResponse:
         pass
+
+    def call_api_batch(self, ids: List[int]) -> Dict[int, APIResponse]:
+        """Call the API for several ids at once.
+
+        Clients backed by a bulk endpoint should override this. The default
+        implementation falls back to one ``call_api`` per id and leaves out
+        the ids whose call raised an APIException.
+
+        Args:
+                ids (List[int]): IDs to be sent to the API
+
+        Returns:
+                Dict[int, APIResponse]: API responses keyed by id
+        """
+        responses = {}
+        for id_ in ids:
+            try:
+                responses[id_] = self.call_api(id_)
+            except APIException:
+                continue
+
+        return responses
@@ -0,0 +1,51 @@
+import asyncio
+from abc import ABC, abstractmethod
+from typing import Dict, List
+
+from responses.api_response import APIResponse
+from utils.exceptions.api_exception import APIException
+from .base_api_client import BaseAPIClient
+
+
+class BaseAsyncAPIClient(ABC):
+    """Asyncio counterpart of BaseAPIClient."""
+
+    @abstractmethod
+    async def call_api(self, *args, **kwargs) -> APIResponse:
+        pass
+
+    async def call_api_batch(self, ids: List[int]) -> Dict[int, APIResponse]:
+        """Call the API for several ids at once.
+
+        Clients backed by a bulk endpoint should override this. The default
+        implementation awaits one ``call_api`` per id concurrently and
+        leaves out the ids whose call raised an APIException.
+
+        Args:
+                ids (List[int]): IDs to be sent to the API
+
+        Returns:
+                Dict[int, APIResponse]: API responses keyed by id
+        """
+        results = await asyncio.gather(*(self.call_api(id_) for id_ in ids), return_exceptions=True)
+        responses = {}
+        for id_, result in zip(ids, results):
+            if isinstance(result, APIException):
+                continue
+            if isinstance(result, BaseException):
+                raise result
+            responses[id_] = result
+        return responses
+
+
+class ThreadedAsyncAPIClient(BaseAsyncAPIClient):
+    """Async client running the calls of a blocking BaseAPIClient in worker threads."""
+
+    def __init__(self, client: BaseAPIClient) -> None:
+        self.client = client
+
+    async def call_api(self, *args, **kwargs) -> APIResponse:
+        return await asyncio.to_thread(self.client.call_api, *args, **kwargs)
+
+    async def call_api_batch(self, ids: List[int]) -> Dict[int, APIResponse]:
+        return await asyncio.to_thread(self.client.call_api_batch, ids)
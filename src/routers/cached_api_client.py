@@ -0,0 +1,129 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, List
+
+from constants.constants import (
+    APIStatus,
+    DEFAULT_API_CACHE_SIZE,
+    DEFAULT_API_CACHE_TTL,
+    DEFAULT_API_NEGATIVE_CACHE_TTL,
+)
+from responses.api_response import APIResponse
+from .base_api_client import BaseAPIClient
+
+
+class CachedAPIClient(BaseAPIClient):
+    """Caching layer in front of another API client.
+
+    Responses are kept in a bounded LRU cache keyed by ID. Successful
+    responses live for ``ttl`` seconds; FAILURE and ERROR responses are
+    negatively cached for ``negative_ttl`` seconds, or not cached at all
+    when it is 0, so that a transient error isn't replayed for long.
+    APIExceptions are never cached.
+
+    Attributes:
+            hits (int): Number of calls answered from the cache
+            misses (int): Number of calls forwarded to the wrapped client
+            evictions (int): Number of entries dropped to respect ``max_size``
+    """
+
+    def __init__(
+        self,
+        client: BaseAPIClient,
+        max_size: int = DEFAULT_API_CACHE_SIZE,
+        ttl: float = DEFAULT_API_CACHE_TTL,
+        negative_ttl: float = DEFAULT_API_NEGATIVE_CACHE_TTL,
+        clock=time.monotonic,
+    ) -> None:
+        self.client = client
+        self.max_size = max_size
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.clock = clock
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _get(self, key: int) -> APIResponse:
+        """Return the cached response for ``key``, or None on a miss."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, response = entry
+                if expires_at > self.clock():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return response
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+    def _put(self, key: int, response: APIResponse) -> None:
+        ttl = self.ttl if response.status == APIStatus.SUCCESS else self.negative_ttl
+        if ttl <= 0:
+            return
+
+        with self._lock:
+            self._entries[key] = (self.clock() + ttl, response)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def call_api(self, order_id: int) -> APIResponse:
+        response = self._get(order_id)
+        if response is None:
+            response = self.client.call_api(order_id)
+            self._put(order_id, response)
+        return response
+
+    def call_api_batch(self, ids: List[int]) -> Dict[int, APIResponse]:
+        """Answer cached IDs directly and forward only the misses in one batch call."""
+        responses = {}
+        missing = []
+        for id_ in ids:
+            response = self._get(id_)
+            if response is None:
+                missing.append(id_)
+            else:
+                responses[id_] = response
+
+        if missing:
+            fetched = self.client.call_api_batch(missing)
+            for id_, response in fetched.items():
+                self._put(id_, response)
+            responses.update(fetched)
+
+        return responses
+
+    def invalidate(self, order_id: int = None) -> None:
+        """Drop the cached response of one ID, or of every ID when None."""
+        with self._lock:
+            if order_id is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(order_id, None)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "size": len(self._entries),
+            }
+
+    def close(self) -> None:
+        """Close the wrapped client, if it supports it."""
+        close = getattr(self.client, "close", None)
+        if close is not None:
+            close()
+
+    def __enter__(self) -> "CachedAPIClient":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -0,0 +1,63 @@
+import threading
+import time
+
+from constants.constants import DEFAULT_CIRCUIT_FAILURE_THRESHOLD, DEFAULT_CIRCUIT_RECOVERY_TIME
+
+
+class CircuitBreaker:
+    """Circuit breaker tracking consecutive failures of a remote dependency.
+
+    The breaker opens after ``failure_threshold`` consecutive failures and
+    rejects calls until ``recovery_time`` seconds have passed. It then lets a
+    single trial call through: a success closes it again, a failure reopens it.
+    A trial that reports neither within ``trial_timeout`` seconds, e.g. because
+    its caller died, is given up and the next call becomes the trial.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        failure_threshold: int = DEFAULT_CIRCUIT_FAILURE_THRESHOLD,
+        recovery_time: float = DEFAULT_CIRCUIT_RECOVERY_TIME,
+        clock=time.monotonic,
+        trial_timeout: float = None,
+    ) -> None:
+        self.failure_threshold = failure_threshold
+        self.recovery_time = recovery_time
+        self.trial_timeout = recovery_time if trial_timeout is None else trial_timeout
+        self.clock = clock
+        self.state = self.CLOSED
+        self.failures = 0
+        self._opened_at = 0.0
+        self._trial_started_at = 0.0
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        """Return True if a call may go through now."""
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+            now = self.clock()
+            if (self.state == self.OPEN and now - self._opened_at >= self.recovery_time) or (
+                self.state == self.HALF_OPEN and now - self._trial_started_at >= self.trial_timeout
+            ):
+                # Let exactly one trial call through
+                self.state = self.HALF_OPEN
+                self._trial_started_at = now
+                return True
+            return False
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.state = self.CLOSED
+            self.failures = 0
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self.failures += 1
+            if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+                self.state = self.OPEN
+                self._opened_at = self.clock()
@@ -0,0 +1,68 @@
+import http.client
+import queue
+import threading
+from contextlib import contextmanager
+
+
+class HTTPConnectionPool:
+    """Bounded pool of keep-alive HTTP connections to a single host.
+
+    Connections are created lazily, returned to the pool after each request
+    and reused by later requests. At most ``max_size`` connections are open
+    at the same time; callers block in ``acquire`` while the pool is exhausted.
+    """
+
+    def __init__(
+        self, host: str, port: int = None, max_size: int = 10, timeout: float = None, secure: bool = False
+    ) -> None:
+        self.host = host
+        self.port = port
+        self.max_size = max_size
+        self.timeout = timeout
+        self.secure = secure
+        self._idle = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(max_size)
+        self._closed = False
+
+    def _new_connection(self) -> http.client.HTTPConnection:
+        connection_class = http.client.HTTPSConnection if self.secure else http.client.HTTPConnection
+        return connection_class(self.host, self.port, timeout=self.timeout)
+
+    def acquire(self) -> http.client.HTTPConnection:
+        """Take an idle connection from the pool, or open a new one if none is idle."""
+        if self._closed:
+            raise RuntimeError("Connection pool is closed")
+
+        self._slots.acquire()
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            return self._new_connection()
+
+    def release(self, connection: http.client.HTTPConnection, discard: bool = False) -> None:
+        """Give a connection back to the pool, closing it if it can't be reused."""
+        if discard or self._closed:
+            connection.close()
+        else:
+            self._idle.put(connection)
+        self._slots.release()
+
+    @contextmanager
+    def connection(self):
+        """Context manager that acquires a connection and releases it afterwards."""
+        connection = self.acquire()
+        try:
+            yield connection
+        except Exception:
+            self.release(connection, discard=True)
+            raise
+        self.release(connection)
+
+    def close(self) -> None:
+        """Close every idle connection and refuse new acquisitions."""
+        self._closed = True
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                break
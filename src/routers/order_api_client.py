@@ -1,9 +1,153 @@
+import http.client
+import json
+import os
+import threading
+import weakref
+from typing import Any, Dict, List
+from urllib.parse import urlsplit
+
+from constants.constants import ORDER_API_BASE_URL, DEFAULT_API_POOL_SIZE, DEFAULT_API_TIMEOUT
 from responses.api_response import APIResponse
+from utils.exceptions.api_exception import APIException
 from .base_api_client import BaseAPIClient
+from .connection_pool import HTTPConnectionPool
+
+# Clients with an open pool, so that forked worker processes don't reuse the parent's sockets
+_open_clients = weakref.WeakSet()
+
+
+def _drop_pools_after_fork() -> None:
+    for client in list(_open_clients):
+        client._pool = None
+        client._lock = threading.Lock()
+    _open_clients.clear()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_drop_pools_after_fork)
 
 
 class OrderAPIClient(BaseAPIClient):
-    """Client for order-related API calls."""
+    """Client for order-related API calls.
+
+    The client keeps a pool of keep-alive connections that is opened on the
+    first call and shared by every call made through the same instance, so it
+    is meant to be long-lived and shared across orders. Use it as a context
+    manager, or call ``close`` when done, to release the connections.
+    """
+
+    def __init__(
+        self,
+        base_url: str = ORDER_API_BASE_URL,
+        pool_size: int = DEFAULT_API_POOL_SIZE,
+        timeout: float = DEFAULT_API_TIMEOUT,
+    ) -> None:
+        self.base_url = base_url
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self._pool = None
+        self._lock = threading.Lock()
+
+    def open(self) -> "OrderAPIClient":
+        """Create the connection pool. Calling it on an open client is a no-op."""
+        with self._lock:
+            if self._pool is None:
+                url = urlsplit(self.base_url)
+                self._base_path = url.path.rstrip("/")
+                self._pool = HTTPConnectionPool(
+                    url.hostname,
+                    url.port,
+                    max_size=self.pool_size,
+                    timeout=self.timeout,
+                    secure=url.scheme == "https",
+                )
+                _open_clients.add(self)
+        return self
+
+    def close(self) -> None:
+        """Close the connection pool. The client reopens it on the next call."""
+        with self._lock:
+            if self._pool is not None:
+                self._pool.close()
+                self._pool = None
+                _open_clients.discard(self)
+
+    def __enter__(self) -> "OrderAPIClient":
+        return self.open()
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _request(self, method: str, path: str, body: Any = None) -> Any:
+        """Send a request over a pooled connection and decode the JSON response.
+
+        A request that fails on a reused connection is retried once on a fresh
+        one, since the server may have closed the idle keep-alive connection.
+
+        Raises:
+                APIException: If the request fails or the response is not valid
+        """
+        pool = self._pool or self.open()._pool
+        payload = json.dumps(body).encode() if body is not None else None
+        headers = {"Content-Type": "application/json"} if payload is not None else {}
+
+        for attempt in range(2):
+            connection = pool.acquire()
+            reused = connection.sock is not None
+            try:
+                connection.request(method, self._base_path + path, body=payload, headers=headers)
+                response = connection.getresponse()
+                content = response.read()
+            except (http.client.HTTPException, OSError) as e:
+                pool.release(connection, discard=True)
+                if reused and attempt == 0:
+                    continue
+                raise APIException(f"Failed to call {method} {path}: {e}")
+
+            pool.release(connection, discard=response.will_close)
+            break
+
+        if response.status != 200:
+            raise APIException(f"Unexpected HTTP status {response.status} for {method} {path}")
+
+        try:
+            return json.loads(content)
+        except ValueError as e:
+            raise APIException(f"Invalid response for {method} {path}: {e}")
+
+    @staticmethod
+    def _to_api_response(result: Any) -> APIResponse:
+        try:
+            return APIResponse(status=result["status"], data=result.get("data"))
+        except (KeyError, TypeError, AttributeError) as e:
+            raise APIException(f"Malformed API result {result!r}: {e}")
 
     def call_api(self, order_id: int) -> APIResponse:
-        pass
+        return self._to_api_response(self._request("GET", f"/orders/{order_id}"))
+
+    def call_api_batch(self, order_ids: List[int]) -> Dict[int, APIResponse]:
+        """Call the bulk order endpoint for several orders in one request.
+
+        Args:
+                order_ids (List[int]): IDs of the orders
+
+        Returns:
+                Dict[int, APIResponse]: API responses keyed by order ID. Orders
+                        missing from the result failed inside the batch.
+
+        Raises:
+                APIException: If the whole batch request fails
+        """
+        content = self._request("POST", "/orders/batch", {"order_ids": list(order_ids)})
+        if not isinstance(content, dict):
+            raise APIException(f"Malformed batch response {content!r}")
+
+        responses = {}
+        for order_id, result in content.get("results", {}).items():
+            try:
+                responses[int(order_id)] = self._to_api_response(result)
+            except APIException:
+                # Leaving the order out marks only that order as failed
+                continue
+
+        return responses
@@ -0,0 +1,97 @@
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Dict, List
+
+from constants.constants import DEFAULT_API_RETRIES, DEFAULT_API_BACKOFF, DEFAULT_API_MAX_BACKOFF
+from responses.api_response import APIResponse
+from utils.exceptions.api_exception import APIException
+from utils.exceptions.circuit_open_exception import CircuitOpenException
+from .base_api_client import BaseAPIClient
+from .circuit_breaker import CircuitBreaker
+
+
+class ResilientAPIClient(BaseAPIClient):
+    """API client wrapper adding per-call timeouts, retries and a circuit breaker.
+
+    Each attempt is bounded by ``timeout`` seconds. Attempts failing with an
+    APIException are retried up to ``retries`` times, sleeping a random delay
+    of at most ``backoff * 2 ** attempt`` (capped by ``max_backoff``) between
+    them. Every failed attempt, whatever it raised, counts towards the
+    circuit breaker; while it is open, calls fail immediately with a CircuitOpenException without
+    reaching the wrapped client.
+    """
+
+    def __init__(
+        self,
+        client: BaseAPIClient,
+        timeout: float = None,
+        retries: int = DEFAULT_API_RETRIES,
+        backoff: float = DEFAULT_API_BACKOFF,
+        max_backoff: float = DEFAULT_API_MAX_BACKOFF,
+        circuit_breaker: CircuitBreaker = None,
+        max_concurrency: int = 32,
+        sleep=time.sleep,
+    ) -> None:
+        self.client = client
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.circuit_breaker = circuit_breaker or CircuitBreaker()
+        self.sleep = sleep
+        # Timed calls run on this pool so that the caller can stop waiting on a hung call
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrency) if timeout else None
+
+    def _attempt(self, func, *args):
+        if self._executor is None:
+            return func(*args)
+
+        future = self._executor.submit(func, *args)
+        try:
+            return future.result(timeout=self.timeout)
+        except FutureTimeoutError:
+            future.cancel()
+            raise APIException(f"API call timed out after {self.timeout}s")
+
+    def _call(self, func, *args):
+        for attempt in range(self.retries + 1):
+            if not self.circuit_breaker.allow():
+                raise CircuitOpenException("Circuit breaker is open, API call rejected")
+
+            try:
+                result = self._attempt(func, *args)
+            except APIException:
+                self.circuit_breaker.record_failure()
+                if attempt == self.retries:
+                    raise
+                self.sleep(random.uniform(0, min(self.max_backoff, self.backoff * 2**attempt)))
+                continue
+            except BaseException:
+                # Not retried, but still a failed call, which must end a half-open trial
+                self.circuit_breaker.record_failure()
+                raise
+
+            self.circuit_breaker.record_success()
+            return result
+
+    def call_api(self, order_id: int) -> APIResponse:
+        return self._call(self.client.call_api, order_id)
+
+    def call_api_batch(self, ids: List[int]) -> Dict[int, APIResponse]:
+        return self._call(self.client.call_api_batch, ids)
+
+    def close(self) -> None:
+        """Stop the timeout pool and close the wrapped client, if it supports it."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+        close = getattr(self.client, "close", None)
+        if close is not None:
+            close()
+
+    def __enter__(self) -> "ResilientAPIClient":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -0,0 +1,160 @@
+import asyncio
+import time
+import uuid
+from typing import Iterable
+
+from constants.constants import OrderStatus, OrderHandler, DEFAULT_ASYNC_CONCURRENCY
+from models.order_model import Order
+from routers.base_async_api_client import BaseAsyncAPIClient, ThreadedAsyncAPIClient
+from utils.exceptions.api_exception import APIException
+from utils.exceptions.database_exception import DatabaseException
+from utils.instrumentation.base_instrumentation import Stage
+from .order_service import OrderService
+
+
+class AsyncOrderService:
+    """Asyncio variant of OrderService for I/O-bound workloads.
+
+    Up to ``max_concurrency`` orders are in flight at once, each going
+    through the same steps as in ``OrderService.process_orders``: the
+    handler of its type, then its priority and database update. Type B API
+    calls go through ``api_client``, an async client. Database and export
+    calls have no async drivers here, so they run in worker threads.
+
+    Statuses and priorities are decided by ``service``, so the rule table,
+    repository, exporter format and instrumentation configured on
+    OrderService apply to both variants.
+    """
+
+    service = OrderService
+
+    # Async client for Type B calls. When None, the calls of the sync
+    # service's API client are run in worker threads.
+    api_client: BaseAsyncAPIClient = None
+
+    max_concurrency: int = DEFAULT_ASYNC_CONCURRENCY
+
+    @classmethod
+    def get_api_client(cls) -> BaseAsyncAPIClient:
+        """Return the async API client, wrapping the sync service's one on first use."""
+        if cls.api_client is None:
+            cls.api_client = ThreadedAsyncAPIClient(cls.service.get_api_client())
+        return cls.api_client
+
+    @classmethod
+    async def _timed(cls, stage: str, awaitable):
+        """Await ``awaitable`` and report its latency to the instrumentation hook, if any."""
+        instrumentation = cls.service.instrumentation
+        if instrumentation is None:
+            return await awaitable
+
+        start = time.perf_counter()
+        try:
+            return await awaitable
+        finally:
+            instrumentation.record_stage(stage, time.perf_counter() - start)
+
+    @classmethod
+    async def process_order_by_user_id(cls, user_id: int, **options) -> bool:
+        """Process orders for a specific user.
+
+        Args:
+                user_id (int): ID of the user
+                **options: Processing options forwarded to ``process_orders``
+        """
+        try:
+            # Pages are timed by the service as they are read
+            orders = await asyncio.to_thread(cls.service.fetch_orders_by_user, user_id)
+            return await cls.process_orders(orders, user_id, **options)
+        except DatabaseException:
+            return False
+
+    @classmethod
+    async def process_orders(cls, orders: Iterable[Order], user_id: int = None, run_id: str = None) -> bool:
+        """Process a list of orders concurrently.
+
+        ``orders`` may be any iterable; orders are only taken from it while
+        fewer than ``max_concurrency`` are in flight. As in the sync path,
+        an order whose processing raises an unexpected exception is marked
+        PROCESSING_ERROR and doesn't stop the other orders.
+
+        Args:
+                orders (Iterable[Order]): Orders to be processed
+                user_id (int): ID of the user owning the orders
+                run_id (str): ID of the processing run, used to name export
+                        files. A random one is used when None, so that
+                        concurrent exports never share a file
+
+        Returns:
+                bool: True if every order was processed, False otherwise
+        """
+        run_id = run_id or uuid.uuid4().hex
+        semaphore = asyncio.Semaphore(cls.max_concurrency)
+        tasks = set()
+        success = True
+
+        def on_done(task: asyncio.Task) -> None:
+            nonlocal success
+            tasks.discard(task)
+            semaphore.release()
+            if task.cancelled() or task.exception() is not None:
+                success = False
+
+        for order in orders:
+            await semaphore.acquire()
+            task = asyncio.ensure_future(cls.process_order(order, user_id, run_id))
+            tasks.add(task)
+            task.add_done_callback(on_done)
+
+        if tasks:
+            await asyncio.wait(set(tasks))
+
+        return success
+
+    @classmethod
+    async def process_order(cls, order: Order, user_id: int = None, run_id: str = None) -> Order:
+        """Process a single order with the handler of its type, then persist it."""
+        service = cls.service
+        handler = service.rule_table.handlers.get(order.type)
+        try:
+            if handler is None:
+                order.status = OrderStatus.UNKNOWN_TYPE
+            elif handler == OrderHandler.TYPE_A:
+                await asyncio.to_thread(service.process_type_a_orders, order, user_id, run_id)
+            elif handler == OrderHandler.TYPE_B:
+                await cls.process_type_b_orders(order)
+            elif handler == OrderHandler.TYPE_C:
+                # Type C orders don't do I/O
+                service.process_type_c_orders(order, user_id, run_id)
+            else:
+                raise ValueError(f"Invalid handler {handler!r} for order type {order.type!r}")
+        except Exception:
+            order.status = OrderStatus.PROCESSING_ERROR
+
+        # Set even when the handler failed, as OrderService._finalize_order does
+        try:
+            order.priority = service.rule_table["priority"](order)
+        except Exception:
+            order.status = OrderStatus.PROCESSING_ERROR
+
+        try:
+            await cls._timed(Stage.UPDATE, asyncio.to_thread(service.update_order, order))
+        except DatabaseException:
+            order.status = OrderStatus.DB_ERROR
+        except Exception:
+            order.status = OrderStatus.PROCESSING_ERROR
+
+        service._record_orders([order])
+
+        return order
+
+    @classmethod
+    async def process_type_b_orders(cls, order: Order) -> Order:
+        """Process orders of type B."""
+        try:
+            api_response = await cls._timed(Stage.API, cls.get_api_client().call_api(order.id))
+            cls.service._apply_api_response(order, api_response)
+        except APIException:
+            order.status = OrderStatus.API_FAILURE
+
+        return order
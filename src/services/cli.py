@@ -0,0 +1,92 @@
+"""Command line entry point processing the orders of users or of an order file.
+
+Run from the ``src`` directory, either with user ids read from a SQLite
+database or with a CSV file of orders with ``id,type,amount,is_special``
+columns, in that order:
+
+    python -m services.cli USER_ID [USER_ID ...] --database orders.db
+        [--workers N] [--export-format FORMAT] [--batch-export] [--report]
+    python -m services.cli --orders-file orders.csv
+        [--workers N] [--export-format FORMAT] [--batch-export] [--report]
+
+The exit status is 0 when every run succeeded and 1 otherwise. Exporter,
+API client and storage backends are only imported when a run uses them.
+"""
+import argparse
+import sys
+from typing import List
+
+from services.order_service import OrderService
+from utils.exporters.base_exporter import BaseExporter
+
+
+def open_database(path: str) -> None:
+    """Point OrderService at a SQLite database, also used as worker process initializer."""
+    from repositories.sqlite_order_repository import SQLiteOrderRepository
+
+    OrderService.order_repository = SQLiteOrderRepository(path)
+
+
+def parse_args(argv: List[str] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python -m services.cli", description=__doc__.splitlines()[0])
+    parser.add_argument("user_ids", type=int, nargs="*", help="users whose orders are processed")
+    parser.add_argument("--orders-file", help="process the orders of this CSV file instead of users")
+    parser.add_argument("--database", help="SQLite database the orders are read from and written to")
+    parser.add_argument(
+        "--workers", type=int, help="worker processes for users, or Type B API workers for an orders file"
+    )
+    parser.add_argument("--export-format", choices=BaseExporter.formats(), default=OrderService.export_format)
+    parser.add_argument("--batch-export", action="store_true", help="export each run into a single file")
+    parser.add_argument("--api-url", help="base URL of the order API")
+    parser.add_argument("--report", action="store_true", help="print a JSON summary of the runs")
+    args = parser.parse_args(argv)
+
+    if bool(args.user_ids) == bool(args.orders_file):
+        parser.error("pass either user ids or --orders-file")
+    if args.user_ids and not args.database:
+        parser.error("processing user ids needs --database")
+    return args
+
+
+def main(argv: List[str] = None) -> int:
+    args = parse_args(argv)
+
+    OrderService.export_format = args.export_format
+    if args.api_url:
+        from routers.order_api_client import OrderAPIClient
+
+        OrderService.api_client = OrderAPIClient(base_url=args.api_url)
+    if args.database:
+        open_database(args.database)
+
+    options = {"batch_export": args.batch_export}
+    if args.orders_file:
+        from utils.ingestion.csv_order_file_reader import CSVOrderFileReader
+
+        orders = CSVOrderFileReader(args.orders_file).iter_orders()
+        report = OrderService.process_orders(orders, max_workers=args.workers, with_report=True, **options)
+        success = report.success
+        summary = report.to_dict()
+    elif args.workers:
+        result = OrderService.process_users(
+            args.user_ids, workers=args.workers, initializer=open_database, initargs=(args.database,), **options
+        )
+        success = all(result.success.values())
+        summary = {"success": result.success, "status_counts": dict(result.status_counts)}
+    else:
+        reports = {
+            user_id: OrderService.process_order_by_user_id(user_id, with_report=True, **options)
+            for user_id in args.user_ids
+        }
+        success = all(report.success for report in reports.values())
+        summary = {user_id: report.to_dict() for user_id, report in reports.items()}
+
+    if args.report:
+        import json
+
+        print(json.dumps(summary, indent=2, sort_keys=True))
+    return 0 if success else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,59 @@
+from typing import TYPE_CHECKING, Iterable
+
+from constants.constants import DEFAULT_STATE_STORE_CHUNK_SIZE, SETTLED_ORDER_STATUSES
+from models.order_model import Order
+
+if TYPE_CHECKING:
+    from repositories.sqlite_order_state_store import SQLiteOrderStateStore
+
+
+class FingerprintRecorder:
+    """Fingerprints of the orders of an incremental run, stored as the orders settle.
+
+    Orders are tracked with their fingerprint when they are taken from the
+    input, and committed once their final status is persisted, along with
+    the bulk update and checkpoint of the run. Committed orders are written
+    to the store one chunk at a time: settled orders get their fingerprint
+    saved, and the others have their stored fingerprint dropped so that the
+    next run processes them again. Only the orders in flight and one chunk
+    are kept in memory, and a run that stops keeps the fingerprints of the
+    orders it already saved.
+
+    Attributes:
+            store (SQLiteOrderStateStore): Store the fingerprints are kept in
+            chunk_size (int): Number of committed orders written per chunk
+    """
+
+    def __init__(self, store: "SQLiteOrderStateStore", chunk_size: int = DEFAULT_STATE_STORE_CHUNK_SIZE) -> None:
+        self.store = store
+        self.chunk_size = chunk_size
+        # Fingerprints of the orders taken from the input and not committed yet, by object identity
+        self._pending = {}
+        self._settled = []
+        self._unsettled = []
+
+    def track(self, order: Order, fingerprint: str) -> None:
+        self._pending[id(order)] = fingerprint
+
+    def commit(self, orders: Iterable[Order]) -> None:
+        """Mark orders as persisted, writing a chunk once enough of them are."""
+        for order in orders:
+            fingerprint = self._pending.pop(id(order), None)
+            if fingerprint is None:
+                continue
+            if order.status in SETTLED_ORDER_STATUSES:
+                self._settled.append((order.id, fingerprint, order.status))
+            else:
+                self._unsettled.append(order.id)
+
+        if len(self._settled) + len(self._unsettled) >= self.chunk_size:
+            self.save()
+
+    def save(self) -> None:
+        """Write the fingerprints of the orders committed since the last chunk."""
+        if self._settled:
+            self.store.save_fingerprints(self._settled)
+            self._settled = []
+        if self._unsettled:
+            self.store.forget_orders(self._unsettled)
+            self._unsettled = []
@@ -0,0 +1,73 @@
+from array import array
+
+from constants.constants import OrderType, OrderStatus, OrderPriority, OrderAmountThreshold
+from models.order_batch import OrderBatch, ORDER_TYPES, ORDER_STATUSES, ORDER_PRIORITIES
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, the pure Python path is used without it
+    np = None
+
+TYPE_C = ORDER_TYPES.index(OrderType.C)
+COMPLETED = ORDER_STATUSES.index(OrderStatus.COMPLETED)
+IN_PROGRESS = ORDER_STATUSES.index(OrderStatus.IN_PROGRESS)
+UNKNOWN_TYPE = ORDER_STATUSES.index(OrderStatus.UNKNOWN_TYPE)
+HIGH = ORDER_PRIORITIES.index(OrderPriority.HIGH)
+LOW = ORDER_PRIORITIES.index(OrderPriority.LOW)
+
+
+class OrderBatchClassifier:
+    """Apply the column-only order rules to a whole OrderBatch at once.
+
+    The rules are those of the default ``OrderService.rule_table``:
+
+    - priority is HIGH when the amount exceeds ``PRIORITY_THRESHOLD``
+    - Type C orders are COMPLETED when special, IN_PROGRESS otherwise
+    - orders of an unknown type are marked UNKNOWN_TYPE
+
+    With NumPy installed the columns are processed as masked array
+    operations over zero-copy views of the batch; otherwise a pure Python
+    pass over the columns is used.
+    """
+
+    @classmethod
+    def classify(cls, batch: OrderBatch, use_numpy: bool = None) -> OrderBatch:
+        """Set the priority of every order and the status of Type C and unknown type orders."""
+        use_numpy = np is not None if use_numpy is None else use_numpy
+        if use_numpy:
+            cls._classify_numpy(batch)
+        else:
+            cls._classify_python(batch)
+        return batch
+
+    @classmethod
+    def _classify_numpy(cls, batch: OrderBatch) -> None:
+        amounts = np.frombuffer(batch.amounts, dtype=np.float64)
+        is_special = np.frombuffer(batch.is_special, dtype=np.int8)
+        type_codes = np.frombuffer(batch.type_codes, dtype=np.int8)
+        status_codes = np.frombuffer(batch.status_codes, dtype=np.int8)
+        priority_codes = np.frombuffer(batch.priority_codes, dtype=np.int8)
+
+        priority_codes[:] = np.where(amounts > OrderAmountThreshold.PRIORITY_THRESHOLD, HIGH, LOW)
+
+        type_c = type_codes == TYPE_C
+        status_codes[type_c] = np.where(is_special[type_c] != 0, COMPLETED, IN_PROGRESS)
+        status_codes[type_codes >= len(ORDER_TYPES)] = UNKNOWN_TYPE
+
+    @classmethod
+    def _classify_python(cls, batch: OrderBatch) -> None:
+        threshold = OrderAmountThreshold.PRIORITY_THRESHOLD
+        known_types = len(ORDER_TYPES)
+
+        batch.priority_codes[:] = array("b", [HIGH if amount > threshold else LOW for amount in batch.amounts])
+        batch.status_codes[:] = array(
+            "b",
+            [
+                (COMPLETED if special else IN_PROGRESS)
+                if type_code == TYPE_C
+                else UNKNOWN_TYPE
+                if type_code >= known_types
+                else status
+                for type_code, special, status in zip(batch.type_codes, batch.is_special, batch.status_codes)
+            ],
+        )
@@ -0,0 +1,146 @@
+import math
+import operator
+import re
+from operator import attrgetter
+from typing import Callable, Dict, List
+
+from constants.constants import ORDER_HANDLERS, ORDER_RULE_TABLES
+
+# Public attributes only, so that rules can't reach dunder attributes
+_FIELD = re.compile(r"^(order|response)\.([A-Za-z][A-Za-z0-9_]*)$")
+_BINARY_OPERATORS = {
+    "==": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+}
+_UNARY_OPERATORS = {"truthy": operator.truth, "falsy": operator.not_}
+
+
+class OrderRuleTable:
+    """Order routing and decision rules loaded from config.
+
+    The config holds ``handlers``, mapping an order type to the name of the
+    OrderService method processing it, one of ``ORDER_HANDLERS``, and
+    ``tables``, mapping a decision name to a list of rules such as::
+
+        {"when": {"order.amount": [">", 200]}, "result": "high"}
+
+    Rules are checked in order and the first one whose conditions all hold
+    gives the result; a rule without ``when`` always matches, and a table
+    where nothing matches gives None. A condition reads a public attribute
+    of the order or of the API response and is either ``[operator, value]``
+    with a comparison operator, or ``["truthy"]`` / ``["falsy"]``. Every
+    table of ``ORDER_RULE_TABLES`` is required.
+
+    Each rule is compiled once into a closure over the attribute getters,
+    operators and literal values of its conditions, so no code is generated
+    from the config. Fields, operators and values are validated before
+    compiling.
+    """
+
+    def __init__(self, handlers: Dict[str, str], tables: Dict[str, List[dict]]) -> None:
+        for order_type, handler in handlers.items():
+            if handler not in ORDER_HANDLERS:
+                raise ValueError(
+                    f"Invalid handler {handler!r} for order type {order_type!r}, expected one of {list(ORDER_HANDLERS)}"
+                )
+        missing = [name for name in ORDER_RULE_TABLES if name not in tables]
+        if missing:
+            raise ValueError(f"Missing rule tables {missing}")
+
+        self.handlers = dict(handlers)
+        self._deciders = {name: self._compile(name, rules) for name, rules in tables.items()}
+
+    @classmethod
+    def from_config(cls, config: dict) -> "OrderRuleTable":
+        """Build a rule table from a ``{"handlers": ..., "tables": ...}`` mapping."""
+        return cls(config.get("handlers", {}), config.get("tables", {}))
+
+    @classmethod
+    def from_file(cls, path: str) -> "OrderRuleTable":
+        """Build a rule table from a JSON file in the ``from_config`` layout."""
+        import json
+
+        with open(path) as file_handler:
+            return cls.from_config(json.load(file_handler))
+
+    def __getitem__(self, name: str) -> Callable:
+        """Return the compiled ``decide(order, response=None)`` function of a table."""
+        return self._deciders[name]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._deciders
+
+    def decide(self, name: str, order, response=None):
+        """Return the result of the first rule of table ``name`` matching the order."""
+        return self._deciders[name](order, response)
+
+    @classmethod
+    def _compile(cls, name: str, rules: List[dict]) -> Callable:
+        compiled = []
+        default = None
+        for index, rule in enumerate(rules):
+            if "result" not in rule:
+                raise ValueError(f"Rule {index} of table {name!r} has no result")
+
+            result = cls._literal(name, index, rule["result"])
+            checks = [
+                cls._condition(name, index, field, condition) for field, condition in rule.get("when", {}).items()
+            ]
+            if not checks:
+                # Later rules can't be reached
+                default = result
+                break
+            compiled.append((cls._all_of(checks), result))
+        compiled = tuple(compiled)
+
+        def decide(order, response=None):
+            for matches, result in compiled:
+                if matches(order, response):
+                    return result
+            return default
+
+        return decide
+
+    @classmethod
+    def _all_of(cls, checks: List[Callable]) -> Callable:
+        """Combine condition checks into one check holding when they all hold."""
+        first = checks[0]
+        if len(checks) == 1:
+            return first
+        rest = cls._all_of(checks[1:])
+        return lambda order, response: first(order, response) and rest(order, response)
+
+    @classmethod
+    def _condition(cls, name: str, index: int, field: str, condition: list) -> Callable:
+        """Return a ``check(order, response)`` closure of a condition."""
+        match = _FIELD.match(field)
+        if match is None:
+            raise ValueError(f"Invalid field {field!r} in rule {index} of table {name!r}")
+        source, attribute = match.groups()
+        get = attrgetter(attribute)
+
+        operator_name, *operands = condition
+        if operator_name in _UNARY_OPERATORS and not operands:
+            test = _UNARY_OPERATORS[operator_name]
+            if source == "order":
+                return lambda order, response: test(get(order))
+            return lambda order, response: test(get(response))
+        if operator_name in _BINARY_OPERATORS and len(operands) == 1:
+            compare = _BINARY_OPERATORS[operator_name]
+            value = cls._literal(name, index, operands[0])
+            if source == "order":
+                return lambda order, response: compare(get(order), value)
+            return lambda order, response: compare(get(response), value)
+        raise ValueError(f"Invalid condition {condition!r} on {field!r} in rule {index} of table {name!r}")
+
+    @classmethod
+    def _literal(cls, name: str, index: int, value):
+        if value is None or isinstance(value, (bool, int, str)):
+            return value
+        if isinstance(value, float) and math.isfinite(value):
+            return value
+        raise ValueError(f"Invalid value {value!r} in rule {index} of table {name!r}")
@@ -1,27 +1,375 @@
-from typing import List
+from array import array
+from collections import Counter
+from functools import partial
+from itertools import islice
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, Tuple, Union
+import threading
 import time
 
 from constants.constants import (
-    OrderType,
     OrderStatus,
-    OrderPriority,
-    APIStatus,
     OrderAmountThreshold,
-    ORDER_API_RESPONSE_THRESHOLD,
+    OrderHandler,
+    DEFAULT_API_BATCH_SIZE,
+    DEFAULT_DB_BATCH_SIZE,
+    DEFAULT_FETCH_PAGE_SIZE,
+    DEFAULT_ORDER_RULES,
+    DEFAULT_QUEUE_LEASE_SECONDS,
+    DEFAULT_QUEUE_LEASE_SIZE,
+    DEFAULT_QUEUE_MAX_ATTEMPTS,
+    DEFAULT_QUEUE_POLL_INTERVAL,
+    DEFAULT_QUEUE_RETRY_DELAY,
+    DEFAULT_STATE_STORE_CHUNK_SIZE,
 )
 from models.order_model import Order
-from utils.exporters.csv_exporter import CSVExporter
+from models.queued_order import QueuedOrder
+from responses.api_response import APIResponse
+from utils.exporters.base_exporter import BaseExporter
 from utils.exceptions.database_exception import DatabaseException
 from utils.exceptions.api_exception import APIException
-from routers.order_api_client import OrderAPIClient
+from utils.instrumentation.base_instrumentation import BaseInstrumentation, Stage
+from utils.instrumentation.latency_histogram import LatencyHistogram
+from routers.base_api_client import BaseAPIClient
+from repositories.base_order_repository import BaseOrderRepository
+from services.order_rule_table import OrderRuleTable
+
+# The HTTP client, process pools, state store and export writer are only
+# imported by the runs that use them, so that short jobs start quickly
+if TYPE_CHECKING:
+    from repositories.base_order_queue import BaseOrderQueue
+    from repositories.sqlite_order_state_store import SQLiteOrderStateStore
+    from services.fingerprint_recorder import FingerprintRecorder
+    from services.processing_checkpoint import ProcessingCheckpoint
+    from utils.exporters.background_export_writer import BackgroundExportWriter
+
+TYPE_A_EXPORT_COLUMNS = ["ID", "Type", "Amount", "Is Special", "Status", "Priority"]
+
+
+class UserBatchResult:
+    """Outcome of processing several users.
+
+    Attributes:
+            success (Dict[int, bool]): Whether processing succeeded, per user
+            status_counts (Dict[str, int]): Number of orders per resulting
+                    OrderStatus, over all users
+    """
+
+    def __init__(self) -> None:
+        self.success = {}
+        self.status_counts = Counter()
+
+
+class IncrementalStats:
+    """Outcome of an incremental run.
+
+    Attributes:
+            processed (int): Orders that went through processing, i.e. new or
+                    changed orders, or every order of a forced run
+            skipped (int): Orders skipped because their inputs are unchanged
+                    since they were last settled
+    """
+
+    def __init__(self) -> None:
+        self.processed = 0
+        self.skipped = 0
+
+
+class ProcessingReport:
+    """Summary of a ``process_orders`` run, accumulated as orders settle.
+
+    Attributes:
+            success (bool): Whether processing was successful
+            status_counts (Dict[str, int]): Number of orders per OrderStatus
+            priority_counts (Dict[str, int]): Number of orders per OrderPriority
+            total_amount (float): Sum of the amounts of the settled orders,
+                    leaving out amounts that aren't numbers
+            failed_ids (Dict[str, array]): IDs of the orders that failed, per
+                    Stage, as arrays of signed 64-bit integers
+            elapsed (float): Duration of the run in seconds
+    """
+
+    # Stage whose failure leaves an order in each failed status
+    FAILED_STAGES = {
+        OrderStatus.EXPORT_FAILED: Stage.EXPORT,
+        OrderStatus.API_ERROR: Stage.API,
+        OrderStatus.API_FAILURE: Stage.API,
+        OrderStatus.DB_ERROR: Stage.UPDATE,
+        OrderStatus.PROCESSING_ERROR: Stage.PROCESS,
+    }
+
+    def __init__(self, success: bool = True) -> None:
+        self.success = success
+        self.status_counts = Counter()
+        self.priority_counts = Counter()
+        self.total_amount = 0.0
+        self.failed_ids = {}
+        self.elapsed = 0.0
+
+    def add(self, orders: Iterable[Order]) -> None:
+        """Count orders whose final status is settled."""
+        for order in orders:
+            self.status_counts[order.status] += 1
+            self.priority_counts[order.priority] += 1
+            # An order failing on a malformed amount is still counted, without its amount
+            if isinstance(order.amount, (int, float)):
+                self.total_amount += order.amount
+
+            stage = self.FAILED_STAGES.get(order.status)
+            if stage is not None:
+                failed_ids = self.failed_ids.get(stage)
+                if failed_ids is None:
+                    failed_ids = self.failed_ids[stage] = array("q")
+                failed_ids.append(order.id)
+
+    @property
+    def order_count(self) -> int:
+        return sum(self.status_counts.values())
+
+    def to_dict(self) -> dict:
+        """Return a JSON-serializable copy of the report."""
+        return {
+            "success": self.success,
+            "status_counts": dict(self.status_counts),
+            "priority_counts": dict(self.priority_counts),
+            "total_amount": self.total_amount,
+            "failed_ids": {stage: list(ids) for stage, ids in self.failed_ids.items()},
+            "elapsed": self.elapsed,
+        }
+
+
+class OrderQueueStats:
+    """Outcome of draining the order queue, per OrderPriority.
+
+    Attributes:
+            processed (Dict[str, int]): Number of processed orders per priority
+            queue_latency (Dict[str, LatencyHistogram]): Time orders waited in
+                    the queue until a worker leased them, per priority
+            latency (Dict[str, LatencyHistogram]): Time from enqueueing orders
+                    until they were processed and acknowledged, per priority
+            status_counts (Dict[str, int]): Number of orders per resulting OrderStatus
+            retried (Dict[str, int]): Number of failed orders released to be
+                    leased again, per priority
+            dead_lettered (Dict[str, int]): Number of orders moved to the dead
+                    letters of the queue after their last attempt, per priority
+            elapsed (float): Duration of the run in seconds
+    """
+
+    def __init__(self) -> None:
+        self.processed = Counter()
+        self.queue_latency = {}
+        self.latency = {}
+        self.status_counts = Counter()
+        self.retried = Counter()
+        self.dead_lettered = Counter()
+        self.elapsed = 0.0
+        # Updated by every worker thread
+        self._lock = threading.Lock()
+
+    def add(self, entries: List[QueuedOrder], acked_at: float, dead_lettered: List[QueuedOrder] = ()) -> None:
+        """Count the processed orders of a lease, acknowledged at epoch time ``acked_at``."""
+        with self._lock:
+            for entry in entries:
+                self.processed[entry.priority] += 1
+                self.status_counts[entry.order.status] += 1
+                self._histogram(self.queue_latency, entry.priority).record(entry.leased_at - entry.enqueued_at)
+                self._histogram(self.latency, entry.priority).record(acked_at - entry.enqueued_at)
+            for entry in dead_lettered:
+                self.dead_lettered[entry.priority] += 1
+
+    def add_retries(self, entries: List[QueuedOrder]) -> None:
+        """Count the failed orders of a lease released to be leased again."""
+        with self._lock:
+            for entry in entries:
+                self.retried[entry.priority] += 1
+
+    @staticmethod
+    def _histogram(histograms: Dict[str, LatencyHistogram], priority: str) -> LatencyHistogram:
+        histogram = histograms.get(priority)
+        if histogram is None:
+            histogram = histograms[priority] = LatencyHistogram()
+        return histogram
+
+    def throughput(self) -> Dict[str, float]:
+        """Return the number of processed orders per second, per priority."""
+        if not self.elapsed:
+            return {priority: 0.0 for priority in self.processed}
+        return {priority: count / self.elapsed for priority, count in self.processed.items()}
+
+    def to_dict(self) -> dict:
+        """Return a JSON-serializable copy of the stats."""
+        with self._lock:
+            return {
+                "processed": dict(self.processed),
+                "throughput": self.throughput(),
+                "queue_latency": {priority: latency.summary() for priority, latency in self.queue_latency.items()},
+                "latency": {priority: latency.summary() for priority, latency in self.latency.items()},
+                "status_counts": dict(self.status_counts),
+                "retried": dict(self.retried),
+                "dead_lettered": dict(self.dead_lettered),
+                "elapsed": self.elapsed,
+            }
+
+
+def _process_user_in_worker(service_cls, user_id: int, options: dict) -> Tuple[bool, Dict[str, int]]:
+    """Process pool entry point, kept at module level so that it can be pickled."""
+    return service_cls.process_user_with_counts(user_id, **options)
+
+
+class _TypeBDispatcher:
+    """Processes the deferred Type B orders of one run, handing each to ``finalize`` once done.
+
+    Orders are grouped into units of ``api_batch_size`` orders sent with one
+    bulk API call, or of a single order without it. With ``max_workers`` the
+    units run on one thread pool kept for the whole run, with at most a few
+    units per worker in flight: submitting a unit first waits for the oldest
+    ones to complete, so workers stay busy without holding the whole input.
+    Without it each unit is processed as soon as it fills. ``finalize`` is
+    always called on the thread feeding the orders.
+    """
+
+    def __init__(self, service_cls, max_workers: int, api_batch_size: int, finalize) -> None:
+        self.service_cls = service_cls
+        self.max_workers = max_workers
+        self.api_batch_size = api_batch_size
+        self.finalize = finalize
+        self.max_in_flight = 4 * (max_workers or 1)
+        self._unit = []
+        self._in_flight = {}
+        self._executor = None
+
+    def add(self, order: Order) -> None:
+        self._unit.append(order)
+        if len(self._unit) >= (self.api_batch_size or 1):
+            self._dispatch()
+
+    def drain(self) -> None:
+        """Process the remaining orders and wait for every unit in flight."""
+        if self._unit:
+            self._dispatch()
+        while self._in_flight:
+            self._complete(block=True)
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def _process(self, orders: List[Order]) -> List[Order]:
+        service_cls = self.service_cls
+        if self.api_batch_size:
+            return service_cls._process_type_b_chunk(orders)
+        for order in orders:
+            service_cls._call_handler(OrderHandler.TYPE_B, order)
+        return orders
+
+    def _dispatch(self) -> None:
+        orders, self._unit = self._unit, []
+        if not self.max_workers:
+            for order in self._process(orders):
+                self.finalize(order)
+            return
+
+        if self._executor is None:
+            from concurrent.futures import ThreadPoolExecutor
+
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        while len(self._in_flight) >= self.max_in_flight:
+            self._complete(block=True)
+        self._in_flight[self._executor.submit(self._process, orders)] = orders
+        self._complete(block=False)
+
+    def _complete(self, block: bool) -> None:
+        """Finalize the orders of completed units, waiting for one to complete if ``block``."""
+        from concurrent.futures import FIRST_COMPLETED, wait
+
+        done, _ = wait(self._in_flight, timeout=None if block else 0, return_when=FIRST_COMPLETED)
+        for future in done:
+            orders = self._in_flight.pop(future)
+            try:
+                future.result()
+            except Exception:
+                # Units isolate their own failures, this only catches the unexpected
+                for order in orders:
+                    order.status = OrderStatus.PROCESSING_ERROR
+            for order in orders:
+                self.finalize(order)
 
 
 class OrderService:
+    # Long-lived API client shared by every Type B call. Assign a client to
+    # inject one; otherwise a default OrderAPIClient is created on first use.
+    api_client: BaseAPIClient = None
+    _api_client_lock = threading.Lock()
+
+    @classmethod
+    def get_api_client(cls) -> BaseAPIClient:
+        """Return the shared API client, creating the default one on first use."""
+        if cls.api_client is None:
+            with cls._api_client_lock:
+                if cls.api_client is None:
+                    from routers.order_api_client import OrderAPIClient
+
+                    cls.api_client = OrderAPIClient()
+        return cls.api_client
+
+    # Storage backend used for database writes when one is configured
+    order_repository: BaseOrderRepository = None
+
+    # Hook receiving per-stage latencies and final order statuses, disabled when None
+    instrumentation: BaseInstrumentation = None
+
+    # Format of Type A export files, any format registered on BaseExporter
+    export_format: str = "csv"
+
+    # Fingerprints of settled orders, required by incremental runs
+    order_state_store: "SQLiteOrderStateStore" = None
+
+    # Priority-sharded queue filled by enqueue_orders and drained by process_order_queue
+    order_queue: "BaseOrderQueue" = None
+
+    # Handlers per order type and the status and priority decision tables,
+    # compiled once. Assign a table built from other config to change them.
+    rule_table: OrderRuleTable = OrderRuleTable.from_config(DEFAULT_ORDER_RULES)
+
+    @classmethod
+    def _timed(cls, stage: str, func, *args, **kwargs):
+        """Call ``func`` and report its latency to the instrumentation hook, if any."""
+        instrumentation = cls.instrumentation
+        if instrumentation is None:
+            return func(*args, **kwargs)
+
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            instrumentation.record_stage(stage, time.perf_counter() - start)
+
+    @classmethod
+    def _record_orders(
+        cls,
+        orders: List[Order],
+        report: ProcessingReport = None,
+        checkpoint: "ProcessingCheckpoint" = None,
+        fingerprints: "FingerprintRecorder" = None,
+    ) -> None:
+        """Report settled orders to the instrumentation hook, run report, checkpoint and fingerprints, if any."""
+        instrumentation = cls.instrumentation
+        if instrumentation is not None:
+            for order in orders:
+                instrumentation.record_order(order.type, order.status)
+        if report is not None:
+            report.add(orders)
+        if checkpoint is not None:
+            checkpoint.commit(orders)
+        if fingerprints is not None:
+            fingerprints.commit(orders)
 
     @classmethod
     def fetch_orders_by_user(cls, user_id: int) -> List[Order]:
         """Fetch orders for a specific user.
 
+        Orders are read one page at a time, each page timed under Stage.FETCH.
+
         Args:
                 user_id (int): ID of the user
 
@@ -31,7 +379,54 @@ class OrderService:
         Raises:
                 DatabaseException: If there's an error accessing the database
         """
-        pass
+        if cls.order_repository is not None:
+            return list(cls.iter_orders_by_user(user_id))
+
+    @classmethod
+    def fetch_orders_page(
+        cls, user_id: int, after_id: int = None, page_size: int = DEFAULT_FETCH_PAGE_SIZE
+    ) -> List[Order]:
+        """Fetch one page of orders for a specific user, ordered by ID.
+
+        Args:
+                user_id (int): ID of the user
+                after_id (int): ID of the last order of the previous page, or
+                        None for the first page
+                page_size (int): Maximum number of orders in the page
+
+        Returns:
+                List[Order]: Orders of the page, empty once all orders are read
+
+        Raises:
+                DatabaseException: If there's an error accessing the database
+        """
+        if cls.order_repository is not None:
+            return cls.order_repository.fetch_orders_page(user_id, after_id, page_size)
+
+    @classmethod
+    def iter_orders_by_user(
+        cls, user_id: int, page_size: int = DEFAULT_FETCH_PAGE_SIZE
+    ) -> Iterator[Order]:
+        """Lazily yield the orders of a user, fetching them one page at a time.
+
+        Args:
+                user_id (int): ID of the user
+                page_size (int): Number of orders fetched per page
+
+        Raises:
+                DatabaseException: If there's an error accessing the database
+        """
+        after_id = None
+        while True:
+            page = cls._timed(Stage.FETCH, cls.fetch_orders_page, user_id, after_id, page_size)
+            if not page:
+                return
+
+            yield from page
+
+            if len(page) < page_size:
+                return
+            after_id = page[-1].id
 
     @classmethod
     def update_order(cls, order: Order) -> bool:
@@ -46,86 +441,376 @@ class OrderService:
         Raises:
                 DatabaseException: If there's an error updating the database
         """
-        pass
+        if cls.order_repository is not None:
+            return cls.order_repository.update_order(order)
 
     @classmethod
-    def process_order_by_user_id(cls, user_id: int) -> bool:
+    def update_orders(cls, orders: List[Order], chunk_size: int = DEFAULT_DB_BATCH_SIZE) -> bool:
+        """Update the status and priority of several orders in bulk.
+
+        Orders are written in chunks, one transaction per chunk. When a chunk
+        fails, its orders are retried one by one so that only the failing
+        orders are marked DB_ERROR, or PROCESSING_ERROR when the failure is
+        not a DatabaseException.
+
+        Args:
+                orders (List[Order]): Order objects to be updated
+                chunk_size (int): Number of orders written per transaction
+
+        Returns:
+                bool: True if every order was updated, False otherwise
+        """
+        success = True
+
+        for start in range(0, len(orders), chunk_size):
+            chunk = orders[start : start + chunk_size]
+            if cls.order_repository is not None:
+                try:
+                    cls._timed(Stage.UPDATE, cls.order_repository.update_orders, chunk)
+                    continue
+                except Exception:
+                    # Fall back to per-order updates to isolate the failing rows
+                    pass
+
+            for order in chunk:
+                try:
+                    cls._timed(Stage.UPDATE, cls.update_order, order)
+                except DatabaseException:
+                    order.status = OrderStatus.DB_ERROR
+                    success = False
+                except Exception:
+                    order.status = OrderStatus.PROCESSING_ERROR
+                    success = False
+
+        return success
+
+    @classmethod
+    def process_order_by_user_id(cls, user_id: int, page_size: int = None, **options) -> bool:
         """Process orders for a specific user.
 
         Args:
                 user_id (int): ID of the user
+                page_size (int): Stream the orders from the database one page
+                        of this size at a time instead of loading them all
+                **options: Processing options forwarded to ``process_orders``
 
         Raises:
                 DatabaseException: If there's an error accessing the database
         """
         try:
-            orders = cls.fetch_orders_by_user(user_id)
-            return cls.process_orders(orders, user_id)
+            if page_size:
+                orders = cls.iter_orders_by_user(user_id, page_size)
+            else:
+                orders = cls.fetch_orders_by_user(user_id)
+            return cls.process_orders(orders, user_id, **options)
         except DatabaseException:
-            return False
+            return ProcessingReport(success=False) if options.get("with_report") else False
 
     @classmethod
-    def process_orders(cls, orders: List[Order], user_id: int = None) -> bool:
+    def process_orders(
+        cls,
+        orders: Iterable[Order],
+        user_id: int = None,
+        batch_export: bool = False,
+        max_workers: int = None,
+        api_batch_size: int = None,
+        db_batch_size: int = None,
+        run_id: str = None,
+        background_export: bool = False,
+        incremental: bool = False,
+        force: bool = False,
+        stats: IncrementalStats = None,
+        with_report: bool = False,
+        checkpoint: bool = False,
+    ) -> Union[bool, ProcessingReport]:
         """Process a list of orders.
 
+        Each order is handed to the handler ``rule_table`` registers for its
+        type; orders of a type without a handler are marked UNKNOWN_TYPE.
+        ``orders`` may be any iterable, including a lazy one such as
+        ``iter_orders_by_user``. Deferred Type B orders run on one thread
+        pool per run with a bounded number of them in flight, and bulk
+        updates are flushed as their buffer fills up, so memory stays bounded
+        by these sizes rather than the number of orders. Batch export still
+        keeps every Type A order of the run until the file is written.
+
+        An order whose processing raises an unexpected exception is marked
+        PROCESSING_ERROR and persisted like any other order, and the run
+        goes on with the next one. Only failures outside of a single order,
+        such as reading the input, stop the run.
+
         Args:
-                orders (List[Order]): List of orders to be processed
+                orders (Iterable[Order]): Orders to be processed
+                user_id (int): ID of the user owning the orders
+                batch_export (bool): Export all Type A orders of the run into a
+                        single file instead of one file per order
+                max_workers (int): Dispatch Type B API calls concurrently on a
+                        thread pool of at most this many workers
+                api_batch_size (int): Send Type B orders through the bulk API
+                        endpoint in chunks of this many ids
+                db_batch_size (int): Write order updates in bulk, this many
+                        orders per transaction
+                run_id (str): ID of the processing run, used to name export
+                        files instead of the current time
+                background_export (bool): Export all Type A orders of the run
+                        into a single file written by a background thread, so
+                        that export I/O overlaps with processing
+                incremental (bool): Skip orders whose type, amount and special
+                        flag are unchanged since they were last settled, using
+                        the fingerprints in ``order_state_store``
+                force (bool): With ``incremental``, process every order anyway
+                        and refresh its fingerprint
+                stats (IncrementalStats): Filled with the number of processed
+                        and skipped orders of an incremental run
+                with_report (bool): Return a ProcessingReport counted while
+                        processing instead of a bool, so that callers don't
+                        need to keep and inspect the orders afterwards
+                checkpoint (bool): Keep the offset in ``orders`` up to which
+                        every order is persisted in ``order_state_store``
+                        under ``run_id``, and skip the orders before it, so
+                        that rerunning a run that stopped resumes where it
+                        stopped. Pass the same input in the same order to the
+                        rerun, and clear the checkpoint of the run in the
+                        store to start it over
 
         Returns:
-                bool: True if processing was successful, False otherwise
+                bool: True if processing was successful, False otherwise, or
+                        the ProcessingReport of the run with ``with_report``
+
+        Raises:
+                ValueError: If ``incremental`` or ``checkpoint`` is set without an
+                        ``order_state_store``, or ``checkpoint`` without a ``run_id``
         """
+        run_checkpoint = None
+        fingerprints = None
+        if checkpoint:
+            if cls.order_state_store is None or run_id is None:
+                raise ValueError("Checkpointing needs an order_state_store and a run_id")
+            from services.processing_checkpoint import ProcessingCheckpoint
+
+            run_checkpoint = ProcessingCheckpoint(cls.order_state_store, run_id)
+            orders = run_checkpoint.resume(orders)
+
+        if incremental:
+            if cls.order_state_store is None:
+                raise ValueError("Incremental processing needs an order_state_store")
+            from services.fingerprint_recorder import FingerprintRecorder
+
+            # Fingerprints are saved as orders are persisted, so a failed run only retries what it didn't persist
+            fingerprints = FingerprintRecorder(cls.order_state_store)
+            orders = cls._skip_unchanged_orders(
+                orders, force, fingerprints, stats or IncrementalStats(), run_checkpoint
+            )
+
+        report = ProcessingReport() if with_report else None
+        start = time.perf_counter()
+        export_writer = None
+        type_b_dispatcher = None
         try:
+            type_a_batch = []
+            # Updates waiting for a bulk write, or None to update each order directly
+            pending_updates = [] if db_batch_size else None
+            finalize = partial(
+                cls._finalize_order,
+                pending_updates=pending_updates,
+                db_batch_size=db_batch_size,
+                report=report,
+                checkpoint=run_checkpoint,
+                fingerprints=fingerprints,
+            )
+            if max_workers or api_batch_size:
+                type_b_dispatcher = _TypeBDispatcher(cls, max_workers, api_batch_size, finalize)
+
+            handlers = cls.rule_table.handlers
             for order in orders:
-                if order.type == OrderType.A:
-                    cls.process_type_a_orders(order, user_id)
+                handler = handlers.get(order.type)
+                if handler is None:
+                    order.status = OrderStatus.UNKNOWN_TYPE
 
-                elif order.type == OrderType.B:
-                    cls.process_type_b_orders(order)
+                elif handler == OrderHandler.TYPE_A and (background_export or batch_export):
+                    if background_export:
+                        try:
+                            rows = cls._build_type_a_rows(order)
+                        except Exception:
+                            order.status = OrderStatus.PROCESSING_ERROR
+                            finalize(order)
+                            continue
+                        if export_writer is None:
+                            export_writer = cls._open_export_writer(user_id, run_id)
+                        # Keyed by position so that failed flushes map back to their orders
+                        export_writer.write(rows, key=len(type_a_batch))
+                        type_a_batch.append(order)
+                        continue
+                    # Priority and update are applied once the batch is exported
+                    type_a_batch.append(order)
+                    continue
 
-                elif order.type == OrderType.C:
-                    cls.process_type_c_orders(order)
+                elif handler == OrderHandler.TYPE_B and type_b_dispatcher is not None:
+                    type_b_dispatcher.add(order)
+                    continue
 
                 else:
-                    order.status = OrderStatus.UNKNOWN_TYPE
+                    cls._call_handler(handler, order, user_id, run_id)
 
-                # Set priority based on amount
-                if order.amount > OrderAmountThreshold.PRIORITY_THRESHOLD:
-                    order.priority = OrderPriority.HIGH
-                else:
-                    order.priority = OrderPriority.LOW
+                finalize(order)
 
-                # Attempt to update the order in the database
-                try:
-                    cls.update_order(order)
-                except DatabaseException:
-                    order.status = OrderStatus.DB_ERROR  # Use enum for consistency
+            if type_b_dispatcher is not None:
+                type_b_dispatcher.drain()
+
+            if export_writer is not None:
+                failed = cls._timed(Stage.EXPORT, export_writer.close)
+                for index, order in enumerate(type_a_batch):
+                    order.status = OrderStatus.EXPORT_FAILED if index in failed else OrderStatus.EXPORTED
+            elif type_a_batch:
+                cls.process_type_a_orders_batch(type_a_batch, user_id, run_id)
+
+            for order in type_a_batch:
+                finalize(order)
+
+            if pending_updates:
+                cls.update_orders(pending_updates, db_batch_size)
+                cls._record_orders(pending_updates, report, run_checkpoint, fingerprints)
 
-            return True
+            success = True
         except Exception:
-            return False
+            success = False
+        finally:
+            if type_b_dispatcher is not None:
+                type_b_dispatcher.close()
+            if export_writer is not None:
+                export_writer.close()
+            if run_checkpoint is not None:
+                run_checkpoint.save()
+            if fingerprints is not None:
+                fingerprints.save()
+
+        if report is None:
+            return success
+        report.success = success
+        report.elapsed = time.perf_counter() - start
+        return report
 
     @classmethod
-    def process_type_a_orders(cls, order: Order, user_id: int) -> Order:
-        """Process orders of type A."""
-        csv_file = f"orders_type_A_{user_id}_{int(time.time())}.csv"
+    def _skip_unchanged_orders(
+        cls,
+        orders: Iterable[Order],
+        force: bool,
+        fingerprints: "FingerprintRecorder",
+        stats: IncrementalStats,
+        checkpoint: "ProcessingCheckpoint" = None,
+    ) -> Iterator[Order]:
+        """Yield the orders whose fingerprint differs from the stored one.
+
+        Fingerprints are looked up one chunk of orders at a time, and every
+        yielded order that can be fingerprinted is tracked by ``fingerprints``
+        until it is persisted. Skipped orders are committed to ``checkpoint``
+        right away.
+        """
+        store = cls.order_state_store
+        orders = iter(orders)
+        while True:
+            chunk = list(islice(orders, DEFAULT_STATE_STORE_CHUNK_SIZE))
+            if not chunk:
+                return
+
+            stored = {} if force else store.get_fingerprints([order.id for order in chunk])
+            for order in chunk:
+                try:
+                    fingerprint = store.fingerprint(order)
+                except (TypeError, ValueError):
+                    # Orders whose inputs can't be fingerprinted are always processed and never saved
+                    stats.processed += 1
+                    yield order
+                    continue
+                if stored.get(order.id) == fingerprint:
+                    stats.skipped += 1
+                    if checkpoint is not None:
+                        checkpoint.commit([order])
+                    continue
+                stats.processed += 1
+                fingerprints.track(order, fingerprint)
+                yield order
+
+    @classmethod
+    def _finalize_order(
+        cls,
+        order: Order,
+        pending_updates: List[Order] = None,
+        db_batch_size: int = None,
+        report: ProcessingReport = None,
+        checkpoint: "ProcessingCheckpoint" = None,
+        fingerprints: "FingerprintRecorder" = None,
+    ) -> Order:
+        """Set the priority of a handled order and persist it.
+
+        When ``pending_updates`` is given the update is queued instead, and
+        the queue is written in bulk once it holds ``db_batch_size`` orders.
+        """
+        try:
+            order.priority = cls.rule_table["priority"](order)
+        except Exception:
+            order.status = OrderStatus.PROCESSING_ERROR
+
+        if pending_updates is not None:
+            pending_updates.append(order)
+            if len(pending_updates) >= db_batch_size:
+                cls.update_orders(pending_updates, db_batch_size)
+                cls._record_orders(pending_updates, report, checkpoint, fingerprints)
+                pending_updates.clear()
+            return order
+
+        # Attempt to update the order in the database
+        try:
+            cls._timed(Stage.UPDATE, cls.update_order, order)
+        except DatabaseException:
+            order.status = OrderStatus.DB_ERROR  # Use enum for consistency
+        except Exception:
+            order.status = OrderStatus.PROCESSING_ERROR
+
+        cls._record_orders([order], report, checkpoint, fingerprints)
 
+        return order
+
+    @classmethod
+    def _call_handler(cls, handler: str, order: Order, user_id: int = None, run_id: str = None) -> Order:
+        """Call the named handler on an order, marking the order PROCESSING_ERROR if it raises."""
         try:
-            columns = ["ID", "Type", "Amount", "Is Special", "Status", "Priority"]
-            data = [
-                columns,
-                [
-                    order.id,
-                    order.type,
-                    order.amount,
-                    str(order.is_special).lower(),
-                    order.status,
-                    order.priority,
-                ],
+            return getattr(cls, handler)(order, user_id, run_id)
+        except Exception:
+            order.status = OrderStatus.PROCESSING_ERROR
+            return order
+
+    @classmethod
+    def _build_type_a_rows(cls, order: Order) -> List[list]:
+        """Build the rows exported for a Type A order, without the header."""
+        rows = [
+            [
+                order.id,
+                order.type,
+                order.amount,
+                str(order.is_special).lower(),
+                order.status,
+                order.priority,
             ]
+        ]
+
+        if order.amount > OrderAmountThreshold.HIGH_VALUE_ORDER_THRESHOLD:
+            rows.append(["", "", "", "", "Note", "High value order"])
 
-            if order.amount > OrderAmountThreshold.HIGH_VALUE_ORDER_THRESHOLD:
-                data.append(["", "", "", "", "Note", "High value order"])
-            CSVExporter.export(csv_file, data, columns=columns)
+        return rows
+
+    @classmethod
+    def process_type_a_orders(cls, order: Order, user_id: int, run_id: str = None) -> Order:
+        """Process orders of type A."""
+        exporter = BaseExporter.get_exporter(cls.export_format)
+        if run_id is None:
+            export_file = f"orders_type_A_{user_id}_{int(time.time())}{exporter.extension}"
+        else:
+            export_file = f"orders_type_A_{user_id}_{run_id}_{order.id}{exporter.extension}"
+
+        try:
+            data = cls._build_type_a_rows(order)
+            cls._timed(Stage.EXPORT, exporter.export, data, export_file, columns=TYPE_A_EXPORT_COLUMNS)
 
             order.status = OrderStatus.EXPORTED
         except IOError:
@@ -134,37 +819,430 @@ class OrderService:
         return order
 
     @classmethod
-    def process_type_b_orders(cls, order: Order) -> Order:
+    def process_type_a_orders_batch(
+        cls, orders: List[Order], user_id: int, run_id: str = None
+    ) -> List[Order]:
+        """Export a batch of Type A orders into a single file in ``export_format``.
+
+        Every order of the batch is marked EXPORTED when the file is written,
+        EXPORT_FAILED when the export raises an IOError, or PROCESSING_ERROR
+        when it raises anything else. An order whose rows can't be built is
+        left out of the file and marked PROCESSING_ERROR on its own.
+
+        Args:
+                orders (List[Order]): Type A orders to be exported
+                user_id (int): ID of the user owning the orders
+                run_id (str): ID of the processing run, used to name the file
+
+        Returns:
+                List[Order]: The processed orders
+        """
+        exporter = BaseExporter.get_exporter(cls.export_format)
+        export_file = cls._run_export_path(exporter, user_id, run_id)
+        invalid = set()
+
+        def rows():
+            # Rows are streamed to the exporter rather than built up front
+            for order in orders:
+                try:
+                    order_rows = cls._build_type_a_rows(order)
+                except Exception:
+                    invalid.add(id(order))
+                    continue
+                yield from order_rows
+
+        try:
+            cls._timed(Stage.EXPORT, exporter.export, rows(), export_file, columns=TYPE_A_EXPORT_COLUMNS)
+            status = OrderStatus.EXPORTED
+        except IOError:
+            status = OrderStatus.EXPORT_FAILED
+        except Exception:
+            status = OrderStatus.PROCESSING_ERROR
+
+        for order in orders:
+            order.status = OrderStatus.PROCESSING_ERROR if id(order) in invalid else status
+
+        return orders
+
+    @classmethod
+    def _run_export_path(cls, exporter: type, user_id: int, run_id: str = None) -> str:
+        """Return the path of the file holding every Type A order of a run."""
+        if run_id is None:
+            import uuid
+
+            # Unique suffix so that runs started within the same second don't overwrite each other
+            run_id = f"{int(time.time())}_{uuid.uuid4().hex[:8]}"
+        return f"orders_type_A_{user_id}_{run_id}{exporter.extension}"
+
+    @classmethod
+    def _open_export_writer(cls, user_id: int, run_id: str = None) -> "BackgroundExportWriter":
+        """Start a background writer exporting the Type A orders of a run."""
+        from utils.exporters.background_export_writer import BackgroundExportWriter
+
+        exporter = BaseExporter.get_exporter(cls.export_format)
+        return BackgroundExportWriter(
+            exporter, cls._run_export_path(exporter, user_id, run_id), columns=TYPE_A_EXPORT_COLUMNS
+        )
+
+    @classmethod
+    def process_type_b_orders(cls, order: Order, user_id: int = None, run_id: str = None) -> Order:
         """Process orders of type B."""
         try:
-            api_client = OrderAPIClient()
-            api_response = api_client.call_api(order.id)
-
-            if api_response.status == APIStatus.SUCCESS:
-                if (
-                    api_response.data >= ORDER_API_RESPONSE_THRESHOLD
-                    and order.amount < OrderAmountThreshold.PROCESSED_ORDER_THRESHOLD
-                ):
-                    order.status = OrderStatus.PROCESSED
-                elif (
-                    api_response.data < ORDER_API_RESPONSE_THRESHOLD or order.is_special
-                ):
-                    order.status = OrderStatus.PENDING
-                else:
-                    order.status = OrderStatus.ERROR
-            else:
-                order.status = OrderStatus.API_ERROR
+            api_client = cls.get_api_client()
+            api_response = cls._timed(Stage.API, api_client.call_api, order.id)
+            cls._apply_api_response(order, api_response)
         except APIException:
             order.status = OrderStatus.API_FAILURE
 
         return order
 
     @classmethod
-    def process_type_c_orders(cls, order: Order) -> Order:
-        """Process orders of type C."""
-        if order.is_special:
-            order.status = OrderStatus.COMPLETED
+    def _apply_api_response(cls, order: Order, api_response: APIResponse) -> Order:
+        """Set the status of a Type B order from its API response."""
+        order.status = cls.rule_table["type_b_status"](order, api_response)
+        return order
+
+    @classmethod
+    def process_type_b_orders_batch(
+        cls,
+        orders: List[Order],
+        chunk_size: int = DEFAULT_API_BATCH_SIZE,
+        max_workers: int = None,
+    ) -> List[Order]:
+        """Process Type B orders through the bulk API endpoint.
+
+        Orders are sent in chunks of ``chunk_size`` ids. A failing chunk only
+        marks its own orders API_FAILURE, or PROCESSING_ERROR when the call
+        raises anything but an APIException, and an order missing from the
+        batch response is marked API_FAILURE as well.
+
+        Args:
+                orders (List[Order]): Type B orders to be processed
+                chunk_size (int): Number of order ids per batch call
+                max_workers (int): Send up to this many chunks concurrently
+
+        Returns:
+                List[Order]: The processed orders
+        """
+        chunks = [orders[i : i + chunk_size] for i in range(0, len(orders), chunk_size)]
+
+        if max_workers:
+            from concurrent.futures import ThreadPoolExecutor
+
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                list(executor.map(cls._process_type_b_chunk, chunks))
         else:
-            order.status = OrderStatus.IN_PROGRESS
+            for chunk in chunks:
+                cls._process_type_b_chunk(chunk)
+
+        return orders
+
+    @classmethod
+    def _process_type_b_chunk(cls, orders: List[Order]) -> List[Order]:
+        """Process a single chunk of Type B orders with one batch API call."""
+        try:
+            api_client = cls.get_api_client()
+            api_responses = cls._timed(Stage.API, api_client.call_api_batch, [order.id for order in orders])
+        except APIException:
+            for order in orders:
+                order.status = OrderStatus.API_FAILURE
+            return orders
+        except Exception:
+            for order in orders:
+                order.status = OrderStatus.PROCESSING_ERROR
+            return orders
+
+        for order in orders:
+            api_response = api_responses.get(order.id)
+            if api_response is None:
+                order.status = OrderStatus.API_FAILURE
+                continue
+            try:
+                cls._apply_api_response(order, api_response)
+            except Exception:
+                order.status = OrderStatus.PROCESSING_ERROR
+
+        return orders
 
+    @classmethod
+    def process_type_b_orders_concurrently(
+        cls, orders: List[Order], max_workers: int
+    ) -> List[Order]:
+        """Process Type B orders with their API calls dispatched on a thread pool.
+
+        An order whose processing raises an unexpected exception is marked
+        PROCESSING_ERROR without affecting the others.
+
+        Args:
+                orders (List[Order]): Type B orders to be processed
+                max_workers (int): Maximum number of concurrent API calls
+
+        Returns:
+                List[Order]: The processed orders
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            list(executor.map(partial(cls._call_handler, OrderHandler.TYPE_B), orders))
+
+        return orders
+
+    @classmethod
+    def process_type_c_orders(cls, order: Order, user_id: int = None, run_id: str = None) -> Order:
+        """Process orders of type C."""
+        order.status = cls.rule_table["type_c_status"](order)
         return order
+
+    @classmethod
+    def enqueue_orders(cls, orders: Iterable[Order]) -> int:
+        """Add orders to ``order_queue`` with the priority ``rule_table`` decides for them.
+
+        Args:
+                orders (Iterable[Order]): Orders to be processed by the queue workers
+
+        Returns:
+                int: Number of orders enqueued
+        """
+        decide_priority = cls.rule_table["priority"]
+        return cls.order_queue.enqueue((order, decide_priority(order)) for order in orders)
+
+    @classmethod
+    def process_order_queue(
+        cls,
+        workers: int = 1,
+        user_id: int = None,
+        run_id: str = None,
+        lease_size: int = DEFAULT_QUEUE_LEASE_SIZE,
+        lease_seconds: float = DEFAULT_QUEUE_LEASE_SECONDS,
+        idle_timeout: float = 0.0,
+        stop: threading.Event = None,
+        max_attempts: int = DEFAULT_QUEUE_MAX_ATTEMPTS,
+        retry_delay: float = DEFAULT_QUEUE_RETRY_DELAY,
+    ) -> OrderQueueStats:
+        """Drain ``order_queue`` with worker threads.
+
+        Each worker repeatedly leases up to ``lease_size`` orders, HIGH
+        priority ones first, processes them with ``process_orders`` and
+        acknowledges them. Small leases keep a HIGH order that arrives while
+        the queue is saturated from waiting behind more than one lease of LOW
+        orders per worker. Orders left in a failed status, or every order of
+        a lease whose run fails, are released back to the queue, and can't
+        be leased again before a delay that doubles with every attempt. After
+        ``max_attempts`` leases a failing order is moved to the dead letters
+        of the queue instead. The orders of a worker that died are handed out
+        again once their lease expires, so every order is processed at least
+        once.
+
+        Args:
+                workers (int): Number of worker threads, each starting its
+                        leases from a different shard
+                user_id (int): ID of the user owning the orders, if any
+                run_id (str): ID of the processing run, used to name export files
+                lease_size (int): Maximum number of orders per lease
+                lease_seconds (float): Time after which the orders of a lease
+                        that was not acknowledged are handed out again
+                idle_timeout (float): Stop a worker once the queue stayed empty
+                        for this many seconds, or only when ``stop`` is set if
+                        None; orders waiting for a retry or leased by another
+                        worker keep the queue from being empty
+                stop (threading.Event): Set to stop the workers after their
+                        current lease
+                max_attempts (int): Number of leases after which a failing
+                        order is dead-lettered
+                retry_delay (float): Seconds before an order that failed its
+                        first attempt may be leased again, doubled for every
+                        further attempt
+
+        Returns:
+                OrderQueueStats: Throughput and latencies per priority
+
+        Raises:
+                ValueError: If no ``order_queue`` is configured
+        """
+        if cls.order_queue is None:
+            raise ValueError("Queue-driven processing needs an order_queue")
+
+        stats = OrderQueueStats()
+        stop = stop or threading.Event()
+        options = (user_id, run_id, lease_size, lease_seconds, idle_timeout, stop, max_attempts, retry_delay, stats)
+        threads = [
+            threading.Thread(
+                target=cls._drain_order_queue, args=(worker % cls.order_queue.shards, *options), daemon=True
+            )
+            for worker in range(workers)
+        ]
+
+        start = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        stats.elapsed = time.perf_counter() - start
+
+        return stats
+
+    @classmethod
+    def _drain_order_queue(
+        cls,
+        shard: int,
+        user_id: int,
+        run_id: str,
+        lease_size: int,
+        lease_seconds: float,
+        idle_timeout: float,
+        stop: threading.Event,
+        max_attempts: int,
+        retry_delay: float,
+        stats: OrderQueueStats,
+    ) -> None:
+        """Worker loop of ``process_order_queue``, leasing from ``shard`` first."""
+        queue = cls.order_queue
+        idle_since = None
+
+        while not stop.is_set():
+            entries = queue.lease(shard, lease_size, lease_seconds)
+            if not entries:
+                now = time.monotonic()
+                if idle_since is None:
+                    idle_since = now
+                if idle_timeout is not None and now - idle_since >= idle_timeout and not len(queue):
+                    return
+                stop.wait(DEFAULT_QUEUE_POLL_INTERVAL)
+                continue
+
+            idle_since = None
+            report = cls.process_orders([entry.order for entry in entries], user_id, run_id=run_id, with_report=True)
+
+            done, retried, dead_lettered = [], [], []
+            for entry in entries:
+                if report.success and entry.order.status not in ProcessingReport.FAILED_STAGES:
+                    done.append(entry)
+                elif entry.attempts < max_attempts:
+                    retried.append(entry)
+                else:
+                    if not report.success:
+                        # The run stopped before settling the order
+                        entry.order.status = OrderStatus.PROCESSING_ERROR
+                    dead_lettered.append(entry)
+
+            if done:
+                queue.ack(done)
+            if dead_lettered:
+                queue.dead_letter(dead_lettered)
+            if done or dead_lettered:
+                stats.add(done + dead_lettered, time.time(), dead_lettered)
+            if retried:
+                queue.release(retried, retry_delay)
+                stats.add_retries(retried)
+
+    @classmethod
+    def process_user_with_counts(
+        cls, user_id: int, page_size: int = None, **options
+    ) -> Tuple[bool, Dict[str, int]]:
+        """Process the orders of a user and count them by resulting status.
+
+        Args:
+                user_id (int): ID of the user
+                page_size (int): Stream the orders one page of this size at a time
+                **options: Processing options forwarded to ``process_orders``
+
+        Returns:
+                Tuple[bool, Dict[str, int]]: Whether processing succeeded, and
+                        the number of orders per resulting OrderStatus
+        """
+        try:
+            if page_size:
+                orders = cls.iter_orders_by_user(user_id, page_size)
+            else:
+                orders = cls.fetch_orders_by_user(user_id)
+            report = cls.process_orders(orders or [], user_id, with_report=True, **options)
+        except DatabaseException:
+            report = ProcessingReport(success=False)
+
+        return report.success, dict(report.status_counts)
+
+    @classmethod
+    def process_users(
+        cls,
+        user_ids: Iterable[int],
+        workers: int = None,
+        initializer=None,
+        initargs: tuple = (),
+        **options,
+    ) -> UserBatchResult:
+        """Process the orders of several users, sharded across worker processes.
+
+        Every user is processed by ``process_user_with_counts`` in a process
+        pool. A worker crash breaks the whole pool, so the users it didn't
+        finish are processed again: the few that were running or about to
+        run when it crashed one at a time, to find the one that crashes its
+        worker, and the others on a new pool of the same size. Only the user
+        that crashes its worker is reported as failed. All export files of
+        the call share one run ID instead of depending on the current time.
+
+        Args:
+                user_ids (Iterable[int]): IDs of the users
+                workers (int): Number of worker processes, defaults to the
+                        number of CPUs
+                initializer (callable): Called in every worker process on start,
+                        e.g. to configure the API client or order repository
+                initargs (tuple): Arguments passed to ``initializer``
+                **options: Processing options forwarded to ``process_orders``
+
+        Returns:
+                UserBatchResult: Success per user and order counts per status
+        """
+        import os
+        import uuid
+
+        user_ids = list(dict.fromkeys(user_ids))
+        options.setdefault("run_id", uuid.uuid4().hex)
+        result = UserBatchResult()
+        # Users are started in submission order, and the pool queues one call
+        # beyond its workers, so only that many unfinished users can be at fault
+        suspect_count = (workers or os.cpu_count() or 1) + 1
+
+        remaining = user_ids
+        while remaining:
+            crashed = cls._run_user_pool(remaining, workers, initializer, initargs, options, result)
+            suspects, remaining = crashed[:suspect_count], crashed[suspect_count:]
+            for user_id in suspects:
+                if cls._run_user_pool([user_id], 1, initializer, initargs, options, result):
+                    result.success[user_id] = False
+
+        return result
+
+    @classmethod
+    def _run_user_pool(
+        cls,
+        user_ids: List[int],
+        workers: int,
+        initializer,
+        initargs: tuple,
+        options: dict,
+        result: UserBatchResult,
+    ) -> List[int]:
+        """Process users on a fresh process pool and return the users lost to a worker crash."""
+        from concurrent.futures import ProcessPoolExecutor
+        from concurrent.futures.process import BrokenProcessPool
+
+        crashed = []
+
+        with ProcessPoolExecutor(max_workers=workers, initializer=initializer, initargs=initargs) as executor:
+            futures = {
+                user_id: executor.submit(_process_user_in_worker, cls, user_id, options)
+                for user_id in user_ids
+            }
+            for user_id, future in futures.items():
+                try:
+                    success, status_counts = future.result()
+                except BrokenProcessPool:
+                    crashed.append(user_id)
+                    continue
+                except Exception:
+                    success, status_counts = False, {}
+
+                result.success[user_id] = success
+                result.status_counts.update(status_counts)
+
+        return crashed
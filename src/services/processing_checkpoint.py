@@ -0,0 +1,67 @@
+from itertools import islice
+from typing import TYPE_CHECKING, Iterable, Iterator
+
+from constants.constants import DEFAULT_CHECKPOINT_INTERVAL
+from models.order_model import Order
+
+if TYPE_CHECKING:
+    from repositories.sqlite_order_state_store import SQLiteOrderStateStore
+
+
+class ProcessingCheckpoint:
+    """Resumable position of a run in its input orders.
+
+    Orders are numbered by their offset in the input as they are taken from
+    it, and committed once their final status is persisted. Deferred and
+    bulk-written orders settle out of input order, so the checkpoint is the
+    lowest offset that is not committed yet: every order before it is done,
+    and a rerun can skip them. Orders committed past the checkpoint are
+    processed again by a rerun.
+
+    Attributes:
+            store (SQLiteOrderStateStore): Store the checkpoint is kept in
+            run_id (str): ID of the run the checkpoint belongs to
+            offset (int): Offset of the first order that is not committed
+            interval (int): Save the checkpoint each time it advanced by this
+                    many orders
+    """
+
+    def __init__(
+        self, store: "SQLiteOrderStateStore", run_id: str, interval: int = DEFAULT_CHECKPOINT_INTERVAL
+    ) -> None:
+        self.store = store
+        self.run_id = run_id
+        self.interval = interval
+        self.offset = self._saved_offset = store.get_checkpoint(run_id)
+        self._next_offset = self.offset
+        # Offsets of the orders taken from the input and not committed yet, by object identity
+        self._pending = {}
+        # Committed offsets past the checkpoint, waiting for the orders before them
+        self._committed = set()
+
+    def resume(self, orders: Iterable[Order]) -> Iterator[Order]:
+        """Yield the orders from the checkpoint on, numbering them by their input offset."""
+        for order in islice(orders, self.offset, None):
+            self._pending[id(order)] = self._next_offset
+            self._next_offset += 1
+            yield order
+
+    def commit(self, orders: Iterable[Order]) -> None:
+        """Mark orders as persisted, advancing and periodically saving the checkpoint."""
+        for order in orders:
+            offset = self._pending.pop(id(order), None)
+            if offset is not None:
+                self._committed.add(offset)
+
+        while self.offset in self._committed:
+            self._committed.remove(self.offset)
+            self.offset += 1
+
+        if self.offset - self._saved_offset >= self.interval:
+            self.save()
+
+    def save(self) -> None:
+        """Store the checkpoint if it advanced since it was last saved."""
+        if self.offset != self._saved_offset:
+            self.store.save_checkpoint(self.run_id, self.offset)
+            self._saved_offset = self.offset
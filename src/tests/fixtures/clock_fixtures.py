@@ -0,0 +1,8 @@
+class FakeClock:
+    """Clock returning ``now``, which tests move forward by hand."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
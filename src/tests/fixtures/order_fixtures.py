@@ -1,5 +1,9 @@
+import random
+
 from models.order_model import Order
-from constants.constants import OrderType, OrderPriority
+from constants.constants import OrderType, OrderPriority, OrderAmountThreshold
+
+RANDOM_ORDER_TYPES = (OrderType.A, OrderType.B, OrderType.C, "INVALID_TYPE")
 
 
 def get_valid_order_fixture():
@@ -17,3 +21,23 @@ def get_high_priority_order_fixture():
 def get_invalid_type_order_fixture():
     """Returns an order with an invalid OrderType."""
     return Order(id=3, type="INVALID_TYPE", amount=50.0, is_special=False)
+
+
+def build_random_orders(seed, count, order_types=RANDOM_ORDER_TYPES):
+    """Returns ``count`` seeded random orders, with amounts biased towards the thresholds and their boundaries."""
+    rng = random.Random(seed)
+    thresholds = [
+        OrderAmountThreshold.PROCESSED_ORDER_THRESHOLD,
+        OrderAmountThreshold.HIGH_VALUE_ORDER_THRESHOLD,
+        OrderAmountThreshold.PRIORITY_THRESHOLD,
+        OrderAmountThreshold.PRIORITY_THRESHOLD + 0.01,
+    ]
+    return [
+        Order(
+            id=i,
+            type=rng.choice(order_types),
+            amount=rng.choice(thresholds + [rng.uniform(0, 2 * OrderAmountThreshold.PRIORITY_THRESHOLD)]),
+            is_special=rng.random() < 0.5,
+        )
+        for i in range(1, count + 1)
+    ]
@@ -0,0 +1,47 @@
+import unittest
+
+from constants.constants import OrderStatus, OrderPriority, OrderType
+from models.order_batch import OrderBatch, ORDER_TYPES
+from tests.fixtures.order_fixtures import (
+    get_valid_order_fixture,
+    get_high_priority_order_fixture,
+    get_invalid_type_order_fixture,
+)
+
+
+class TestOrderBatch(unittest.TestCase):
+    def setUp(self):
+        self.orders = [
+            get_valid_order_fixture(),
+            get_high_priority_order_fixture(),
+            get_invalid_type_order_fixture(),
+        ]
+        self.batch = OrderBatch.from_orders(self.orders)
+
+    def test_should_round_trip_orders_when_converted_to_batch_and_back(self):
+        restored = self.batch.to_orders()
+
+        self.assertEqual(len(self.batch), 3)
+        for original, order in zip(self.orders, restored):
+            self.assertEqual(
+                (order.id, order.type, order.amount, order.is_special, order.status, order.priority),
+                (original.id, original.type, original.amount, original.is_special, original.status, original.priority),
+            )
+
+    def test_should_store_codes_when_orders_are_appended(self):
+        self.assertEqual(ORDER_TYPES[self.batch.type_codes[1]], OrderType.B)
+        self.assertEqual(self.batch.type_codes[2], len(ORDER_TYPES))
+        self.assertEqual(self.batch.priority(1), OrderPriority.HIGH)
+        self.assertEqual(list(self.batch.is_special), [0, 1, 0])
+
+    def test_should_update_status_and_priority_when_setters_are_called(self):
+        self.batch.set_status(0, OrderStatus.EXPORTED)
+        self.batch.set_priority(0, OrderPriority.HIGH)
+
+        self.assertEqual(self.batch[0].status, OrderStatus.EXPORTED)
+        self.assertEqual(self.batch[0].priority, OrderPriority.HIGH)
+        self.assertEqual(self.orders[0].status, OrderStatus.NEW)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -15,6 +15,11 @@ class TestOrderModel(unittest.TestCase):
         self.assertEqual(self.order.status, OrderStatus.NEW)
         self.assertEqual(self.order.priority, OrderPriority.LOW)
 
+    def test_should_not_have_instance_dict_when_order_uses_slots(self):
+        self.assertFalse(hasattr(self.order, "__dict__"))
+        with self.assertRaises(AttributeError):
+            self.order.unknown_attribute = True
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,119 @@
+import time
+
+from constants.constants import DEFAULT_QUEUE_MAX_RETRY_DELAY, OrderPriority, OrderStatus, OrderType
+from models.order_model import Order
+
+
+def build_order(order_id, amount=10.0):
+    return Order(id=order_id, type=OrderType.C, amount=amount, is_special=False)
+
+
+class OrderQueueCases:
+    """Cases every order queue backend passes, mixed into a TestCase defining ``make_queue``."""
+
+    def test_should_lease_high_priority_orders_first_when_low_orders_were_enqueued_earlier(self):
+        queue = self.make_queue(shards=2)
+        queue.enqueue((build_order(order_id), OrderPriority.LOW) for order_id in range(1, 5))
+        queue.enqueue([(build_order(5, 300.0), OrderPriority.HIGH), (build_order(6, 300.0), OrderPriority.HIGH)])
+
+        leased = queue.lease(0, 3, 30.0)
+
+        self.assertEqual([entry.order.id for entry in leased], [6, 5, 2])
+        self.assertEqual(
+            [entry.priority for entry in leased], [OrderPriority.HIGH, OrderPriority.HIGH, OrderPriority.LOW]
+        )
+        self.assertEqual(leased[1].order.amount, 300.0)
+
+    def test_should_remove_orders_when_lease_is_acknowledged(self):
+        queue = self.make_queue()
+        queue.enqueue((build_order(order_id), OrderPriority.LOW) for order_id in range(1, 4))
+
+        leased = queue.lease(0, 2, 30.0)
+
+        self.assertEqual(queue.ack(leased), 2)
+        self.assertEqual(len(queue), 1)
+        self.assertEqual([entry.order.id for entry in queue.lease(0, 10, 30.0)], [3])
+
+    def test_should_hand_out_orders_again_when_lease_expires(self):
+        queue = self.make_queue()
+        queue.enqueue([(build_order(1), OrderPriority.LOW)])
+
+        expired = queue.lease(0, 1, 0.0)
+        time.sleep(0.01)
+        leased_again = queue.lease(0, 1, 30.0)
+
+        self.assertEqual([entry.order.id for entry in leased_again], [1])
+        # The holder of the expired lease can no longer acknowledge the order
+        self.assertEqual(queue.ack(expired), 0)
+        self.assertEqual(queue.ack(leased_again), 1)
+        self.assertEqual(len(queue), 0)
+
+    def test_should_lease_released_orders_again_right_away(self):
+        queue = self.make_queue()
+        queue.enqueue((build_order(order_id), OrderPriority.LOW) for order_id in range(1, 4))
+
+        leased = queue.lease(0, 2, 30.0)
+        self.assertEqual(queue.release(leased), 2)
+
+        self.assertEqual([entry.order.id for entry in queue.lease(0, 10, 30.0)], [1, 2, 3])
+
+    def test_should_not_lease_released_orders_again_before_retry_delay(self):
+        queue = self.make_queue()
+        queue.enqueue([(build_order(1), OrderPriority.LOW)])
+
+        queue.release(queue.lease(0, 1, 30.0), retry_delay=0.05)
+        delayed = queue.lease(0, 1, 30.0)
+        time.sleep(0.06)
+        leased_again = queue.lease(0, 1, 30.0)
+
+        self.assertEqual(delayed, [])
+        self.assertEqual([entry.order.id for entry in leased_again], [1])
+        self.assertEqual(len(queue), 1)
+
+    def test_should_double_retry_delay_with_every_attempt(self):
+        queue = self.make_queue()
+        queue.enqueue([(build_order(1), OrderPriority.LOW)])
+        entry = queue.lease(0, 1, 30.0)[0]
+
+        delays = []
+        for attempts in (1, 2, 3, 30):
+            entry.attempts = attempts
+            delays.append(queue.visible_at(entry, 100.0, 0.5) - 100.0)
+
+        self.assertEqual(delays, [0.5, 1.0, 2.0, DEFAULT_QUEUE_MAX_RETRY_DELAY])
+        self.assertEqual(queue.visible_at(entry, 100.0, 0.0), 100.0)
+
+    def test_should_keep_dead_lettered_orders_for_inspection(self):
+        queue = self.make_queue()
+        queue.enqueue((build_order(order_id), OrderPriority.LOW) for order_id in range(1, 3))
+
+        expired = queue.lease(0, 1, 0.0)
+        time.sleep(0.01)
+        leased = queue.lease(0, 2, 30.0)
+        for entry in leased:
+            entry.order.status = OrderStatus.PROCESSING_ERROR
+
+        # The holder of the expired lease can no longer dead-letter the order
+        self.assertEqual(queue.dead_letter(expired), 0)
+        self.assertEqual(queue.dead_letter(leased), 2)
+        self.assertEqual(len(queue), 0)
+        self.assertEqual(queue.lease(0, 10, 30.0), [])
+        dead_letters = queue.dead_letters()
+        self.assertEqual([(entry.order.id, entry.attempts) for entry in dead_letters], [(1, 2), (2, 1)])
+        self.assertEqual({entry.order.status for entry in dead_letters}, {OrderStatus.PROCESSING_ERROR})
+        self.assertEqual({entry.lease_id for entry in dead_letters}, {None})
+
+    def test_should_count_attempts_when_orders_are_leased_again(self):
+        queue = self.make_queue()
+        queue.enqueue([(build_order(1), OrderPriority.LOW)])
+
+        queue.release(queue.lease(0, 1, 30.0))
+        queue.release(queue.lease(0, 1, 30.0))
+
+        self.assertEqual([entry.attempts for entry in queue.lease(0, 1, 30.0)], [3])
+
+    def test_should_raise_value_error_when_priority_is_unknown(self):
+        queue = self.make_queue()
+
+        with self.assertRaises(ValueError):
+            queue.enqueue([(build_order(1), "urgent")])
@@ -0,0 +1,13 @@
+import unittest
+
+from repositories.in_memory_order_queue import InMemoryOrderQueue
+from tests.repositories.order_queue_cases import OrderQueueCases
+
+
+class TestInMemoryOrderQueue(OrderQueueCases, unittest.TestCase):
+    def make_queue(self, shards=1):
+        return InMemoryOrderQueue(shards=shards)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,32 @@
+import os
+import tempfile
+import unittest
+
+from constants.constants import OrderPriority
+from repositories.sqlite_order_queue import SQLiteOrderQueue
+from tests.repositories.order_queue_cases import OrderQueueCases, build_order
+
+
+class TestSQLiteOrderQueue(OrderQueueCases, unittest.TestCase):
+    def make_queue(self, shards=1):
+        queue = SQLiteOrderQueue(shards=shards)
+        self.addCleanup(queue.close)
+        return queue
+
+    def test_should_share_queue_when_another_connection_opens_the_same_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "queue.db")
+            producer = SQLiteOrderQueue(path)
+            consumer = SQLiteOrderQueue(path)
+            producer.enqueue([(build_order(1), OrderPriority.LOW), (build_order(2, 300.0), OrderPriority.HIGH)])
+
+            first = consumer.lease(0, 1, 30.0)
+            second = producer.lease(0, 1, 30.0)
+            producer.close()
+            consumer.close()
+
+        self.assertEqual([entry.order.id for entry in first + second], [2, 1])
+
+
+if __name__ == "__main__":
+    unittest.main()
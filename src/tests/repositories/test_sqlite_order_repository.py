@@ -0,0 +1,64 @@
+import unittest
+
+from constants.constants import OrderStatus, OrderPriority, OrderType
+from models.order_model import Order
+from repositories.sqlite_order_repository import SQLiteOrderRepository
+from utils.exceptions.database_exception import DatabaseException
+
+
+class TestSQLiteOrderRepository(unittest.TestCase):
+    def setUp(self):
+        self.repository = SQLiteOrderRepository()
+        self.orders = [Order(id=i, type=OrderType.A, amount=10.0 * i, is_special=False) for i in range(1, 5)]
+        self.repository.insert_orders(self.orders, user_id=1)
+
+    def tearDown(self):
+        self.repository.close()
+
+    def _stored_statuses(self):
+        return [row[0] for row in self.repository.connection.execute("SELECT status FROM orders ORDER BY id")]
+
+    def test_should_write_every_order_when_orders_are_updated_in_bulk(self):
+        # Setup
+        for order in self.orders:
+            order.status = OrderStatus.EXPORTED
+            order.priority = OrderPriority.HIGH
+
+        # Execute
+        updated = self.repository.update_orders(self.orders)
+
+        # Assert
+        self.assertEqual(updated, 4)
+        self.assertEqual(self._stored_statuses(), [OrderStatus.EXPORTED] * 4)
+
+    def test_should_roll_back_chunk_when_one_row_fails(self):
+        # Setup
+        self.repository.connection.execute(
+            "CREATE TRIGGER reject_order BEFORE UPDATE ON orders WHEN NEW.id = 3 "
+            "BEGIN SELECT RAISE(ABORT, 'rejected'); END"
+        )
+        for order in self.orders:
+            order.status = OrderStatus.EXPORTED
+
+        # Execute / Assert
+        with self.assertRaises(DatabaseException):
+            self.repository.update_orders(self.orders)
+        self.assertEqual(self._stored_statuses(), [OrderStatus.NEW] * 4)
+
+    def test_should_return_orders_page_by_page_when_fetching_with_cursor(self):
+        # Setup
+        self.repository.insert_orders([Order(id=99, type=OrderType.B, amount=1.0, is_special=True)], user_id=2)
+
+        # Execute
+        first_page = self.repository.fetch_orders_page(1, limit=3)
+        second_page = self.repository.fetch_orders_page(1, after_id=first_page[-1].id, limit=3)
+
+        # Assert
+        self.assertEqual([order.id for order in first_page], [1, 2, 3])
+        self.assertEqual([order.id for order in second_page], [4])
+        self.assertEqual(second_page[0].amount, 40.0)
+        self.assertEqual(second_page[0].status, OrderStatus.NEW)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,49 @@
+import unittest
+
+from constants.constants import OrderStatus, OrderType
+from models.order_model import Order
+from repositories.sqlite_order_state_store import SQLiteOrderStateStore
+
+
+class TestSQLiteOrderStateStore(unittest.TestCase):
+    def setUp(self):
+        self.store = SQLiteOrderStateStore()
+
+    def tearDown(self):
+        self.store.close()
+
+    def test_should_change_fingerprint_when_an_input_changes(self):
+        order = Order(id=1, type=OrderType.A, amount=10.0, is_special=False)
+        fingerprint = self.store.fingerprint(order)
+
+        self.assertEqual(self.store.fingerprint(Order(id=2, type=OrderType.A, amount=10, is_special=0)), fingerprint)
+        for changed in [
+            Order(id=1, type=OrderType.B, amount=10.0, is_special=False),
+            Order(id=1, type=OrderType.A, amount=10.5, is_special=False),
+            Order(id=1, type=OrderType.A, amount=10.0, is_special=True),
+        ]:
+            self.assertNotEqual(self.store.fingerprint(changed), fingerprint)
+
+    def test_should_return_only_stored_fingerprints_when_many_ids_are_looked_up(self):
+        self.store.save_fingerprints((i, f"fp{i}", OrderStatus.EXPORTED) for i in range(0, 2000, 2))
+        self.store.forget_orders([0, 2])
+
+        fingerprints = self.store.get_fingerprints(list(range(2000)))
+
+        self.assertEqual(len(fingerprints), 998)
+        self.assertEqual(fingerprints[4], "fp4")
+        self.assertNotIn(0, fingerprints)
+        self.assertNotIn(3, fingerprints)
+
+    def test_should_keep_checkpoint_per_run_when_checkpoints_are_saved(self):
+        self.store.save_checkpoint("run-1", 10)
+        self.store.save_checkpoint("run-1", 25)
+        self.store.save_checkpoint("run-2", 5)
+        self.store.clear_checkpoint("run-2")
+
+        self.assertEqual(self.store.get_checkpoint("run-1"), 25)
+        self.assertEqual(self.store.get_checkpoint("run-2"), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,35 @@
+import unittest
+
+from constants.constants import APIStatus
+from responses.api_response import APIResponse
+from routers.base_api_client import BaseAPIClient
+from utils.exceptions.api_exception import APIException
+
+
+class StubAPIClient(BaseAPIClient):
+    def __init__(self):
+        self.calls = []
+
+    def call_api(self, order_id):
+        self.calls.append(order_id)
+        if order_id == 2:
+            raise APIException("Test API Exception")
+        return APIResponse(status=APIStatus.SUCCESS, data=order_id)
+
+
+class TestBaseAPIClient(unittest.TestCase):
+    def test_should_fall_back_to_single_calls_when_batch_endpoint_is_not_overridden(self):
+        # Setup
+        client = StubAPIClient()
+
+        # Execute
+        responses = client.call_api_batch([1, 2, 3])
+
+        # Assert
+        self.assertEqual(client.calls, [1, 2, 3])
+        self.assertEqual(sorted(responses), [1, 3])
+        self.assertEqual(responses[3].data, 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
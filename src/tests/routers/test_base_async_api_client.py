@@ -0,0 +1,26 @@
+import asyncio
+import unittest
+
+from constants.constants import APIStatus
+from responses.api_response import APIResponse
+from routers.base_async_api_client import BaseAsyncAPIClient
+from utils.exceptions.api_exception import APIException
+
+
+class StubAsyncAPIClient(BaseAsyncAPIClient):
+    async def call_api(self, order_id):
+        if order_id == 2:
+            raise APIException("Test exception")
+        return APIResponse(status=APIStatus.SUCCESS, data=order_id)
+
+
+class TestBaseAsyncAPIClient(unittest.TestCase):
+    def test_should_leave_out_failed_ids_when_default_batch_call_is_used(self):
+        responses = asyncio.run(StubAsyncAPIClient().call_api_batch([1, 2, 3]))
+
+        self.assertEqual(sorted(responses), [1, 3])
+        self.assertEqual(responses[3].data, 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,93 @@
+import unittest
+from unittest.mock import MagicMock
+
+from constants.constants import APIStatus, OrderStatus, OrderType
+from models.order_model import Order
+from responses.api_response import APIResponse
+from routers.cached_api_client import CachedAPIClient
+from services.order_service import OrderService
+from utils.exceptions.api_exception import APIException
+from tests.fixtures.clock_fixtures import FakeClock
+
+
+class TestCachedAPIClient(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        self.client = MagicMock()
+        self.client.call_api.side_effect = lambda order_id: APIResponse(APIStatus.SUCCESS, order_id)
+        self.cached = CachedAPIClient(self.client, max_size=2, ttl=10, negative_ttl=1, clock=self.clock)
+
+    def test_should_answer_from_cache_when_same_id_is_called_again(self):
+        first = self.cached.call_api(1)
+        second = self.cached.call_api(1)
+
+        self.assertIs(first, second)
+        self.assertEqual(self.client.call_api.call_count, 1)
+        self.assertEqual((self.cached.hits, self.cached.misses), (1, 1))
+
+    def test_should_call_again_when_entry_is_expired(self):
+        self.cached.call_api(1)
+        self.clock.now = 10
+
+        self.cached.call_api(1)
+
+        self.assertEqual(self.client.call_api.call_count, 2)
+
+    def test_should_evict_least_recently_used_entry_when_cache_is_full(self):
+        self.cached.call_api(1)
+        self.cached.call_api(2)
+        self.cached.call_api(1)
+        self.cached.call_api(3)
+
+        self.cached.call_api(1)
+        self.cached.call_api(2)
+
+        self.assertEqual(self.cached.evictions, 2)
+        self.assertEqual([call_args[0][0] for call_args in self.client.call_api.call_args_list], [1, 2, 3, 2])
+
+    def test_should_cache_failures_for_negative_ttl_only_when_status_is_not_success(self):
+        self.client.call_api.side_effect = lambda order_id: APIResponse(APIStatus.FAILURE, None)
+        self.cached.call_api(1)
+        self.cached.call_api(1)
+        self.clock.now = 1
+
+        self.cached.call_api(1)
+
+        self.assertEqual(self.client.call_api.call_count, 2)
+
+    def test_should_not_cache_when_api_exception_is_raised(self):
+        self.client.call_api.side_effect = APIException("Test API Exception")
+
+        for _ in range(2):
+            with self.assertRaises(APIException):
+                self.cached.call_api(1)
+
+        self.assertEqual(self.client.call_api.call_count, 2)
+        self.assertEqual(self.cached.stats()["size"], 0)
+
+    def test_should_forward_only_misses_when_batch_is_called(self):
+        self.client.call_api_batch.side_effect = lambda ids: {id_: APIResponse(APIStatus.SUCCESS, id_) for id_ in ids}
+        self.cached.call_api(1)
+
+        responses = self.cached.call_api_batch([1, 2])
+
+        self.client.call_api_batch.assert_called_once_with([2])
+        self.assertEqual(sorted(responses), [1, 2])
+
+    def test_should_keep_type_b_statuses_when_service_uses_cached_client(self):
+        self.client.call_api.side_effect = lambda order_id: APIResponse(APIStatus.SUCCESS, 60)
+        orders = [Order(id=1, type=OrderType.B, amount=10.0, is_special=False) for _ in range(3)]
+
+        OrderService.api_client = self.cached
+        try:
+            for order in orders:
+                OrderService.process_type_b_orders(order)
+        finally:
+            OrderService.api_client = None
+
+        self.assertEqual([order.status for order in orders], [OrderStatus.PROCESSED] * 3)
+        self.assertEqual(self.client.call_api.call_count, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,118 @@
+import json
+import socket
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from constants.constants import APIStatus, OrderStatus, OrderType
+from models.order_model import Order
+from routers.order_api_client import OrderAPIClient
+from services.order_service import OrderService
+from utils.exceptions.api_exception import APIException
+
+
+class OrderAPIStubHandler(BaseHTTPRequestHandler):
+    """Keep-alive stand-in for the order API that counts accepted connections."""
+
+    protocol_version = "HTTP/1.1"
+
+    def setup(self):
+        super().setup()
+        self.request.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        with self.server.lock:
+            self.server.connection_count += 1
+
+    def do_GET(self):
+        order_id = int(self.path.rsplit("/", 1)[-1])
+        if order_id < 0:
+            self._send(500, {})
+        else:
+            self._send(200, {"status": APIStatus.SUCCESS, "data": order_id})
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        results = {
+            str(order_id): {"status": APIStatus.SUCCESS, "data": order_id}
+            for order_id in body["order_ids"]
+            if order_id >= 0
+        }
+        self._send(200, {"results": results})
+
+    def _send(self, status, content):
+        payload = json.dumps(content).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        pass
+
+
+class TestOrderAPIClient(unittest.TestCase):
+    def setUp(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), OrderAPIStubHandler)
+        self.server.daemon_threads = True
+        self.server.lock = threading.Lock()
+        self.server.connection_count = 0
+        threading.Thread(target=self.server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True).start()
+        self.base_url = f"http://127.0.0.1:{self.server.server_address[1]}"
+
+    def tearDown(self):
+        OrderService.api_client = None
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_should_reuse_connection_when_shared_client_processes_a_batch(self):
+        # Setup
+        orders = [Order(id=i, type=OrderType.B, amount=10.0, is_special=False) for i in range(20)]
+
+        # Execute
+        with OrderAPIClient(self.base_url, pool_size=2) as client:
+            OrderService.api_client = client
+            for order in orders:
+                OrderService.process_type_b_orders(order)
+
+        # Assert
+        self.assertEqual(self.server.connection_count, 1)
+        self.assertEqual(orders[0].status, OrderStatus.PENDING)
+        self.assertEqual(orders[-1].status, OrderStatus.PENDING)
+
+    def test_should_cap_open_connections_at_pool_size_when_calls_are_concurrent(self):
+        # Setup
+        orders = [Order(id=i, type=OrderType.B, amount=10.0, is_special=False) for i in range(40)]
+
+        # Execute
+        with OrderAPIClient(self.base_url, pool_size=3) as client:
+            OrderService.api_client = client
+            OrderService.process_type_b_orders_concurrently(orders, max_workers=8)
+
+        # Assert
+        self.assertLessEqual(self.server.connection_count, 3)
+        self.assertTrue(all(order.status == OrderStatus.PENDING for order in orders))
+
+    def test_should_return_responses_per_order_when_bulk_endpoint_is_called(self):
+        # Setup
+        client = OrderAPIClient(self.base_url)
+
+        # Execute
+        responses = client.call_api_batch([1, -1, 2])
+        client.close()
+
+        # Assert
+        self.assertEqual(sorted(responses), [1, 2])
+        self.assertEqual(responses[2].data, 2)
+
+    def test_should_raise_api_exception_when_server_returns_error_status(self):
+        # Setup
+        client = OrderAPIClient(self.base_url)
+
+        # Execute / Assert
+        with self.assertRaises(APIException):
+            client.call_api(-1)
+        client.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
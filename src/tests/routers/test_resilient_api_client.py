@@ -0,0 +1,154 @@
+import threading
+import time
+import unittest
+
+from constants.constants import APIStatus, OrderStatus, OrderType
+from models.order_model import Order
+from responses.api_response import APIResponse
+from routers.base_api_client import BaseAPIClient
+from routers.circuit_breaker import CircuitBreaker
+from routers.resilient_api_client import ResilientAPIClient
+from services.order_service import OrderService
+from utils.exceptions.api_exception import APIException
+from utils.exceptions.circuit_open_exception import CircuitOpenException
+from tests.fixtures.clock_fixtures import FakeClock
+
+
+class FlakyAPIStub(BaseAPIClient):
+    """Local API stand-in that fails its first calls and can hang."""
+
+    def __init__(self, failures: int = 0, hang: float = 0.0):
+        self.failures = failures
+        self.hang = hang
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def call_api(self, order_id):
+        with self._lock:
+            self.calls += 1
+            failing = self.calls <= self.failures
+        if self.hang:
+            time.sleep(self.hang)
+        if failing:
+            raise APIException("Test API Exception")
+        return APIResponse(status=APIStatus.SUCCESS, data=order_id)
+
+
+class TestResilientAPIClient(unittest.TestCase):
+    def test_should_succeed_when_failures_are_within_retries(self):
+        stub = FlakyAPIStub(failures=2)
+        sleeps = []
+        client = ResilientAPIClient(stub, retries=2, backoff=0.1, sleep=sleeps.append)
+
+        response = client.call_api(7)
+
+        self.assertEqual(response.data, 7)
+        self.assertEqual(stub.calls, 3)
+        self.assertEqual(len(sleeps), 2)
+        self.assertTrue(0 <= sleeps[0] <= 0.1 and 0 <= sleeps[1] <= 0.2)
+
+    def test_should_raise_api_exception_when_call_exceeds_timeout(self):
+        client = ResilientAPIClient(FlakyAPIStub(hang=1.0), timeout=0.05, retries=0)
+
+        start = time.perf_counter()
+        with self.assertRaises(APIException):
+            client.call_api(1)
+        elapsed = time.perf_counter() - start
+        client.close()
+
+        self.assertLess(elapsed, 0.5)
+
+    def test_should_reject_calls_without_reaching_api_when_circuit_is_open(self):
+        stub = FlakyAPIStub(failures=100)
+        breaker = CircuitBreaker(failure_threshold=3, recovery_time=10, clock=FakeClock())
+        client = ResilientAPIClient(stub, retries=5, circuit_breaker=breaker, sleep=lambda seconds: None)
+
+        with self.assertRaises(CircuitOpenException):
+            client.call_api(1)
+        with self.assertRaises(CircuitOpenException):
+            client.call_api(2)
+
+        self.assertEqual(stub.calls, 3)
+        self.assertEqual(breaker.state, CircuitBreaker.OPEN)
+
+    def test_should_close_circuit_when_trial_call_succeeds_after_recovery_time(self):
+        clock = FakeClock()
+        stub = FlakyAPIStub(failures=2)
+        breaker = CircuitBreaker(failure_threshold=2, recovery_time=10, clock=clock)
+        client = ResilientAPIClient(stub, retries=0, circuit_breaker=breaker)
+        for _ in range(2):
+            with self.assertRaises(APIException):
+                client.call_api(1)
+
+        clock.now = 10
+        response = client.call_api(1)
+
+        self.assertEqual(response.status, APIStatus.SUCCESS)
+        self.assertEqual(breaker.state, CircuitBreaker.CLOSED)
+
+    def test_should_reopen_circuit_when_trial_call_raises_non_api_exception(self):
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=1, recovery_time=10, clock=clock)
+        stub = FlakyAPIStub(failures=1)
+        client = ResilientAPIClient(stub, retries=0, circuit_breaker=breaker)
+        with self.assertRaises(APIException):
+            client.call_api(1)
+
+        clock.now = 10
+        def reset_connection(order_id):
+            raise OSError("Connection reset")
+
+        stub.call_api = reset_connection
+        with self.assertRaises(OSError):
+            client.call_api(1)
+        state_after_trial = breaker.state
+        clock.now = 20
+        del stub.call_api
+        response = client.call_api(1)
+
+        self.assertEqual(state_after_trial, CircuitBreaker.OPEN)
+        self.assertEqual(response.status, APIStatus.SUCCESS)
+        self.assertEqual(breaker.state, CircuitBreaker.CLOSED)
+
+    def test_should_allow_new_trial_when_half_open_trial_never_reports(self):
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=1, recovery_time=10, clock=clock, trial_timeout=5)
+        breaker.record_failure()
+        clock.now = 10
+        self.assertTrue(breaker.allow())
+
+        clock.now = 14
+        rejected = breaker.allow()
+        clock.now = 15
+
+        self.assertFalse(rejected)
+        self.assertTrue(breaker.allow())
+        self.assertEqual(breaker.state, CircuitBreaker.HALF_OPEN)
+
+    def test_should_bound_tail_latency_when_api_is_degraded(self):
+        stub = FlakyAPIStub(failures=10_000, hang=0.5)
+        breaker = CircuitBreaker(failure_threshold=3, recovery_time=60)
+        client = ResilientAPIClient(
+            stub, timeout=0.02, retries=1, backoff=0.01, circuit_breaker=breaker, max_concurrency=8
+        )
+        orders = [Order(id=i, type=OrderType.B, amount=10.0, is_special=False) for i in range(50)]
+
+        OrderService.api_client = client
+        try:
+            latencies = []
+            for order in orders:
+                start = time.perf_counter()
+                OrderService.process_type_b_orders(order)
+                latencies.append(time.perf_counter() - start)
+        finally:
+            OrderService.api_client = None
+            client.close()
+
+        self.assertTrue(all(order.status == OrderStatus.API_FAILURE for order in orders))
+        self.assertEqual(stub.calls, 3)
+        self.assertLess(max(latencies), 0.2)
+        self.assertLess(sum(latencies), 0.5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,94 @@
+import asyncio
+import unittest
+from unittest.mock import patch
+
+from constants.constants import OrderType, OrderStatus, APIStatus
+from models.order_model import Order
+from responses.api_response import APIResponse
+from routers.base_api_client import BaseAPIClient
+from routers.base_async_api_client import BaseAsyncAPIClient
+from services.async_order_service import AsyncOrderService
+from services.order_service import OrderService
+from utils.exceptions.api_exception import APIException
+from utils.exceptions.database_exception import DatabaseException
+from tests.fixtures.order_fixtures import build_random_orders
+
+
+def api_response_for(order_id):
+    if order_id % 11 == 0:
+        raise APIException("Test exception")
+    if order_id % 17 == 0:
+        # Fails the handler itself, not just the API call
+        raise RuntimeError("Test exception")
+    status = APIStatus.ERROR if order_id % 7 == 0 else APIStatus.SUCCESS
+    return APIResponse(status=status, data=order_id % 100)
+
+
+class FakeAPIClient(BaseAPIClient):
+    def call_api(self, order_id):
+        return api_response_for(order_id)
+
+
+class FakeAsyncAPIClient(BaseAsyncAPIClient):
+    def __init__(self):
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def call_api(self, order_id):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.001)
+            return api_response_for(order_id)
+        finally:
+            self.in_flight -= 1
+
+
+def fail_some_updates(order):
+    if order.id % 13 == 0:
+        raise DatabaseException("Test exception")
+    return True
+
+
+@patch("services.order_service.OrderService.update_order", side_effect=fail_some_updates)
+@patch("utils.exporters.csv_exporter.CSVExporter.export")
+class TestAsyncOrderService(unittest.TestCase):
+    def test_should_match_sync_statuses_and_priorities_when_same_orders_are_processed(self, mock_export, mock_update_order):
+        for seed in range(5):
+            sync_orders = build_random_orders(seed, 200)
+            async_orders = build_random_orders(seed, 200)
+
+            with patch.object(OrderService, "api_client", FakeAPIClient()), patch.object(
+                AsyncOrderService, "api_client", FakeAsyncAPIClient()
+            ):
+                sync_result = OrderService.process_orders(sync_orders, user_id=1, run_id="sync")
+                async_result = asyncio.run(AsyncOrderService.process_orders(async_orders, user_id=1, run_id="async"))
+
+            self.assertEqual(sync_result, async_result)
+            self.assertEqual(
+                [(order.status, order.priority) for order in sync_orders],
+                [(order.status, order.priority) for order in async_orders],
+            )
+
+    def test_should_bound_in_flight_orders_when_max_concurrency_is_set(self, mock_export, mock_update_order):
+        api_client = FakeAsyncAPIClient()
+        orders = [Order(id=i, type=OrderType.B, amount=10.0, is_special=False) for i in range(1, 101)]
+
+        with patch.object(AsyncOrderService, "api_client", api_client), patch.object(
+            AsyncOrderService, "max_concurrency", 8
+        ):
+            result = asyncio.run(AsyncOrderService.process_orders(iter(orders)))
+
+        self.assertTrue(result)
+        self.assertEqual(api_client.max_in_flight, 8)
+        self.assertNotIn(OrderStatus.NEW, {order.status for order in orders})
+
+    def test_should_return_false_when_fetching_orders_raises_database_exception(self, mock_export, mock_update_order):
+        with patch.object(OrderService, "fetch_orders_by_user", side_effect=DatabaseException("Test exception")):
+            result = asyncio.run(AsyncOrderService.process_order_by_user_id(1))
+
+        self.assertFalse(result)
+
+
+if __name__ == "__main__":
+    unittest.main()
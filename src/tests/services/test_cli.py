@@ -0,0 +1,86 @@
+import contextlib
+import io
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from constants.constants import OrderStatus, OrderType
+from models.order_model import Order
+from repositories.sqlite_order_repository import SQLiteOrderRepository
+from services import cli
+from services.order_service import OrderService
+
+# Backends that importing the CLI must not load
+LAZY_MODULES = ["http.client", "concurrent.futures.process", "sqlite3", "gzip", "routers.order_api_client"]
+SRC_DIRECTORY = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+class TestCLI(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+        cwd = os.getcwd()
+        # Export files are written to the working directory
+        os.chdir(self.directory)
+        self.addCleanup(os.chdir, cwd)
+        # The CLI configures OrderService for the whole process
+        for name in ("export_format", "order_repository", "api_client"):
+            patcher = patch.object(OrderService, name, getattr(OrderService, name))
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def _run(self, argv):
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            exit_status = cli.main(argv)
+        return exit_status, output.getvalue()
+
+    def test_should_print_report_when_orders_file_is_processed(self):
+        path = os.path.join(self.directory, "orders.csv")
+        with open(path, "w") as file_handler:
+            file_handler.write("id,type,amount,is_special\n1,A,120.0,false\n2,C,250.0,true\n3,X,5.0,false\n")
+
+        exit_status, output = self._run(["--orders-file", path, "--export-format", "jsonl", "--batch-export", "--report"])
+
+        report = json.loads(output)
+        self.assertEqual(exit_status, 0)
+        self.assertEqual(
+            report["status_counts"],
+            {OrderStatus.EXPORTED: 1, OrderStatus.COMPLETED: 1, OrderStatus.UNKNOWN_TYPE: 1},
+        )
+        self.assertEqual(len([name for name in os.listdir(self.directory) if name.endswith(".jsonl")]), 1)
+
+    def test_should_update_database_when_user_ids_are_processed(self):
+        path = os.path.join(self.directory, "orders.db")
+        repository = SQLiteOrderRepository(path)
+        repository.insert_orders([Order(id=1, type=OrderType.C, amount=10.0, is_special=True)], user_id=7)
+        repository.insert_orders([Order(id=2, type=OrderType.C, amount=10.0, is_special=False)], user_id=8)
+
+        exit_status, _ = self._run(["7", "8", "--database", path])
+
+        statuses = dict(repository.connection.execute("SELECT id, status FROM orders"))
+        repository.close()
+        OrderService.order_repository.close()
+        self.assertEqual(exit_status, 0)
+        self.assertEqual(statuses, {1: OrderStatus.COMPLETED, 2: OrderStatus.IN_PROGRESS})
+
+    def test_should_exit_with_usage_error_when_no_input_is_given(self):
+        with self.assertRaises(SystemExit), contextlib.redirect_stderr(io.StringIO()):
+            cli.parse_args([])
+
+    def test_should_not_import_backends_when_cli_is_imported(self):
+        code = f"import sys, services.cli; print([name for name in {LAZY_MODULES!r} if name in sys.modules])"
+        completed = subprocess.run(
+            [sys.executable, "-c", code], cwd=SRC_DIRECTORY, capture_output=True, text=True, check=True
+        )
+
+        self.assertEqual(completed.stdout.strip(), "[]")
+
+
+if __name__ == "__main__":
+    unittest.main()
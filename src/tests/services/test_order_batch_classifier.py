@@ -0,0 +1,45 @@
+import unittest
+from unittest.mock import patch
+
+from constants.constants import OrderType, OrderPriority, OrderAmountThreshold
+from models.order_batch import OrderBatch
+from services import order_batch_classifier
+from services.order_batch_classifier import OrderBatchClassifier
+from services.order_service import OrderService
+from tests.fixtures.order_fixtures import build_random_orders
+
+
+class TestOrderBatchClassifier(unittest.TestCase):
+    def _assert_matches_scalar_path(self, use_numpy):
+        for seed in range(20):
+            orders = build_random_orders(seed, 200, [OrderType.C, "INVALID_TYPE", "D"])
+            batch = OrderBatch.from_orders(orders)
+
+            with patch.object(OrderService, "update_order"):
+                self.assertTrue(OrderService.process_orders(orders))
+            OrderBatchClassifier.classify(batch, use_numpy=use_numpy)
+
+            self.assertEqual(
+                [(order.status, order.priority) for order in batch],
+                [(order.status, order.priority) for order in orders],
+            )
+
+    def test_should_match_scalar_process_orders_when_classifying_in_pure_python(self):
+        self._assert_matches_scalar_path(use_numpy=False)
+
+    @unittest.skipIf(order_batch_classifier.np is None, "NumPy is not installed")
+    def test_should_match_scalar_process_orders_when_classifying_with_numpy(self):
+        self._assert_matches_scalar_path(use_numpy=True)
+
+    def test_should_only_set_priority_when_orders_are_type_a_or_b(self):
+        orders = build_random_orders(0, 100, [OrderType.A, OrderType.B])
+        batch = OrderBatchClassifier.classify(OrderBatch.from_orders(orders), use_numpy=False)
+
+        for order, classified in zip(orders, batch):
+            self.assertEqual(classified.status, order.status)
+            expected_high = order.amount > OrderAmountThreshold.PRIORITY_THRESHOLD
+            self.assertEqual(classified.priority == OrderPriority.HIGH, expected_high)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,117 @@
+import itertools
+import json
+import os
+import tempfile
+import unittest
+
+from constants.constants import (
+    OrderStatus,
+    OrderPriority,
+    APIStatus,
+    OrderAmountThreshold,
+    ORDER_API_RESPONSE_THRESHOLD,
+    ORDER_HANDLERS,
+    ORDER_RULE_TABLES,
+    DEFAULT_ORDER_RULES,
+)
+from models.order_model import Order
+from responses.api_response import APIResponse
+from services.order_rule_table import OrderRuleTable
+from services.order_service import OrderService
+
+
+def type_b_status_chain(order, api_response):
+    """The Type B status decision as written before the rule table."""
+    if api_response.status == APIStatus.SUCCESS:
+        if (
+            api_response.data >= ORDER_API_RESPONSE_THRESHOLD
+            and order.amount < OrderAmountThreshold.PROCESSED_ORDER_THRESHOLD
+        ):
+            return OrderStatus.PROCESSED
+        elif api_response.data < ORDER_API_RESPONSE_THRESHOLD or order.is_special:
+            return OrderStatus.PENDING
+        return OrderStatus.ERROR
+    return OrderStatus.API_ERROR
+
+
+def with_default_tables(**tables):
+    """Return the default rule tables with some of them replaced."""
+    return {**DEFAULT_ORDER_RULES["tables"], **tables}
+
+
+class TestOrderRuleTable(unittest.TestCase):
+    def test_should_match_if_elif_chain_when_default_rules_are_used(self):
+        table = OrderRuleTable.from_config(DEFAULT_ORDER_RULES)
+        amounts = [0, 99.99, 100, 150, 200, 200.01]
+        data = [0, 49, 50, 51]
+
+        for amount, is_special, status, value in itertools.product(
+            amounts, [False, True], [APIStatus.SUCCESS, APIStatus.FAILURE], data
+        ):
+            order = Order(id=1, type="B", amount=amount, is_special=is_special)
+            api_response = APIResponse(status, value)
+
+            self.assertEqual(table["type_b_status"](order, api_response), type_b_status_chain(order, api_response))
+            self.assertEqual(
+                table.decide("priority", order),
+                OrderPriority.HIGH if amount > OrderAmountThreshold.PRIORITY_THRESHOLD else OrderPriority.LOW,
+            )
+
+    def test_should_return_none_when_no_rule_matches(self):
+        table = OrderRuleTable(
+            {}, with_default_tables(priority=[{"when": {"order.amount": [">", 10]}, "result": "high"}])
+        )
+
+        self.assertIsNone(table.decide("priority", Order(id=1, type="A", amount=5.0, is_special=False)))
+
+    def test_should_load_rules_when_json_file_is_given(self):
+        config = {
+            "handlers": {"D": "process_type_c_orders"},
+            "tables": with_default_tables(
+                priority=[{"when": {"order.is_special": ["truthy"]}, "result": "high"}, {"result": "low"}]
+            ),
+        }
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "rules.json")
+            with open(path, "w") as file_handler:
+                json.dump(config, file_handler)
+            table = OrderRuleTable.from_file(path)
+
+        self.assertEqual(table.handlers, {"D": "process_type_c_orders"})
+        self.assertEqual(table.decide("priority", Order(id=1, type="D", amount=1.0, is_special=True)), "high")
+
+    def test_should_raise_value_error_when_rule_is_invalid(self):
+        invalid_rules = [
+            [{"when": {"order.amount + 1": [">", 1]}, "result": "high"}],
+            [{"when": {"order.amount": ["in", 1]}, "result": "high"}],
+            [{"when": {"order.amount": [">", [1]]}, "result": "high"}],
+            [{"when": {"order.amount": [">", float("nan")]}, "result": "high"}],
+            [{"when": {"order.amount": [">", 1]}}],
+            [{"when": {"order.__class__": ["truthy"]}, "result": "high"}],
+        ]
+
+        for rules in invalid_rules:
+            with self.assertRaises(ValueError):
+                OrderRuleTable({}, with_default_tables(priority=rules))
+        with self.assertRaises(ValueError):
+            OrderRuleTable({"D": "process_type_c_orders()"}, with_default_tables())
+
+    def test_should_raise_value_error_when_required_table_is_missing(self):
+        for name in ORDER_RULE_TABLES:
+            tables = with_default_tables()
+            del tables[name]
+            with self.assertRaisesRegex(ValueError, name):
+                OrderRuleTable({}, tables)
+
+    def test_should_raise_value_error_when_handler_is_not_an_order_handler(self):
+        for handler in ("update_order", "process_type_b_orders_batch", "__class__", None):
+            with self.assertRaises(ValueError):
+                OrderRuleTable({"D": handler}, with_default_tables())
+
+    def test_should_name_order_service_methods_when_handlers_are_listed(self):
+        for handler in ORDER_HANDLERS:
+            self.assertTrue(callable(getattr(OrderService, handler)))
+
+
+if __name__ == "__main__":
+    unittest.main()
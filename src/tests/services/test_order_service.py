@@ -1,6 +1,13 @@
+import csv
+import os
+import tempfile
+import threading
+import time
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import patch, MagicMock
-from services.order_service import OrderService
+from services.order_service import OrderService, IncrementalStats
+from services.order_rule_table import OrderRuleTable
 from models.order_model import Order
 from constants.constants import (
     OrderType, 
@@ -8,15 +15,41 @@ from constants.constants import (
     OrderPriority, 
     APIStatus, 
     OrderAmountThreshold,
-    ORDER_API_RESPONSE_THRESHOLD  # Added missing import
+    ORDER_API_RESPONSE_THRESHOLD,  # Added missing import
+    DEFAULT_ORDER_RULES,
 )
 from tests.fixtures.order_fixtures import (
     get_valid_order_fixture,
     get_high_priority_order_fixture,
     get_invalid_type_order_fixture,
 )
+from repositories.in_memory_order_queue import InMemoryOrderQueue
+from repositories.sqlite_order_state_store import SQLiteOrderStateStore
 from utils.exceptions.database_exception import DatabaseException
 from utils.exceptions.api_exception import APIException
+from utils.exporters.background_export_writer import BackgroundExportWriter
+from utils.exporters.csv_exporter import CSVExporter
+from utils.instrumentation.base_instrumentation import Stage
+from utils.instrumentation.in_memory_collector import InMemoryCollector
+
+
+class MultiUserOrderService(OrderService):
+    """Order service with in-memory orders per user, used across worker processes."""
+
+    @classmethod
+    def fetch_orders_by_user(cls, user_id):
+        if user_id == 13:
+            os._exit(1)  # Simulate a worker process crash
+        if user_id == 14:
+            raise DatabaseException("Test exception")
+        return [
+            Order(id=user_id * 10, type=OrderType.C, amount=10.0, is_special=True),
+            Order(id=user_id * 10 + 1, type="INVALID_TYPE", amount=10.0, is_special=False),
+        ]
+
+    @classmethod
+    def update_order(cls, order):
+        return True
 
 
 class TestOrderService(unittest.TestCase):
@@ -60,7 +93,7 @@ class TestOrderService(unittest.TestCase):
         self.assertEqual(orders[0].priority, OrderPriority.LOW)
         self.assertEqual(orders[1].priority, OrderPriority.LOW)  # Updated expectation
 
-    @patch("services.order_service.CSVExporter.export")
+    @patch("utils.exporters.csv_exporter.CSVExporter.export")
     def test_should_export_order_when_type_a_order_is_processed(self, mock_export):
         mock_export.return_value = None
         order = get_valid_order_fixture()
@@ -135,7 +168,8 @@ class TestOrderService(unittest.TestCase):
         self.assertEqual(order.status, OrderStatus.UNKNOWN_TYPE)
 
     @patch("services.order_service.OrderService.update_order")
-    def test_should_handle_database_exception_when_update_order_fails(self, mock_update_order):
+    @patch("utils.exporters.csv_exporter.CSVExporter.export")
+    def test_should_handle_database_exception_when_update_order_fails(self, mock_export, mock_update_order):
         # Setup
         mock_update_order.side_effect = DatabaseException("Test exception")
         order = get_valid_order_fixture()
@@ -144,14 +178,15 @@ class TestOrderService(unittest.TestCase):
         result = OrderService.process_orders([order])
         
         # Assert
-        self.assertEqual(order.status, "new")  # Ensure the status is set to "new"
-        self.assertFalse(result)  # Ensure the method returns False when a DatabaseException occurs
+        self.assertEqual(order.status, OrderStatus.DB_ERROR)
+        self.assertTrue(result)  # A failed update is recorded on the order, not raised
         
-        # The method should also return False when using a user_id and a DatabaseException occurs.
+        # The same applies when processing the orders of a user.
         result = OrderService.process_orders([order], user_id=1)
-        self.assertFalse(result)
+        self.assertTrue(result)
+        self.assertEqual(order.status, OrderStatus.DB_ERROR)
 
-    @patch("services.order_service.CSVExporter.export")
+    @patch("utils.exporters.csv_exporter.CSVExporter.export")
     def test_should_add_high_value_note_when_type_a_order_amount_exceeds_threshold(self, mock_export):
         # Setup
         order = get_valid_order_fixture()
@@ -164,12 +199,12 @@ class TestOrderService(unittest.TestCase):
         self.assertEqual(processed_order.status, OrderStatus.EXPORTED)
         # Verify that the high value note was included in the export data
         for call_args in mock_export.call_args_list:
-            data = call_args[0][1]
+            data = call_args[0][0]
             # Check if there's a "High value order" note in the data
             high_value_found = any("High value order" in str(row) for row in data)
             self.assertTrue(high_value_found)
 
-    @patch("services.order_service.CSVExporter.export")
+    @patch("utils.exporters.csv_exporter.CSVExporter.export")
     def test_should_mark_order_as_export_failed_when_io_exception_occurs(self, mock_export):
         # Setup
         mock_export.side_effect = IOError("Test IO Exception")
@@ -252,16 +287,656 @@ class TestOrderService(unittest.TestCase):
         mock_process_orders.assert_called_once_with(orders, 1)
 
     @patch("services.order_service.OrderService.update_order")
-    def test_should_return_false_when_exception_occurs_in_process_orders(self, mock_update_order):
+    @patch("utils.exporters.csv_exporter.CSVExporter.export")
+    def test_should_mark_only_failing_order_as_processing_error_when_exception_occurs_in_process_orders(self, mock_export, mock_update_order):
         # Setup
-        mock_update_order.side_effect = Exception("Unexpected error")
-        
+        def update_order(order):
+            if order.id == 71:
+                raise Exception("Unexpected error")
+            return True
+
+        mock_update_order.side_effect = update_order
+        orders = [
+            Order(id=70, type=OrderType.C, amount=10.0, is_special=True),
+            Order(id=71, type=OrderType.C, amount=10.0, is_special=True),
+            Order(id=72, type=OrderType.C, amount=10.0, is_special=True),
+        ]
+
         # Execute
-        result = OrderService.process_orders([get_valid_order_fixture()])
-        
+        report = OrderService.process_orders(orders, with_report=True)
+
+        # Assert
+        self.assertTrue(report.success)
+        self.assertEqual([order.status for order in orders], [OrderStatus.COMPLETED, OrderStatus.PROCESSING_ERROR, OrderStatus.COMPLETED])
+        self.assertEqual(report.to_dict()["failed_ids"], {Stage.PROCESS: [71]})
+        self.assertEqual(mock_update_order.call_count, 3)
+
+    @patch("services.order_service.OrderService.update_order")
+    def test_should_report_other_orders_when_an_order_amount_is_not_a_number(self, mock_update_order):
+        # Setup
+        mock_update_order.return_value = True
+        store = SQLiteOrderStateStore()
+        self.addCleanup(store.close)
+        orders = [
+            Order(id=73, type=OrderType.C, amount=10.0, is_special=True),
+            Order(id=74, type=OrderType.C, amount=None, is_special=True),
+            Order(id=75, type=OrderType.C, amount=20.0, is_special=True),
+        ]
+
+        # Execute
+        with patch.object(OrderService, "order_state_store", store):
+            report = OrderService.process_orders(
+                orders, run_id="run-2", with_report=True, incremental=True, checkpoint=True
+            )
+
+        # Assert
+        self.assertTrue(report.success)
+        self.assertEqual([order.status for order in orders], [OrderStatus.COMPLETED, OrderStatus.PROCESSING_ERROR, OrderStatus.COMPLETED])
+        self.assertEqual(store.get_checkpoint("run-2"), 3)
+        self.assertEqual(report.order_count, 3)
+        self.assertEqual(report.total_amount, 30.0)
+        self.assertEqual(report.to_dict()["failed_ids"], {Stage.PROCESS: [74]})
+
+    @patch("services.order_service.OrderService.update_order")
+    @patch("utils.exporters.csv_exporter.CSVExporter.export")
+    def test_should_return_false_when_reading_orders_raises_in_process_orders(self, mock_export, mock_update_order):
+        # Setup
+        def read_orders():
+            yield get_valid_order_fixture()
+            raise Exception("Unexpected error")
+
+        # Execute
+        result = OrderService.process_orders(read_orders())
+
         # Assert
         self.assertFalse(result)
 
+    @patch("services.order_service.OrderService.update_order")
+    @patch("utils.exporters.csv_exporter.CSVExporter.export")
+    def test_should_export_type_a_orders_into_single_file_when_batch_export_is_enabled(self, mock_export, mock_update_order):
+        # Setup
+        order_1 = get_valid_order_fixture()
+        order_2 = Order(id=4, type=OrderType.A, amount=OrderAmountThreshold.HIGH_VALUE_ORDER_THRESHOLD + 1, is_special=True)
+        order_c = Order(id=5, type=OrderType.C, amount=10.0, is_special=True)
+
+        # Execute
+        result = OrderService.process_orders([order_1, order_c, order_2], user_id=1, batch_export=True)
+
+        # Assert
+        self.assertTrue(result)
+        mock_export.assert_called_once()
+        rows, csv_file = mock_export.call_args[0]
+        self.assertTrue(csv_file.startswith("orders_type_A_1_"))
+        self.assertEqual(mock_export.call_args[1]["columns"][0], "ID")
+        self.assertEqual([row[0] for row in rows], [1, 4, ""])
+        self.assertEqual(order_1.status, OrderStatus.EXPORTED)
+        self.assertEqual(order_2.status, OrderStatus.EXPORTED)
+        self.assertEqual(order_c.status, OrderStatus.COMPLETED)
+        self.assertEqual(mock_update_order.call_count, 3)
+
+    @patch("services.order_service.OrderService.update_order")
+    @patch("utils.exporters.csv_exporter.CSVExporter.export")
+    def test_should_mark_batch_as_export_failed_when_batch_export_raises_io_error(self, mock_export, mock_update_order):
+        # Setup
+        mock_export.side_effect = IOError("Test IO Exception")
+        orders = [get_valid_order_fixture(), Order(id=4, type=OrderType.A, amount=10.0, is_special=False)]
+
+        # Execute
+        result = OrderService.process_orders(orders, user_id=1, batch_export=True)
+
+        # Assert
+        self.assertTrue(result)
+        self.assertTrue(all(order.status == OrderStatus.EXPORT_FAILED for order in orders))
+        self.assertEqual(mock_update_order.call_count, 2)
+
+    @patch("services.order_service.OrderService.update_order")
+    @patch("services.order_service.OrderService._open_export_writer")
+    @patch("utils.exporters.csv_exporter.CSVExporter.export")
+    def test_should_mark_only_invalid_type_a_order_as_processing_error_when_type_a_orders_are_exported_together(self, mock_export, mock_open_export_writer, mock_update_order):
+        # Setup
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        exported_rows = []
+        mock_export.side_effect = lambda rows, path, columns: exported_rows.extend(rows)
+        mock_open_export_writer.side_effect = lambda user_id, run_id: BackgroundExportWriter(
+            CSVExporter, os.path.join(directory.name, "orders.csv"), columns=["ID"]
+        )
+
+        def build_orders(first_id):
+            return [
+                Order(id=first_id, type=OrderType.A, amount=10.0, is_special=False),
+                Order(id=first_id + 1, type=OrderType.A, amount=None, is_special=False),
+                Order(id=first_id + 2, type=OrderType.A, amount=20.0, is_special=False),
+            ]
+
+        batch_orders = build_orders(90)
+        background_orders = build_orders(93)
+
+        # Execute
+        batch_result = OrderService.process_orders(batch_orders, user_id=1, batch_export=True)
+        background_result = OrderService.process_orders(background_orders, user_id=1, background_export=True)
+
+        # Assert
+        expected_statuses = [OrderStatus.EXPORTED, OrderStatus.PROCESSING_ERROR, OrderStatus.EXPORTED]
+        self.assertTrue(batch_result)
+        self.assertEqual([order.status for order in batch_orders], expected_statuses)
+        self.assertEqual([row[0] for row in exported_rows], [90, 92])
+        self.assertTrue(background_result)
+        self.assertEqual([order.status for order in background_orders], expected_statuses)
+        self.assertEqual(mock_update_order.call_count, 6)
+
+    @patch("services.order_service.OrderService.update_order")
+    @patch("routers.order_api_client.OrderAPIClient.call_api")
+    def test_should_map_api_results_per_order_when_type_b_orders_are_dispatched_concurrently(self, mock_call_api, mock_update_order):
+        # Setup
+        responses = {
+            10: MagicMock(status=APIStatus.SUCCESS, data=ORDER_API_RESPONSE_THRESHOLD + 10),
+            11: MagicMock(status=APIStatus.ERROR, data=None),
+        }
+
+        def call_api(order_id):
+            if order_id == 12:
+                raise APIException("Test API Exception")
+            return responses[order_id]
+
+        mock_call_api.side_effect = call_api
+        orders = [
+            Order(id=10, type=OrderType.B, amount=OrderAmountThreshold.PROCESSED_ORDER_THRESHOLD - 1, is_special=False),
+            Order(id=11, type=OrderType.B, amount=OrderAmountThreshold.PRIORITY_THRESHOLD + 1, is_special=False),
+            Order(id=12, type=OrderType.B, amount=10.0, is_special=False),
+        ]
+
+        # Execute
+        result = OrderService.process_orders(orders, max_workers=2)
+
+        # Assert
+        self.assertTrue(result)
+        self.assertEqual([order.status for order in orders], [OrderStatus.PROCESSED, OrderStatus.API_ERROR, OrderStatus.API_FAILURE])
+        self.assertEqual([order.priority for order in orders], [OrderPriority.LOW, OrderPriority.HIGH, OrderPriority.LOW])
+        self.assertEqual(mock_update_order.call_count, 3)
+
+    @patch("services.order_service.OrderService.update_order")
+    @patch("routers.order_api_client.OrderAPIClient.call_api")
+    def test_should_reuse_one_thread_pool_when_type_b_orders_outnumber_in_flight_limit(self, mock_call_api, mock_update_order):
+        # Setup
+        lock = threading.Lock()
+        in_flight = [0]
+        max_in_flight = [0]
+
+        def call_api(order_id):
+            with lock:
+                in_flight[0] += 1
+                max_in_flight[0] = max(max_in_flight[0], in_flight[0])
+            time.sleep(0.001)
+            with lock:
+                in_flight[0] -= 1
+            return MagicMock(status=APIStatus.SUCCESS, data=ORDER_API_RESPONSE_THRESHOLD)
+
+        mock_call_api.side_effect = call_api
+        orders = [Order(id=200 + i, type=OrderType.B, amount=10.0, is_special=False) for i in range(100)]
+
+        # Execute
+        with patch("concurrent.futures.ThreadPoolExecutor", wraps=ThreadPoolExecutor) as mock_executor:
+            result = OrderService.process_orders(iter(orders), max_workers=4)
+
+        # Assert
+        self.assertTrue(result)
+        mock_executor.assert_called_once_with(max_workers=4)
+        self.assertEqual(max_in_flight[0], 4)
+        self.assertEqual({order.status for order in orders}, {OrderStatus.PROCESSED})
+        self.assertEqual(mock_update_order.call_count, 100)
+
+    @patch("services.order_service.OrderService.update_order")
+    @patch("routers.order_api_client.OrderAPIClient.call_api_batch")
+    def test_should_isolate_failures_per_chunk_when_type_b_orders_are_sent_in_batches(self, mock_call_api_batch, mock_update_order):
+        # Setup
+        def call_api_batch(order_ids):
+            if 22 in order_ids:
+                raise APIException("Test API Exception")
+            return {
+                order_id: MagicMock(status=APIStatus.SUCCESS, data=ORDER_API_RESPONSE_THRESHOLD - 1)
+                for order_id in order_ids
+                if order_id != 21
+            }
+
+        mock_call_api_batch.side_effect = call_api_batch
+        orders = [Order(id=20 + i, type=OrderType.B, amount=10.0, is_special=False) for i in range(4)]
+
+        # Execute
+        result = OrderService.process_orders(orders, api_batch_size=2)
+
+        # Assert
+        self.assertTrue(result)
+        self.assertEqual(
+            [call_args[0][0] for call_args in mock_call_api_batch.call_args_list],
+            [[20, 21], [22, 23]],
+        )
+        self.assertEqual(
+            [order.status for order in orders],
+            [OrderStatus.PENDING, OrderStatus.API_FAILURE, OrderStatus.API_FAILURE, OrderStatus.API_FAILURE],
+        )
+        self.assertEqual(mock_update_order.call_count, 4)
+
+    @patch("routers.order_api_client.OrderAPIClient.call_api_batch")
+    def test_should_mark_order_as_api_error_when_batch_response_status_is_not_success(self, mock_call_api_batch):
+        # Setup
+        mock_call_api_batch.return_value = {
+            1: MagicMock(status=APIStatus.FAILURE, data=None),
+            2: MagicMock(status=APIStatus.SUCCESS, data=ORDER_API_RESPONSE_THRESHOLD + 10),
+        }
+        order_1 = Order(id=1, type=OrderType.B, amount=10.0, is_special=False)
+        order_2 = Order(id=2, type=OrderType.B, amount=10.0, is_special=False)
+
+        # Execute
+        OrderService.process_type_b_orders_batch([order_1, order_2], chunk_size=10, max_workers=2)
+
+        # Assert
+        self.assertEqual(order_1.status, OrderStatus.API_ERROR)
+        self.assertEqual(order_2.status, OrderStatus.PROCESSED)
+
+    @patch("services.order_service.OrderService.order_repository")
+    def test_should_mark_only_failing_orders_as_db_error_when_bulk_update_chunk_fails(self, mock_repository):
+        # Setup
+        def update_order(order):
+            if order.id == 32:
+                raise DatabaseException("Test exception")
+            return True
+
+        def update_orders(orders):
+            if any(order.id == 32 for order in orders):
+                raise DatabaseException("Test exception")
+            return len(orders)
+
+        mock_repository.update_order.side_effect = update_order
+        mock_repository.update_orders.side_effect = update_orders
+        orders = [Order(id=30 + i, type=OrderType.C, amount=10.0, is_special=True) for i in range(5)]
+
+        # Execute
+        result = OrderService.process_orders(orders, db_batch_size=2)
+
+        # Assert
+        self.assertTrue(result)
+        self.assertEqual(mock_repository.update_orders.call_count, 3)
+        self.assertEqual([order.id for order in mock_repository.update_order.call_args_list[0][0]], [32])
+        self.assertEqual(mock_repository.update_order.call_count, 2)
+        self.assertEqual(
+            [order.status for order in orders],
+            [OrderStatus.COMPLETED, OrderStatus.COMPLETED, OrderStatus.DB_ERROR, OrderStatus.COMPLETED, OrderStatus.COMPLETED],
+        )
+
+    @patch("services.order_service.OrderService.fetch_orders_page")
+    def test_should_fetch_pages_lazily_when_iterating_orders_by_user(self, mock_fetch_orders_page):
+        # Setup
+        stored_orders = [Order(id=i, type=OrderType.C, amount=10.0, is_special=False) for i in range(1, 6)]
+
+        def fetch_orders_page(user_id, after_id, page_size):
+            remaining = [order for order in stored_orders if after_id is None or order.id > after_id]
+            return remaining[:page_size]
+
+        mock_fetch_orders_page.side_effect = fetch_orders_page
+
+        # Execute
+        orders = OrderService.iter_orders_by_user(1, page_size=2)
+        first_order = next(orders)
+
+        # Assert
+        self.assertEqual(first_order.id, 1)
+        self.assertEqual(mock_fetch_orders_page.call_count, 1)
+        self.assertEqual([order.id for order in orders], [2, 3, 4, 5])
+        self.assertEqual([call_args[0][1] for call_args in mock_fetch_orders_page.call_args_list], [None, 2, 4])
+
+    @patch("services.order_service.OrderService.update_order")
+    @patch("services.order_service.OrderService.iter_orders_by_user")
+    def test_should_process_streamed_orders_when_page_size_is_given(self, mock_iter_orders, mock_update_order):
+        # Setup
+        orders = [Order(id=1, type=OrderType.C, amount=10.0, is_special=True)]
+        mock_iter_orders.return_value = iter(orders)
+
+        # Execute
+        result = OrderService.process_order_by_user_id(1, page_size=100, db_batch_size=10)
+
+        # Assert
+        self.assertTrue(result)
+        mock_iter_orders.assert_called_once_with(1, 100)
+        mock_update_order.assert_called_once_with(orders[0])
+
+    def test_should_aggregate_results_across_workers_when_processing_several_users(self):
+        # Execute
+        result = MultiUserOrderService.process_users([1, 2, 14, 3], workers=2)
+
+        # Assert
+        self.assertEqual(result.success, {1: True, 2: True, 14: False, 3: True})
+        self.assertEqual(result.status_counts, {OrderStatus.COMPLETED: 3, OrderStatus.UNKNOWN_TYPE: 3})
+
+    def test_should_keep_other_users_results_when_a_worker_crashes(self):
+        # Execute
+        result = MultiUserOrderService.process_users([1, 13, 2, 3], workers=2)
+
+        # Assert
+        self.assertEqual(result.success, {1: True, 13: False, 2: True, 3: True})
+        self.assertEqual(result.status_counts[OrderStatus.COMPLETED], 3)
+
+    @patch("services.order_service.OrderService._run_user_pool")
+    def test_should_rerun_unaffected_users_on_full_size_pool_when_a_worker_crashes(self, mock_run_user_pool):
+        # Setup
+        def run_user_pool(user_ids, workers, initializer, initargs, options, result):
+            if user_ids == list(range(1, 11)):
+                # User 3 crashed its worker while users 4 and 5 were queued
+                return list(range(3, 11))
+            return [3] if user_ids == [3] else []
+
+        mock_run_user_pool.side_effect = run_user_pool
+
+        # Execute
+        result = OrderService.process_users(range(1, 11), workers=2)
+
+        # Assert
+        calls = [(call.args[0], call.args[1]) for call in mock_run_user_pool.call_args_list]
+        self.assertEqual(calls, [(list(range(1, 11)), 2), ([3], 1), ([4], 1), ([5], 1), (list(range(6, 11)), 2)])
+        self.assertEqual(result.success, {3: False})
+
+    @patch("services.order_service.OrderService.update_order")
+    @patch("services.order_service.OrderService.fetch_orders_page")
+    def test_should_time_each_fetched_page_once_when_processing_by_user_id(self, mock_fetch_orders_page, mock_update_order):
+        # Setup
+        mock_fetch_orders_page.return_value = [Order(id=7, type=OrderType.C, amount=10.0, is_special=True)]
+        collector = InMemoryCollector()
+
+        # Execute
+        with patch.object(OrderService, "instrumentation", collector), patch.object(
+            OrderService, "order_repository", MagicMock()
+        ):
+            result = OrderService.process_order_by_user_id(1)
+
+        # Assert
+        self.assertTrue(result)
+        self.assertEqual(collector.snapshot()["stages"][Stage.FETCH]["count"], 1)
+
+    @patch("services.order_service.OrderService.update_order")
+    @patch("utils.exporters.csv_exporter.CSVExporter.export")
+    @patch("routers.order_api_client.OrderAPIClient.call_api")
+    def test_should_record_stage_latencies_and_order_counts_when_instrumentation_is_enabled(self, mock_call_api, mock_export, mock_update_order):
+        # Setup
+        mock_call_api.return_value = MagicMock(status=APIStatus.ERROR, data=None)
+        collector = InMemoryCollector()
+        orders = [
+            get_valid_order_fixture(),
+            Order(id=5, type=OrderType.B, amount=10.0, is_special=False),
+            Order(id=6, type=OrderType.C, amount=10.0, is_special=True),
+        ]
+
+        # Execute
+        with patch.object(OrderService, "instrumentation", collector):
+            result = OrderService.process_orders(orders, user_id=1, batch_export=True)
+
+        # Assert
+        self.assertTrue(result)
+        snapshot = collector.snapshot()
+        self.assertEqual(snapshot["stages"][Stage.EXPORT]["count"], 1)
+        self.assertEqual(snapshot["stages"][Stage.API]["count"], 1)
+        self.assertEqual(snapshot["stages"][Stage.UPDATE]["count"], 3)
+        self.assertEqual(snapshot["order_types"], {OrderType.A: 1, OrderType.B: 1, OrderType.C: 1})
+        self.assertEqual(
+            snapshot["order_statuses"],
+            {OrderStatus.EXPORTED: 1, OrderStatus.API_ERROR: 1, OrderStatus.COMPLETED: 1},
+        )
+
+    @patch("services.order_service.OrderService.update_order")
+    @patch("utils.exporters.jsonl_exporter.JSONLinesExporter.export")
+    def test_should_export_with_configured_format_when_export_format_is_set(self, mock_export, mock_update_order):
+        # Setup
+        order = get_valid_order_fixture()
+
+        # Execute
+        with patch.object(OrderService, "export_format", "jsonl"):
+            result = OrderService.process_orders([order], user_id=1, batch_export=True)
+
+        # Assert
+        self.assertTrue(result)
+        mock_export.assert_called_once()
+        self.assertTrue(mock_export.call_args[0][1].endswith(".jsonl"))
+        self.assertEqual(order.status, OrderStatus.EXPORTED)
+
+    @patch("services.order_service.OrderService.update_order")
+    @patch("services.order_service.OrderService._open_export_writer")
+    @patch("utils.exporters.csv_exporter.CSVExporter.write_rows")
+    def test_should_mark_orders_of_failed_flush_as_export_failed_when_background_export_is_enabled(self, mock_write_rows, mock_open_export_writer, mock_update_order):
+        # Setup
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        mock_write_rows.side_effect = [None, IOError("Test IO Exception")]
+        mock_open_export_writer.side_effect = lambda user_id, run_id: BackgroundExportWriter(
+            CSVExporter, os.path.join(directory.name, "orders.csv"), flush_rows=2
+        )
+        orders = [Order(id=40 + i, type=OrderType.A, amount=10.0, is_special=False) for i in range(4)]
+
+        # Execute
+        result = OrderService.process_orders(orders, user_id=1, background_export=True)
+
+        # Assert
+        self.assertTrue(result)
+        self.assertEqual(mock_write_rows.call_count, 2)
+        self.assertEqual(
+            [order.status for order in orders],
+            [OrderStatus.EXPORTED, OrderStatus.EXPORTED, OrderStatus.EXPORT_FAILED, OrderStatus.EXPORT_FAILED],
+        )
+        self.assertEqual(mock_update_order.call_count, 4)
+
+    @patch("services.order_service.OrderService.update_order")
+    def test_should_write_header_and_rows_once_when_type_a_order_is_exported(self, mock_update_order):
+        # Setup
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        cwd = os.getcwd()
+        os.chdir(directory.name)
+        self.addCleanup(os.chdir, cwd)
+        order = get_valid_order_fixture()
+        order.amount = OrderAmountThreshold.HIGH_VALUE_ORDER_THRESHOLD + 1
+
+        # Execute
+        result = OrderService.process_orders([order], user_id=1)
+
+        # Assert
+        self.assertTrue(result)
+        self.assertEqual(order.status, OrderStatus.EXPORTED)
+        (export_file,) = os.listdir(directory.name)
+        with open(os.path.join(directory.name, export_file), newline="") as file_handler:
+            rows = list(csv.reader(file_handler))
+        self.assertEqual(rows[0], ["ID", "Type", "Amount", "Is Special", "Status", "Priority"])
+        self.assertEqual(rows[1][0], str(order.id))
+        self.assertEqual(rows[2][4:], ["Note", "High value order"])
+        self.assertEqual(len(rows), 3)
+
+    @patch("services.order_service.OrderService.update_order")
+    def test_should_route_orders_by_rule_table_when_new_type_is_configured(self, mock_update_order):
+        # Setup
+        rules = {
+            "handlers": {**DEFAULT_ORDER_RULES["handlers"], "D": "process_type_c_orders"},
+            "tables": {
+                **DEFAULT_ORDER_RULES["tables"],
+                "priority": [{"when": {"order.amount": [">", 10]}, "result": OrderPriority.HIGH}, {"result": OrderPriority.LOW}],
+            },
+        }
+        order_d = Order(id=6, type="D", amount=20.0, is_special=True)
+        order_c = Order(id=7, type=OrderType.C, amount=5.0, is_special=False)
+
+        # Execute
+        with patch.object(OrderService, "rule_table", OrderRuleTable.from_config(rules)):
+            result = OrderService.process_orders([order_d, order_c])
+
+        # Assert
+        self.assertTrue(result)
+        self.assertEqual((order_d.status, order_d.priority), (OrderStatus.COMPLETED, OrderPriority.HIGH))
+        self.assertEqual((order_c.status, order_c.priority), (OrderStatus.IN_PROGRESS, OrderPriority.LOW))
+
+    @patch("services.order_service.OrderService.update_order")
+    def test_should_skip_unchanged_orders_when_incremental_mode_is_enabled(self, mock_update_order):
+        # Setup
+        store = SQLiteOrderStateStore()
+        self.addCleanup(store.close)
+        orders = [
+            Order(id=50, type=OrderType.C, amount=10.0, is_special=True),
+            Order(id=51, type=OrderType.C, amount=20.0, is_special=True),
+            Order(id=52, type=OrderType.C, amount=30.0, is_special=False),
+        ]
+
+        # Execute
+        with patch.object(OrderService, "order_state_store", store):
+            first_stats, second_stats, forced_stats = IncrementalStats(), IncrementalStats(), IncrementalStats()
+            OrderService.process_orders(orders, incremental=True, stats=first_stats)
+            orders[1].amount = 25.0
+            OrderService.process_orders(orders, incremental=True, stats=second_stats)
+            OrderService.process_orders(orders, incremental=True, force=True, stats=forced_stats)
+
+        # Assert
+        self.assertEqual((first_stats.processed, first_stats.skipped), (3, 0))
+        # Order 52 stays IN_PROGRESS, which is not settled, so it is processed again
+        self.assertEqual((second_stats.processed, second_stats.skipped), (2, 1))
+        self.assertEqual((forced_stats.processed, forced_stats.skipped), (3, 0))
+        self.assertEqual(mock_update_order.call_count, 8)
+
+    @patch("services.order_service.OrderService.update_orders")
+    def test_should_keep_fingerprints_of_persisted_orders_when_incremental_run_fails(self, mock_update_orders):
+        # Setup
+        store = SQLiteOrderStateStore()
+        self.addCleanup(store.close)
+        orders = [Order(id=order_id, type=OrderType.C, amount=10.0, is_special=True) for order_id in range(70, 75)]
+        # The last bulk update of the first run fails
+        mock_update_orders.side_effect = [None, None, RuntimeError("Database lost"), None]
+
+        # Execute
+        with patch.object(OrderService, "order_state_store", store):
+            result = OrderService.process_orders(orders, incremental=True, db_batch_size=2)
+            stats = IncrementalStats()
+            OrderService.process_orders(orders, incremental=True, stats=stats, db_batch_size=2)
+
+        # Assert
+        self.assertFalse(result)
+        # The four orders persisted before the run failed are not processed again
+        self.assertEqual((stats.processed, stats.skipped), (1, 4))
+        self.assertEqual(mock_update_orders.call_count, 4)
+
+    def test_should_raise_value_error_when_incremental_mode_has_no_state_store(self):
+        # Execute & Assert
+        with self.assertRaises(ValueError):
+            OrderService.process_orders([get_valid_order_fixture()], incremental=True)
+
+    @patch("services.order_service.OrderService.update_order")
+    @patch("utils.exporters.csv_exporter.CSVExporter.export")
+    def test_should_return_processing_report_when_with_report_is_set(self, mock_export, mock_update_order):
+        # Setup
+        mock_export.side_effect = IOError("Test IO Exception")
+
+        def update_order(order):
+            if order.id == 62:
+                raise DatabaseException("Test exception")
+            return True
+
+        mock_update_order.side_effect = update_order
+        orders = [
+            Order(id=60, type=OrderType.A, amount=300.0, is_special=False),
+            Order(id=61, type=OrderType.C, amount=10.0, is_special=True),
+            Order(id=62, type=OrderType.C, amount=20.0, is_special=False),
+            Order(id=63, type="INVALID_TYPE", amount=5.0, is_special=False),
+        ]
+
+        # Execute
+        report = OrderService.process_orders(orders, user_id=1, with_report=True)
+
+        # Assert
+        self.assertTrue(report.success)
+        self.assertEqual(report.order_count, 4)
+        self.assertEqual(
+            dict(report.status_counts),
+            {OrderStatus.EXPORT_FAILED: 1, OrderStatus.COMPLETED: 1, OrderStatus.DB_ERROR: 1, OrderStatus.UNKNOWN_TYPE: 1},
+        )
+        self.assertEqual(dict(report.priority_counts), {OrderPriority.HIGH: 1, OrderPriority.LOW: 3})
+        self.assertEqual(report.total_amount, 335.0)
+        self.assertEqual(report.to_dict()["failed_ids"], {Stage.EXPORT: [60], Stage.UPDATE: [62]})
+        self.assertGreater(report.elapsed, 0)
+
+    @patch("services.order_service.OrderService.fetch_orders_by_user")
+    def test_should_return_failed_report_when_fetch_fails_and_with_report_is_set(self, mock_fetch_orders_by_user):
+        # Setup
+        mock_fetch_orders_by_user.side_effect = DatabaseException("Test exception")
+
+        # Execute
+        report = OrderService.process_order_by_user_id(1, with_report=True)
+
+        # Assert
+        self.assertFalse(report.success)
+        self.assertEqual(report.order_count, 0)
+
+    @patch("services.order_service.OrderService.update_order")
+    def test_should_resume_after_last_committed_order_when_checkpointed_run_is_rerun(self, mock_update_order):
+        # Setup
+        store = SQLiteOrderStateStore()
+        self.addCleanup(store.close)
+        orders = [Order(id=80 + i, type=OrderType.C, amount=10.0, is_special=True) for i in range(6)]
+
+        def read_orders():
+            yield from orders[:4]
+            raise Exception("Connection lost")
+
+        # Execute
+        with patch.object(OrderService, "order_state_store", store):
+            first = OrderService.process_orders(read_orders(), run_id="run-1", checkpoint=True, db_batch_size=3)
+            first_offset = store.get_checkpoint("run-1")
+            second = OrderService.process_orders(orders, run_id="run-1", checkpoint=True, db_batch_size=3)
+
+        # Assert
+        self.assertFalse(first)
+        # The fourth order was still waiting for its bulk write when the input failed
+        self.assertEqual(first_offset, 3)
+        self.assertTrue(second)
+        self.assertEqual(store.get_checkpoint("run-1"), 6)
+        self.assertEqual([call.args[0].id for call in mock_update_order.call_args_list], [80, 81, 82, 83, 84, 85])
+
+    @patch("services.order_service.OrderService.update_order")
+    def test_should_process_high_priority_orders_first_when_draining_order_queue(self, mock_update_order):
+        # Setup
+        queue = InMemoryOrderQueue(shards=2)
+        low_orders = [Order(id=90 + i, type=OrderType.C, amount=10.0, is_special=True) for i in range(3)]
+        high_order = Order(id=99, type=OrderType.C, amount=OrderAmountThreshold.PRIORITY_THRESHOLD + 1, is_special=True)
+
+        # Execute
+        with patch.object(OrderService, "order_queue", queue):
+            OrderService.enqueue_orders(low_orders)
+            OrderService.enqueue_orders([high_order])
+            stats = OrderService.process_order_queue(workers=1, lease_size=1)
+
+        # Assert
+        self.assertEqual([call.args[0].id for call in mock_update_order.call_args_list], [99, 90, 92, 91])
+        self.assertEqual(dict(stats.processed), {OrderPriority.HIGH: 1, OrderPriority.LOW: 3})
+        self.assertEqual(dict(stats.status_counts), {OrderStatus.COMPLETED: 4})
+        self.assertEqual(stats.queue_latency[OrderPriority.HIGH].count, 1)
+        self.assertEqual(len(queue), 0)
+
+    @patch("services.order_service.OrderService.update_order")
+    def test_should_dead_letter_failing_order_after_max_attempts_when_draining_order_queue(self, mock_update_order):
+        # Setup
+        queue = InMemoryOrderQueue(shards=1)
+        orders = [
+            Order(id=100, type=OrderType.C, amount=10.0, is_special=True),
+            Order(id=101, type=OrderType.C, amount=None, is_special=True),
+            Order(id=102, type=OrderType.C, amount=10.0, is_special=True),
+        ]
+
+        # Execute
+        with patch.object(OrderService, "order_queue", queue):
+            queue.enqueue((order, OrderPriority.LOW) for order in orders)
+            stats = OrderService.process_order_queue(workers=1, max_attempts=3, retry_delay=0.01)
+
+        # Assert
+        self.assertEqual([call.args[0].id for call in mock_update_order.call_args_list], [100, 101, 102, 101, 101])
+        self.assertEqual(dict(stats.status_counts), {OrderStatus.COMPLETED: 2, OrderStatus.PROCESSING_ERROR: 1})
+        self.assertEqual(dict(stats.retried), {OrderPriority.LOW: 2})
+        self.assertEqual(dict(stats.dead_lettered), {OrderPriority.LOW: 1})
+        self.assertEqual(len(queue), 0)
+        dead_letters = queue.dead_letters()
+        self.assertEqual([(entry.order.id, entry.attempts) for entry in dead_letters], [(101, 3)])
+        self.assertEqual(dead_letters[0].order.status, OrderStatus.PROCESSING_ERROR)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,123 @@
+import csv
+import os
+import queue
+import struct
+import tempfile
+import threading
+import time
+import unittest
+
+from utils.exporters.background_export_writer import BackgroundExportWriter
+from utils.exporters.columnar_exporter import ColumnarExporter
+from utils.exporters.csv_exporter import CSVExporter
+
+
+class RecordingExporter:
+    """Exporter stand-in recording written buffers, failing or blocking on demand."""
+
+    supports_append = True
+
+    def __init__(self, fail_on_flush=None, gate=None):
+        self.flushes = []
+        self.opened = 0
+        self.closed = False
+        self.fail_on_flush = fail_on_flush
+        self.gate = gate
+
+    def __call__(self, savedir, columns=None):
+        return self
+
+    def open(self):
+        self.opened += 1
+        return self
+
+    def write_rows(self, rows):
+        if self.gate is not None:
+            self.gate.wait()
+        self.flushes.append(list(rows))
+        if len(self.flushes) == self.fail_on_flush:
+            raise IOError("Test IO Exception")
+
+    def flush(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+
+class TestBackgroundExportWriter(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_should_write_single_header_when_rows_are_flushed_several_times(self):
+        path = os.path.join(self.directory.name, "orders.csv")
+        writer = BackgroundExportWriter(CSVExporter, path, columns=["ID", "Amount"], flush_rows=2)
+
+        for i in range(5):
+            writer.write([[i, i * 10.0]], key=i)
+        failed = writer.close()
+
+        with open(path, newline="") as file_handler:
+            rows = list(csv.reader(file_handler))
+        self.assertEqual(failed, set())
+        self.assertEqual(rows[0], ["ID", "Amount"])
+        self.assertEqual([row[0] for row in rows[1:]], ["0", "1", "2", "3", "4"])
+
+    def test_should_flush_buffer_when_flush_interval_elapses(self):
+        exporter = RecordingExporter()
+        writer = BackgroundExportWriter(exporter, "unused", flush_rows=100, flush_interval=0.01)
+
+        writer.write([[1]], key=1)
+        deadline = time.monotonic() + 2
+        while not exporter.flushes and time.monotonic() < deadline:
+            time.sleep(0.005)
+        writer.close()
+
+        self.assertEqual(exporter.flushes, [[[1]]])
+
+    def test_should_report_only_keys_of_failed_flush_when_export_raises_io_error(self):
+        exporter = RecordingExporter(fail_on_flush=2)
+        writer = BackgroundExportWriter(exporter, "unused", flush_rows=2)
+
+        for i in range(6):
+            writer.write([[i]], key=i)
+        failed = writer.close()
+
+        self.assertEqual(failed, {2, 3})
+        self.assertEqual(len(writer.errors), 1)
+        self.assertEqual(len(exporter.flushes), 3)
+        self.assertEqual(exporter.opened, 1)
+        self.assertTrue(exporter.closed)
+
+    def test_should_block_producer_when_queue_is_full(self):
+        gate = threading.Event()
+        writer = BackgroundExportWriter(RecordingExporter(gate=gate), "unused", max_queue_size=1, flush_rows=1)
+
+        writer.write([[1]], key=1)
+        with self.assertRaises(queue.Full):
+            for i in range(2, 5):
+                writer.write([[i]], key=i, timeout=0.05)
+        gate.set()
+
+        self.assertEqual(writer.close(), set())
+
+    def test_should_complete_file_on_close_when_exporter_cannot_append(self):
+        path = os.path.join(self.directory.name, "orders.ordc")
+        writer = BackgroundExportWriter(ColumnarExporter, path, columns=["ID"], flush_rows=1)
+
+        for i in range(3):
+            writer.write([[i]], key=i)
+        writer.flush()
+        # Flushed row groups are on disk, but the file is only readable once closed
+        with self.assertRaises(struct.error):
+            ColumnarExporter.load(path)
+        writer.close()
+
+        self.assertEqual(ColumnarExporter.load(path), (["ID"], [[0], [1], [2]]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,125 @@
+import csv
+import gzip
+import json
+import os
+import struct
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from utils.exporters.base_exporter import BaseExporter
+from utils.exporters.columnar_exporter import ColumnarExporter
+from utils.exporters.csv_exporter import CSVExporter
+from utils.exporters.gzip_csv_exporter import GzipCSVExporter
+from utils.exporters.jsonl_exporter import JSONLinesExporter
+
+COLUMNS = ["ID", "Type", "Amount", "Is Special", "Status", "Priority"]
+ROWS = [
+    [1, "A", 100.0, "false", "new", "low"],
+    [2, "A", 160.5, "true", "new", "low"],
+    ["", "", "", "", "Note", "High value order"],
+]
+
+
+class TestExporters(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def _path(self, exporter):
+        return os.path.join(self.directory.name, f"orders{exporter.extension}")
+
+    def test_should_return_registered_exporter_when_format_is_known(self):
+        self.assertIs(BaseExporter.get_exporter("csv"), CSVExporter)
+        self.assertIs(BaseExporter.get_exporter("csv.gz"), GzipCSVExporter)
+        self.assertIs(BaseExporter.get_exporter("jsonl"), JSONLinesExporter)
+        self.assertIs(BaseExporter.get_exporter("columnar"), ColumnarExporter)
+
+    def test_should_raise_value_error_when_format_is_unknown(self):
+        with self.assertRaises(ValueError):
+            BaseExporter.get_exporter("xml")
+
+    def test_should_write_compressed_csv_when_gzip_exporter_is_used(self):
+        path = self._path(GzipCSVExporter)
+
+        GzipCSVExporter.export(ROWS, path, columns=COLUMNS)
+
+        with gzip.open(path, "rt", newline="") as file_handler:
+            rows = list(csv.reader(file_handler))
+        self.assertEqual(rows[0], COLUMNS)
+        self.assertEqual(rows[2], ["2", "A", "160.5", "true", "new", "low"])
+
+    def test_should_write_one_object_per_line_when_jsonl_exporter_is_used(self):
+        path = self._path(JSONLinesExporter)
+
+        JSONLinesExporter.export(ROWS, path, columns=COLUMNS)
+
+        with open(path) as file_handler:
+            documents = [json.loads(line) for line in file_handler]
+        self.assertEqual(len(documents), 3)
+        self.assertEqual(documents[1]["Amount"], 160.5)
+        self.assertEqual(documents[2]["Priority"], "High value order")
+
+    def test_should_round_trip_rows_when_columnar_exporter_is_used(self):
+        path = self._path(ColumnarExporter)
+        rows = [[i, "A", float(i), "new"] for i in range(100)]
+
+        ColumnarExporter.export(rows, path, columns=["ID", "Type", "Amount", "Status"])
+        columns, loaded = ColumnarExporter.load(path)
+
+        self.assertEqual(columns, ["ID", "Type", "Amount", "Status"])
+        self.assertEqual(loaded, rows)
+        # IDs and amounts take 8 bytes each, repeated strings 1 byte per row
+        self.assertLess(os.path.getsize(path), 100 * 18 + 200)
+
+    def test_should_keep_empty_values_when_columnar_rows_contain_notes(self):
+        path = self._path(ColumnarExporter)
+
+        ColumnarExporter.export(ROWS, path, columns=COLUMNS)
+
+        self.assertEqual(ColumnarExporter.load(path), (COLUMNS, ROWS))
+
+    def test_should_write_little_endian_row_groups_when_columnar_rows_exceed_group_size(self):
+        path = self._path(ColumnarExporter)
+        rows = [[0x0102 + i, f"type_{i % 2}"] for i in range(5)]
+
+        with patch.object(ColumnarExporter, "row_group_size", 2):
+            ColumnarExporter.export(rows, path, columns=["ID", "Type"])
+
+        self.assertEqual(ColumnarExporter.load(path), (["ID", "Type"], rows))
+        with open(path, "rb") as file_handler:
+            content = file_handler.read()
+        self.assertIn(struct.pack("<q", 0x0102), content)
+        # The last row group holds the fifth row alone, starting with its integer ID column
+        self.assertIn(struct.pack("<I", 1) + struct.pack("<B", 0), content)
+        self.assertTrue(content.endswith(struct.pack("<I", 0)))
+
+    def test_should_raise_io_error_when_target_directory_is_missing(self):
+        path = os.path.join(self.directory.name, "missing", "orders.jsonl")
+
+        with self.assertRaises(IOError):
+            JSONLinesExporter.export(ROWS, path, columns=COLUMNS)
+
+    def test_should_write_header_once_when_rows_are_streamed_in_several_calls(self):
+        path = self._path(CSVExporter)
+
+        with CSVExporter(path, columns=COLUMNS) as exporter:
+            exporter.write_rows(iter(ROWS[:1]))
+            exporter.write_rows(row for row in ROWS[1:])
+        CSVExporter.export(ROWS[:1], path, columns=COLUMNS, mode="a")
+
+        with open(path, newline="") as file_handler:
+            rows = list(csv.reader(file_handler))
+        self.assertEqual(rows[0], COLUMNS)
+        self.assertEqual(len(rows), 1 + len(ROWS) + 1)
+        self.assertEqual(rows[-1], rows[1])
+
+    def test_should_raise_value_error_when_exporter_cannot_append(self):
+        with self.assertRaises(ValueError):
+            ColumnarExporter(self._path(ColumnarExporter), columns=COLUMNS, mode="a")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,113 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from constants.constants import OrderType, OrderStatus, OrderPriority
+from models.order_batch import OrderBatch
+from models.order_model import Order
+from utils.ingestion.binary_order_file_reader import HEADER, MAGIC, RECORD, VERSION, BinaryOrderFileReader
+from utils.ingestion.csv_order_file_reader import CSVOrderFileReader
+
+
+def build_orders(count):
+    order_types = [OrderType.A, OrderType.B, OrderType.C, "INVALID_TYPE"]
+    orders = [
+        Order(id=i, type=order_types[i % 4], amount=i * 1.25, is_special=i % 3 == 0) for i in range(1, count + 1)
+    ]
+    orders[0].status = OrderStatus.EXPORTED
+    orders[0].priority = OrderPriority.HIGH
+    return orders
+
+
+def as_tuples(orders):
+    return [(order.id, order.type, order.amount, order.is_special, order.status, order.priority) for order in orders]
+
+
+class TestOrderFileReaders(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def _write_csv(self, content):
+        path = os.path.join(self.directory.name, "orders.csv")
+        with open(path, "w", newline="") as file_handler:
+            file_handler.write(content)
+        return path
+
+    def test_should_read_same_orders_when_csv_is_split_into_small_chunks(self):
+        orders = build_orders(50)
+        lines = [f"{order.id},{order.type},{order.amount},{str(order.is_special).lower()}" for order in orders]
+        path = self._write_csv("id,type,amount,is_special\r\n" + "\r\n".join(lines))
+
+        for chunk_size in [1, 7, 64, 1 << 20]:
+            reader = CSVOrderFileReader(path, chunk_size=chunk_size)
+            read = list(reader.iter_orders())
+
+            self.assertEqual(
+                [(order.id, order.type, order.amount, order.is_special) for order in read],
+                [(order.id, order.type, order.amount, order.is_special) for order in orders],
+            )
+            self.assertEqual({(order.status, order.priority) for order in read}, {(OrderStatus.NEW, OrderPriority.LOW)})
+
+    def test_should_raise_value_error_when_csv_record_is_malformed(self):
+        path = self._write_csv("id,type,amount,is_special\n1,A,10.0,false\nnot a record\n")
+
+        with self.assertRaises(ValueError):
+            list(CSVOrderFileReader(path).iter_batches())
+
+    def test_should_round_trip_orders_when_binary_file_is_read_in_chunks(self):
+        orders = build_orders(100)
+        path = os.path.join(self.directory.name, "orders.ordb")
+        BinaryOrderFileReader.write(path, OrderBatch.from_orders(orders))
+
+        reader = BinaryOrderFileReader(path, chunk_size=100)
+        batches = list(reader.iter_batches())
+
+        # 100 byte chunks are rounded up to the next 24 byte record
+        self.assertEqual(len(batches), 20)
+        self.assertEqual(as_tuples(order for batch in batches for order in batch), as_tuples(orders))
+
+    def test_should_read_same_orders_when_chunks_are_parsed_in_parallel(self):
+        orders = build_orders(300)
+        path = os.path.join(self.directory.name, "orders.ordb")
+        BinaryOrderFileReader.write(path, OrderBatch.from_orders(orders))
+
+        read = list(BinaryOrderFileReader(path, chunk_size=1000).iter_orders(workers=2))
+
+        self.assertEqual(as_tuples(read), as_tuples(orders))
+
+    def test_should_raise_value_error_when_binary_file_is_truncated(self):
+        path = os.path.join(self.directory.name, "orders.ordb")
+        BinaryOrderFileReader.write(path, OrderBatch.from_orders(build_orders(3)))
+        with open(path, "r+b") as file_handler:
+            file_handler.truncate(os.path.getsize(path) - 1)
+
+        with self.assertRaises(ValueError):
+            BinaryOrderFileReader(path).chunks()
+
+    def test_should_raise_value_error_when_binary_type_names_are_truncated(self):
+        path = os.path.join(self.directory.name, "orders.ordb")
+        with open(path, "wb") as file_handler:
+            # Declares one type name of 200 bytes, but the file ends right after its length
+            file_handler.write(HEADER.pack(MAGIC, VERSION, 1, 0) + bytes([200]))
+
+        with self.assertRaisesRegex(ValueError, "truncated"):
+            BinaryOrderFileReader(path).chunks()
+
+    def test_should_read_header_once_per_mapping_when_binary_file_has_several_chunks(self):
+        path = os.path.join(self.directory.name, "orders.ordb")
+        BinaryOrderFileReader.write(path, OrderBatch.from_orders(build_orders(100)))
+        reader = BinaryOrderFileReader(path, chunk_size=RECORD.size * 10)
+
+        with patch.object(BinaryOrderFileReader, "_read_header", wraps=reader._read_header) as read_header:
+            batches = list(reader.iter_batches())
+
+        self.assertEqual(len(batches), 10)
+        self.assertEqual(read_header.call_count, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
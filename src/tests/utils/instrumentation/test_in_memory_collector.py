@@ -0,0 +1,43 @@
+import json
+import unittest
+
+from utils.instrumentation.base_instrumentation import Stage
+from utils.instrumentation.in_memory_collector import InMemoryCollector, LatencyHistogram
+
+
+class TestLatencyHistogram(unittest.TestCase):
+    def test_should_return_percentiles_within_bucket_precision_when_samples_are_recorded(self):
+        histogram = LatencyHistogram()
+        for i in range(1, 1001):
+            histogram.record(i / 1000)
+
+        self.assertEqual(histogram.count, 1000)
+        self.assertAlmostEqual(histogram.percentile(50), 0.5, delta=0.05)
+        self.assertAlmostEqual(histogram.percentile(95), 0.95, delta=0.05)
+        self.assertAlmostEqual(histogram.percentile(99), 0.99, delta=0.05)
+        self.assertLessEqual(histogram.percentile(100), 1.0)
+
+    def test_should_return_zero_when_histogram_is_empty(self):
+        self.assertEqual(LatencyHistogram().percentile(99), 0.0)
+
+
+class TestInMemoryCollector(unittest.TestCase):
+    def test_should_export_snapshot_as_json_when_stages_and_orders_are_recorded(self):
+        collector = InMemoryCollector()
+        collector.record_stage(Stage.API, 0.2)
+        collector.record_stage(Stage.API, 0.4)
+        collector.record_order("A", "exported")
+
+        snapshot = json.loads(collector.to_json())
+
+        self.assertEqual(snapshot["stages"][Stage.API]["count"], 2)
+        self.assertAlmostEqual(snapshot["stages"][Stage.API]["total"], 0.6)
+        self.assertEqual(snapshot["order_types"], {"A": 1})
+        self.assertEqual(snapshot["order_statuses"], {"exported": 1})
+
+        collector.reset()
+        self.assertEqual(collector.snapshot()["stages"], {})
+
+
+if __name__ == "__main__":
+    unittest.main()
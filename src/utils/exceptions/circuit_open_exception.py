@@ -0,0 +1,7 @@
+from .api_exception import APIException
+
+
+class CircuitOpenException(APIException):
+    """Exception raised when an API call is rejected because the circuit breaker is open."""
+
+    pass
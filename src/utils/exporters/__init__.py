@@ -0,0 +1,2 @@
+# Built-in exporters are imported, and so registered, on first lookup of their
+# format by BaseExporter.get_exporter, keeping their dependencies off startup
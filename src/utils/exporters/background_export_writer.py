@@ -0,0 +1,145 @@
+import queue
+import threading
+import time
+from typing import Hashable, List, Set
+
+from constants.constants import (
+    DEFAULT_EXPORT_QUEUE_SIZE,
+    DEFAULT_EXPORT_FLUSH_ROWS,
+    DEFAULT_EXPORT_FLUSH_INTERVAL,
+)
+
+_FLUSH = object()
+_STOP = object()
+
+
+class BackgroundExportWriter:
+    """Writes exported rows to a file from a background thread.
+
+    Producers hand rows to ``write``, which only enqueues them; a writer
+    thread buffers them and streams them to the exporter once ``flush_rows``
+    rows are buffered or ``flush_interval`` seconds have passed. The queue
+    is bounded, so ``write`` blocks while the writer is behind.
+
+    Every ``write`` carries a key, e.g. the position of its order. When a
+    flush raises, the keys of the rows in that flush are recorded as failed
+    and returned by ``flush`` and ``close``. Exporters without
+    ``supports_append`` only complete their file on close, so a failure at
+    that point fails every key they were given.
+    """
+
+    def __init__(
+        self,
+        exporter,
+        savedir: str,
+        columns: List[str] = None,
+        max_queue_size: int = DEFAULT_EXPORT_QUEUE_SIZE,
+        flush_rows: int = DEFAULT_EXPORT_FLUSH_ROWS,
+        flush_interval: float = DEFAULT_EXPORT_FLUSH_INTERVAL,
+    ) -> None:
+        self.exporter = exporter
+        self.savedir = savedir
+        self.columns = columns or []
+        self.flush_rows = flush_rows
+        self.flush_interval = flush_interval
+        self.failed_keys = set()
+        self.errors = []
+        self._queue = queue.Queue(maxsize=max_queue_size)
+        self._stream = None
+        self._rows = []
+        self._keys = []
+        # Keys handed to the stream but not yet known to be on disk
+        self._unsettled_keys = []
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="export-writer", daemon=True)
+        self._thread.start()
+
+    def write(self, rows: List[list], key: Hashable = None, timeout: float = None) -> None:
+        """Enqueue rows for export, blocking while the queue is full.
+
+        Raises:
+                queue.Full: If ``timeout`` expires before there is room in the queue
+        """
+        if self._closed:
+            raise RuntimeError("Export writer is closed")
+        self._queue.put((key, rows), timeout=timeout)
+
+    def flush(self) -> Set[Hashable]:
+        """Write everything enqueued so far and return the keys that failed to export."""
+        done = threading.Event()
+        self._queue.put((_FLUSH, done))
+        done.wait()
+        return set(self.failed_keys)
+
+    def close(self) -> Set[Hashable]:
+        """Write the remaining rows, close the file and return the keys that failed."""
+        if not self._closed:
+            self._closed = True
+            self._queue.put((_STOP, None))
+            self._thread.join()
+        return set(self.failed_keys)
+
+    def __enter__(self) -> "BackgroundExportWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _run(self) -> None:
+        deadline = None
+        while True:
+            timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+            try:
+                key, rows = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                self._write_buffer()
+                deadline = None
+                continue
+
+            if key is _STOP:
+                self._write_buffer()
+                self._close_stream()
+                return
+            if key is _FLUSH:
+                self._write_buffer()
+                deadline = None
+                rows.set()
+                continue
+
+            self._rows.extend(rows)
+            self._keys.append(key)
+            if deadline is None and self.flush_interval is not None:
+                deadline = time.monotonic() + self.flush_interval
+            if len(self._rows) >= self.flush_rows:
+                self._write_buffer()
+                deadline = None
+
+    def _write_buffer(self) -> None:
+        if not self._keys:
+            return
+
+        try:
+            if self._stream is None:
+                self._stream = self.exporter(self.savedir, columns=self.columns).open()
+            self._stream.write_rows(self._rows)
+            self._stream.flush()
+        except Exception as e:
+            # Any failure must be reported back rather than kill the writer thread
+            self.errors.append(e)
+            self.failed_keys.update(self._keys)
+        else:
+            if not self.exporter.supports_append:
+                self._unsettled_keys.extend(self._keys)
+
+        self._rows = []
+        self._keys = []
+
+    def _close_stream(self) -> None:
+        if self._stream is None:
+            return
+
+        try:
+            self._stream.close()
+        except Exception as e:
+            self.errors.append(e)
+            self.failed_keys.update(self._unsettled_keys)
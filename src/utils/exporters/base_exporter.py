@@ -1,10 +1,123 @@
+import importlib
 from abc import ABC, abstractmethod
+from typing import Dict, Iterable, List
+
+from constants.constants import DEFAULT_EXPORT_BUFFER_SIZE
+
+# Modules of the built-in exporters, imported on first lookup of their format
+BUILTIN_EXPORTERS = {
+    "csv": "utils.exporters.csv_exporter",
+    "csv.gz": "utils.exporters.gzip_csv_exporter",
+    "jsonl": "utils.exporters.jsonl_exporter",
+    "columnar": "utils.exporters.columnar_exporter",
+}
 
 
 class BaseExporter(ABC):
-    """Abstract base class for all exporters in the application."""
+    """Abstract base class for all exporters in the application.
+
+    An exporter instance is a stream over one file: ``open`` it once, call
+    ``write_rows`` any number of times with any iterable of rows, then
+    ``close`` it, or use it as a context manager. Writes go through a
+    ``buffer_size`` bytes buffer, so rows can be produced lazily without
+    building the whole export in memory. ``export`` does all of this in one
+    call.
+
+    Exporters register themselves under their ``format_name`` with the
+    ``BaseExporter.register`` decorator, and are looked up by format with
+    ``BaseExporter.get_exporter``, which imports built-in exporters on first
+    use. Exporters with ``supports_append`` accept
+    ``mode="a"`` to add rows to an existing file without repeating the header.
+    """
+
+    format_name: str = None
+    extension: str = None
+    supports_append: bool = False
+    error_message: str = "Failed to export order"
+
+    _registry: Dict[str, type] = {}
+
+    def __init__(
+        self,
+        savedir: str,
+        columns: List[str] = None,
+        mode: str = "w",
+        buffer_size: int = DEFAULT_EXPORT_BUFFER_SIZE,
+    ) -> None:
+        if mode not in ("w", "a") or (mode == "a" and not self.supports_append):
+            raise ValueError(f"Unsupported mode {mode!r} for {type(self).__name__}")
+
+        self.savedir = savedir
+        self.columns = list(columns or [])
+        self.mode = mode
+        self.buffer_size = buffer_size
+
+    @abstractmethod
+    def open(self) -> "BaseExporter":
+        """Open the target file and write the header, if any."""
+        pass
+
+    @abstractmethod
+    def write_rows(self, rows: Iterable[list]) -> None:
+        """Write rows to the open file."""
+        pass
+
+    def flush(self) -> None:
+        """Push buffered rows to the operating system."""
+        pass
 
     @abstractmethod
-    def export(data, savedir: str, *args, **kwargs) -> None:
-        """Export data to a specified file format."""
+    def close(self) -> None:
+        """Flush remaining rows and close the file."""
         pass
+
+    def __enter__(self) -> "BaseExporter":
+        return self.open()
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    @classmethod
+    def export(cls, data: Iterable[list], savedir: str, *args, **kwargs) -> None:
+        """Export data to a specified file format.
+
+        Args:
+                data (Iterable[list]): Rows to be exported, without the header
+                savedir (str): Path of the target file
+                **kwargs: ``columns`` for the header, plus any option accepted
+                        by the exporter constructor such as ``mode``
+
+        Raises:
+                IOError: If the file can't be written
+        """
+        try:
+            with cls(savedir, **kwargs) as exporter:
+                exporter.write_rows(data)
+        except IOError as e:
+            raise IOError(f"{cls.error_message}: {e}")
+
+    @classmethod
+    def register(cls, exporter_class: type) -> type:
+        """Class decorator registering an exporter under its format name."""
+        BaseExporter._registry[exporter_class.format_name] = exporter_class
+        return exporter_class
+
+    @classmethod
+    def get_exporter(cls, format_name: str) -> type:
+        """Return the exporter class registered for ``format_name``.
+
+        Raises:
+                ValueError: If no exporter is registered for the format
+        """
+        if format_name not in BaseExporter._registry and format_name in BUILTIN_EXPORTERS:
+            importlib.import_module(BUILTIN_EXPORTERS[format_name])
+
+        try:
+            return BaseExporter._registry[format_name]
+        except KeyError:
+            raise ValueError(f"Unknown export format {format_name!r}, expected one of {cls.formats()}")
+
+    @classmethod
+    def formats(cls) -> List[str]:
+        """Return the names of the built-in and registered formats, without importing them."""
+        return sorted(set(BUILTIN_EXPORTERS) | set(BaseExporter._registry))
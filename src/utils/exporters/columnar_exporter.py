@@ -0,0 +1,181 @@
+import struct
+import sys
+from array import array
+from typing import Iterable, List, Tuple
+
+from constants.constants import DEFAULT_COLUMNAR_ROW_GROUP_SIZE
+from .base_exporter import BaseExporter
+
+MAGIC = b"ORDC"
+VERSION = 2
+# Arrays are stored little-endian whatever the byte order of the host
+SWAP_BYTES = sys.byteorder == "big"
+
+# Column encodings
+INT_COLUMN = 0
+FLOAT_COLUMN = 1
+DICTIONARY_COLUMN = 2
+
+
+def _write_string(file_handler, value: str) -> None:
+    encoded = value.encode("utf-8")
+    file_handler.write(struct.pack("<I", len(encoded)))
+    file_handler.write(encoded)
+
+
+def _read_string(file_handler) -> str:
+    (length,) = struct.unpack("<I", file_handler.read(4))
+    return file_handler.read(length).decode("utf-8")
+
+
+def _to_bytes(values: array) -> bytes:
+    if SWAP_BYTES:
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def _read_array(file_handler, typecode: str, count: int) -> array:
+    values = array(typecode)
+    values.frombytes(file_handler.read(values.itemsize * count))
+    if SWAP_BYTES:
+        values.byteswap()
+    return values
+
+
+@BaseExporter.register
+class ColumnarExporter(BaseExporter):
+    """Exports rows in a compact little-endian columnar binary format.
+
+    Layout: the ``ORDC`` magic, a version byte, the column count and the
+    column names, then row groups of at most ``row_group_size`` rows, ended
+    by an empty group. A row group holds its row count, then for every column
+    an encoding byte and its values. Integer and float columns are stored as
+    8-byte arrays, with a one byte per row null mask when the column has
+    empty values, such as on note rows. Any other column is
+    dictionary-encoded as a table of distinct strings plus one code per row,
+    using the smallest code width fitting the table, which keeps repetitive
+    values such as types, statuses and priorities to one byte per row.
+
+    Only the current row group is kept in memory, and ``flush`` writes it
+    out early. Without ``columns`` the column count is taken from the first
+    row group. ``load`` reads a file back.
+    """
+
+    format_name = "columnar"
+    extension = ".ordc"
+    error_message = "Failed to export order to columnar format"
+
+    row_group_size = DEFAULT_COLUMNAR_ROW_GROUP_SIZE
+
+    _file = None
+    _rows = None
+
+    @staticmethod
+    def _encode_column(values: list) -> Tuple[int, bytes]:
+        present = [value for value in values if value != ""]
+        nulls = bytes(1 if value == "" else 0 for value in values)
+        null_mask = b"\x01" + nulls if any(nulls) else b"\x00"
+
+        if present and all(type(value) is int for value in present):
+            column = array("q", [0 if value == "" else value for value in values])
+            return INT_COLUMN, null_mask + _to_bytes(column)
+        if present and all(type(value) in (int, float) for value in present):
+            column = array("d", [0.0 if value == "" else value for value in values])
+            return FLOAT_COLUMN, null_mask + _to_bytes(column)
+
+        table = {}
+        codes = [table.setdefault(str(value), len(table)) for value in values]
+        typecode = "B" if len(table) <= 0xFF else "H" if len(table) <= 0xFFFF else "I"
+        strings = b"".join(
+            struct.pack("<I", len(encoded)) + encoded for encoded in (value.encode("utf-8") for value in table)
+        )
+        header = struct.pack("<Ic", len(table), typecode.encode())
+        return DICTIONARY_COLUMN, header + strings + _to_bytes(array(typecode, codes))
+
+    def open(self) -> "ColumnarExporter":
+        self._file = open(self.savedir, "wb", buffering=self.buffer_size)
+        self._rows = []
+        return self
+
+    def write_rows(self, rows: Iterable[list]) -> None:
+        for row in rows:
+            self._rows.append(list(row))
+            if len(self._rows) >= self.row_group_size:
+                self._write_row_group()
+
+    def _write_header(self) -> None:
+        self._file.write(MAGIC)
+        self._file.write(struct.pack("<BI", VERSION, len(self.columns)))
+        for name in self.columns:
+            _write_string(self._file, str(name))
+
+    def _write_row_group(self) -> None:
+        """Encode the buffered rows column by column and write them as one row group."""
+        rows, self._rows = self._rows, []
+        if not rows:
+            return
+
+        if self._file.tell() == 0:
+            width = max(len(row) for row in rows)
+            self.columns = self.columns or [f"column_{index}" for index in range(width)]
+            self._write_header()
+
+        self._file.write(struct.pack("<I", len(rows)))
+        for index in range(len(self.columns)):
+            # Short rows are padded so that every column has one value per row
+            encoding, payload = self._encode_column([row[index] if index < len(row) else "" for row in rows])
+            self._file.write(struct.pack("<B", encoding))
+            self._file.write(payload)
+
+    def flush(self) -> None:
+        self._write_row_group()
+        self._file.flush()
+
+    def close(self) -> None:
+        """Write the last row group and the end marker, and close the file."""
+        if self._file is None:
+            return
+        try:
+            self._write_row_group()
+            if self._file.tell() == 0:
+                self._write_header()
+            self._file.write(struct.pack("<I", 0))
+        finally:
+            self._file.close()
+            self._file = None
+            self._rows = None
+
+    @staticmethod
+    def load(savedir: str) -> Tuple[List[str], List[list]]:
+        """Read a columnar file back into its column names and rows."""
+        with open(savedir, "rb") as file_handler:
+            if file_handler.read(4) != MAGIC:
+                raise ValueError(f"{savedir} is not a columnar order export")
+            version, column_count = struct.unpack("<BI", file_handler.read(5))
+            if version != VERSION:
+                raise ValueError(f"{savedir} is not a version {VERSION} columnar order export")
+            columns = [_read_string(file_handler) for _ in range(column_count)]
+
+            rows = []
+            while True:
+                (row_count,) = struct.unpack("<I", file_handler.read(4))
+                if not row_count:
+                    break
+                values = [ColumnarExporter._read_column(file_handler, row_count) for _ in range(column_count)]
+                rows.extend(list(row) for row in zip(*values))
+
+        return columns, rows
+
+    @staticmethod
+    def _read_column(file_handler, row_count: int) -> list:
+        (encoding,) = struct.unpack("<B", file_handler.read(1))
+        if encoding == DICTIONARY_COLUMN:
+            table_size, typecode = struct.unpack("<Ic", file_handler.read(5))
+            table = [_read_string(file_handler) for _ in range(table_size)]
+            return [table[code] for code in _read_array(file_handler, typecode.decode(), row_count)]
+
+        has_nulls = file_handler.read(1) == b"\x01"
+        nulls = file_handler.read(row_count) if has_nulls else bytes(row_count)
+        column = _read_array(file_handler, "q" if encoding == INT_COLUMN else "d", row_count)
+        return ["" if null else value for null, value in zip(nulls, column)]
@@ -1,21 +1,34 @@
 import csv
+from typing import Iterable
 
 from .base_exporter import BaseExporter
 
 
+@BaseExporter.register
 class CSVExporter(BaseExporter):
+    format_name = "csv"
+    extension = ".csv"
+    supports_append = True
+    error_message = "Failed to export order to CSV"
 
-    def export(data, savedir: str, *args, **kwargs) -> None:
-        try:
-            with open(savedir, "w", newline="") as file_handler:
-                writer = csv.writer(file_handler)
-                columns = kwargs.get("columns", [])
+    _file = None
 
-                if columns:
-                    writer.writerow(columns)
+    def open(self) -> "CSVExporter":
+        self._file = open(self.savedir, self.mode, newline="", buffering=self.buffer_size)
+        self._writer = csv.writer(self._file)
 
-                for row in data:
-                    writer.writerow(row)
+        if self.columns and self.mode == "w":
+            self._writer.writerow(self.columns)
 
-        except IOError as e:
-            raise IOError(f"Failed to export order to CSV: {e}")
+        return self
+
+    def write_rows(self, rows: Iterable[list]) -> None:
+        self._writer.writerows(rows)
+
+    def flush(self) -> None:
+        self._file.flush()
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
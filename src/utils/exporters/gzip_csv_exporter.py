@@ -0,0 +1,50 @@
+import csv
+import gzip
+import io
+from typing import Iterable
+
+from .base_exporter import BaseExporter
+
+
+@BaseExporter.register
+class GzipCSVExporter(BaseExporter):
+    """Exports rows as gzip-compressed CSV."""
+
+    format_name = "csv.gz"
+    extension = ".csv.gz"
+    supports_append = True
+    error_message = "Failed to export order to gzip CSV"
+
+    _file = None
+
+    def __init__(self, *args, compresslevel: int = 6, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.compresslevel = compresslevel
+
+    def open(self) -> "GzipCSVExporter":
+        self._raw = open(self.savedir, self.mode + "b", buffering=self.buffer_size)
+        # Appending adds a new gzip member, which readers decompress as one stream
+        self._gzip = gzip.GzipFile(fileobj=self._raw, mode=self.mode + "b", compresslevel=self.compresslevel)
+        self._file = io.TextIOWrapper(self._gzip, encoding="utf-8", newline="")
+        self._writer = csv.writer(self._file)
+
+        if self.columns and self.mode == "w":
+            self._writer.writerow(self.columns)
+
+        return self
+
+    def write_rows(self, rows: Iterable[list]) -> None:
+        self._writer.writerows(rows)
+
+    def flush(self) -> None:
+        self._file.flush()
+        self._raw.flush()
+
+    def close(self) -> None:
+        if self._file is not None:
+            try:
+                # Closing the text wrapper closes the gzip stream, not the file it writes to
+                self._file.close()
+            finally:
+                self._raw.close()
+                self._file = None
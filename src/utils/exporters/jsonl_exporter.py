@@ -0,0 +1,40 @@
+import json
+from typing import Iterable
+
+from .base_exporter import BaseExporter
+
+
+@BaseExporter.register
+class JSONLinesExporter(BaseExporter):
+    """Exports rows as JSON Lines, one JSON document per row.
+
+    Rows are written as objects keyed by ``columns`` when columns are given,
+    and as plain JSON arrays otherwise.
+    """
+
+    format_name = "jsonl"
+    extension = ".jsonl"
+    supports_append = True
+    error_message = "Failed to export order to JSON Lines"
+
+    _file = None
+
+    def open(self) -> "JSONLinesExporter":
+        self._file = open(self.savedir, self.mode, encoding="utf-8", buffering=self.buffer_size)
+        return self
+
+    def write_rows(self, rows: Iterable[list]) -> None:
+        encode = json.JSONEncoder(separators=(",", ":")).encode
+        columns = self.columns
+
+        self._file.writelines(
+            encode(dict(zip(columns, row)) if columns else list(row)) + "\n" for row in rows
+        )
+
+    def flush(self) -> None:
+        self._file.flush()
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
@@ -0,0 +1,98 @@
+import mmap
+import os
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from typing import Iterator, List, Tuple
+
+from constants.constants import DEFAULT_INGEST_CHUNK_SIZE
+from models.order_batch import OrderBatch
+from models.order_model import Order
+
+
+class BaseOrderFileReader(ABC):
+    """Abstract base class for readers ingesting orders from a local file.
+
+    The file is memory-mapped rather than read, and split into chunks of
+    about ``chunk_size`` bytes that end on a record boundary. Each chunk is
+    parsed straight from the mapping into an OrderBatch. A file header is
+    read once per mapping by ``_read_layout`` and handed to the other hooks.
+    Chunks are independent, so ``iter_batches`` can parse them on a process pool, each
+    worker mapping the file itself.
+    """
+
+    def __init__(self, path: str, chunk_size: int = DEFAULT_INGEST_CHUNK_SIZE) -> None:
+        self.path = path
+        self.chunk_size = chunk_size
+
+    @contextmanager
+    def _mapped(self):
+        """Map the file read-only, yielding an empty buffer for an empty file."""
+        with open(self.path, "rb") as file_handler:
+            if os.fstat(file_handler.fileno()).st_size == 0:
+                yield b""
+                return
+            with mmap.mmap(file_handler.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                yield buffer
+
+    def _read_layout(self, buffer):
+        """Return what the other hooks need from the file header, None for files without one."""
+        return None
+
+    @abstractmethod
+    def _data_range(self, buffer, layout) -> Tuple[int, int]:
+        """Return the offsets where the records of the file start and end."""
+        pass
+
+    @abstractmethod
+    def _chunk_end(self, buffer, offset: int, end: int, layout) -> int:
+        """Return the first record boundary at or after ``offset``, at most ``end``."""
+        pass
+
+    @abstractmethod
+    def _parse(self, buffer, start: int, end: int, layout) -> OrderBatch:
+        """Parse the records between two record boundaries."""
+        pass
+
+    def chunks(self) -> List[Tuple[int, int]]:
+        """Return the ``(start, end)`` byte ranges of the chunks of the file."""
+        ranges = []
+        with self._mapped() as buffer:
+            layout = self._read_layout(buffer)
+            start, end = self._data_range(buffer, layout)
+            while start < end:
+                stop = self._chunk_end(buffer, min(start + self.chunk_size, end), end, layout)
+                ranges.append((start, stop))
+                start = stop
+        return ranges
+
+    def read_chunk(self, start: int, end: int) -> OrderBatch:
+        """Parse one chunk, as returned by ``chunks``."""
+        with self._mapped() as buffer:
+            return self._parse(buffer, start, end, self._read_layout(buffer))
+
+    def iter_batches(self, workers: int = None) -> Iterator[OrderBatch]:
+        """Yield one OrderBatch per chunk, in file order.
+
+        Args:
+                workers (int): Parse chunks on a pool of this many processes
+        """
+        if not workers:
+            with self._mapped() as buffer:
+                layout = self._read_layout(buffer)
+                start, end = self._data_range(buffer, layout)
+                while start < end:
+                    stop = self._chunk_end(buffer, min(start + self.chunk_size, end), end, layout)
+                    yield self._parse(buffer, start, stop, layout)
+                    start = stop
+            return
+
+        from concurrent.futures import ProcessPoolExecutor
+
+        ranges = self.chunks()
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            yield from executor.map(self.read_chunk, *zip(*ranges)) if ranges else ()
+
+    def iter_orders(self, workers: int = None) -> Iterator[Order]:
+        """Lazily yield the orders of the file as Order objects, e.g. for ``process_orders``."""
+        for batch in self.iter_batches(workers):
+            yield from batch
@@ -0,0 +1,103 @@
+import struct
+from array import array
+
+from models.order_batch import OrderBatch
+from .base_order_file_reader import BaseOrderFileReader
+
+MAGIC = b"ORDB"
+VERSION = 1
+# Magic, version, number of type names, number of records
+HEADER = struct.Struct("<4sHHQ")
+# ID, amount, then type, special flag, status and priority codes, padded to
+# three 8-byte words so that every column is at a fixed word offset
+RECORD = struct.Struct("<qdBBBB4x")
+RECORD_WORDS = RECORD.size // 8
+
+
+class BinaryOrderFileReader(BaseOrderFileReader):
+    """Reads orders from a fixed-width binary file, as written by ``write``.
+
+    The header holds the type names the type codes index, followed by the
+    records. Status and priority codes index ``ORDER_STATUSES`` and
+    ``ORDER_PRIORITIES``. Each column of a chunk is copied out of the
+    memory map with a single strided copy, without creating an object per
+    record.
+    """
+
+    @classmethod
+    def write(cls, path: str, batch: OrderBatch) -> None:
+        """Write a batch of orders in the format read by this reader."""
+        type_names = [name.encode() for name in batch.type_names]
+        header = HEADER.pack(MAGIC, VERSION, len(type_names), len(batch))
+        header += b"".join(bytes([len(name)]) + name for name in type_names)
+        header += bytes(-len(header) % 8)
+
+        with open(path, "wb") as file_handler:
+            file_handler.write(header)
+            file_handler.writelines(
+                RECORD.pack(*fields)
+                for fields in zip(
+                    batch.ids,
+                    batch.amounts,
+                    batch.type_codes,
+                    batch.is_special,
+                    batch.status_codes,
+                    batch.priority_codes,
+                )
+            )
+
+    def _read_header(self, buffer):
+        """Return the offset of the first record, the record count and the type names."""
+        if len(buffer) < HEADER.size:
+            raise ValueError(f"{self.path} is not an order file")
+        magic, version, type_count, count = HEADER.unpack_from(buffer)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{self.path} is not a version {VERSION} order file")
+
+        offset = HEADER.size
+        type_names = []
+        for _ in range(type_count):
+            if offset >= len(buffer) or offset + 1 + buffer[offset] > len(buffer):
+                raise ValueError(f"{self.path} is truncated in its type names")
+            length = buffer[offset]
+            type_names.append(bytes(buffer[offset + 1 : offset + 1 + length]).decode())
+            offset += 1 + length
+        offset += -offset % 8
+
+        if offset + count * RECORD.size != len(buffer):
+            raise ValueError(f"{self.path} is truncated or has trailing data")
+        return offset, count, type_names
+
+    def _read_layout(self, buffer):
+        return self._read_header(buffer) if len(buffer) else None
+
+    def _data_range(self, buffer, layout):
+        if layout is None:
+            return 0, 0
+        offset, count, _ = layout
+        return offset, offset + count * RECORD.size
+
+    def _chunk_end(self, buffer, offset, end, layout):
+        _, remainder = divmod(offset - layout[0], RECORD.size)
+        return min(offset + (RECORD.size - remainder) % RECORD.size, end)
+
+    def _parse(self, buffer, start, end, layout):
+        _, _, type_names = layout
+        batch = OrderBatch()
+        chunk = memoryview(buffer)[start:end]
+
+        batch.ids.frombytes(chunk.cast("q")[0::RECORD_WORDS].tobytes())
+        batch.amounts.frombytes(chunk.cast("d")[1::RECORD_WORDS].tobytes())
+        type_codes = chunk[16 :: RECORD.size].tobytes()
+        batch.is_special.frombytes(chunk[17 :: RECORD.size].tobytes())
+        batch.status_codes.frombytes(chunk[18 :: RECORD.size].tobytes())
+        batch.priority_codes.frombytes(chunk[19 :: RECORD.size].tobytes())
+
+        # Registers the file's extra types on the batch in code order
+        table = bytes(batch.type_code(name) for name in type_names)
+        if table != bytes(range(len(table))):
+            # The file was written with other code tables, remap its codes to the batch's
+            type_codes = type_codes.translate(table.ljust(256, b"\0"))
+        batch.type_codes = array("b", type_codes)
+
+        return batch
@@ -0,0 +1,69 @@
+import re
+from array import array
+
+from constants.constants import OrderStatus, OrderPriority
+from models.order_batch import OrderBatch, ORDER_TYPES, ORDER_STATUSES, ORDER_PRIORITIES
+from .base_order_file_reader import BaseOrderFileReader
+
+# One unquoted ``id,type,amount,is_special`` record
+_RECORD = re.compile(rb"(-?\d+),([^,\r\n]*),([^,\r\n]+),([^,\r\n]*)\r?\n")
+_TRUE_VALUES = frozenset((b"1", b"true", b"True", b"TRUE", b"yes"))
+NEW = ORDER_STATUSES.index(OrderStatus.NEW)
+LOW = ORDER_PRIORITIES.index(OrderPriority.LOW)
+
+
+class CSVOrderFileReader(BaseOrderFileReader):
+    """Reads orders from a CSV file with an ``id,type,amount,is_special`` header.
+
+    Records are matched directly on the memory map, so fields are the only
+    copies made. Quoted fields are not supported.
+    """
+
+    def _data_range(self, buffer, layout):
+        header_end = buffer.find(b"\n")
+        if header_end < 0:
+            return len(buffer), len(buffer)
+        # A last record without a trailing newline is completed in _parse
+        return header_end + 1, len(buffer)
+
+    def _chunk_end(self, buffer, offset, end, layout):
+        newline = buffer.find(b"\n", offset - 1 if offset > 0 else 0, end)
+        return end if newline < 0 else newline + 1
+
+    def _parse(self, buffer, start, end, layout):
+        batch = OrderBatch()
+        ids, amounts, is_special, type_codes = batch.ids, batch.amounts, batch.is_special, batch.type_codes
+        # Type codes by raw field, so that each type is decoded once per chunk
+        codes = {order_type.encode(): code for code, order_type in enumerate(ORDER_TYPES)}
+
+        match = _RECORD.match
+        position = start
+        while position < end:
+            record = match(buffer, position, end)
+            if record is None:
+                record = self._match_last_record(buffer, position, end)
+                position = end
+            else:
+                position = record.end()
+            id_, order_type, amount, special = record.groups()
+
+            code = codes.get(order_type)
+            if code is None:
+                code = codes[order_type] = batch.type_code(order_type.decode())
+            ids.append(int(id_))
+            amounts.append(float(amount))
+            is_special.append(special.strip() in _TRUE_VALUES)
+            type_codes.append(code)
+
+        # Orders are read with the status and priority a new Order starts with
+        batch.status_codes = array("b", [NEW]) * len(ids)
+        batch.priority_codes = array("b", [LOW]) * len(ids)
+        return batch
+
+    def _match_last_record(self, buffer, position, end):
+        """Match a record not ending with a newline, which may only be the last one."""
+        if end == len(buffer) and buffer.find(b"\n", position, end) < 0:
+            record = _RECORD.fullmatch(bytes(buffer[position:end]) + b"\n")
+            if record is not None:
+                return record
+        raise ValueError(f"Malformed order record at byte {position} of {self.path}")
@@ -0,0 +1,26 @@
+from abc import ABC, abstractmethod
+
+
+class Stage:
+    """Enum for the instrumented OrderService stages."""
+
+    FETCH = "fetch_orders"
+    EXPORT = "export"
+    API = "call_api"
+    UPDATE = "update_order"
+    # Not timed, only used to report orders failing with an unexpected exception
+    PROCESS = "process_order"
+
+
+class BaseInstrumentation(ABC):
+    """Abstract base class for OrderService instrumentation hooks."""
+
+    @abstractmethod
+    def record_stage(self, stage: str, seconds: float) -> None:
+        """Record the latency of one call of a stage."""
+        pass
+
+    @abstractmethod
+    def record_order(self, order_type: str, status: str) -> None:
+        """Record an order once processing has settled its final status."""
+        pass
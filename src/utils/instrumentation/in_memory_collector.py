@@ -0,0 +1,51 @@
+import json
+import threading
+from collections import Counter
+
+from .base_instrumentation import BaseInstrumentation
+from .latency_histogram import LatencyHistogram
+
+
+class InMemoryCollector(BaseInstrumentation):
+    """Instrumentation collector keeping latency histograms and order counts in memory.
+
+    Example:
+            collector = InMemoryCollector()
+            OrderService.instrumentation = collector
+            OrderService.process_order_by_user_id(user_id)
+            print(collector.to_json())
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.stages = {}
+            self.order_types = Counter()
+            self.order_statuses = Counter()
+
+    def record_stage(self, stage: str, seconds: float) -> None:
+        with self._lock:
+            histogram = self.stages.get(stage)
+            if histogram is None:
+                histogram = self.stages[stage] = LatencyHistogram()
+            histogram.record(seconds)
+
+    def record_order(self, order_type: str, status: str) -> None:
+        with self._lock:
+            self.order_types[order_type] += 1
+            self.order_statuses[status] += 1
+
+    def snapshot(self) -> dict:
+        """Return a JSON-serializable copy of everything collected so far."""
+        with self._lock:
+            return {
+                "stages": {stage: histogram.summary() for stage, histogram in self.stages.items()},
+                "order_types": dict(self.order_types),
+                "order_statuses": dict(self.order_statuses),
+            }
+
+    def to_json(self) -> str:
+        return json.dumps(self.snapshot(), sort_keys=True)
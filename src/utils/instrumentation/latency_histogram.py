@@ -0,0 +1,54 @@
+import math
+from collections import Counter
+from typing import Dict
+
+
+class LatencyHistogram:
+    """Log-bucketed latency histogram with bounded memory.
+
+    Bucket boundaries grow by a factor of ``2 ** (1 / 8)``, so percentiles
+    are accurate to about 5% regardless of how many samples are recorded.
+    """
+
+    BUCKETS_PER_DOUBLING = 8
+    MIN_SECONDS = 1e-7
+
+    def __init__(self) -> None:
+        self.buckets = Counter()
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = 0.0
+
+    def record(self, seconds: float) -> None:
+        bucket = math.floor(math.log2(max(seconds, self.MIN_SECONDS)) * self.BUCKETS_PER_DOUBLING)
+        self.buckets[bucket] += 1
+        self.count += 1
+        self.total += seconds
+        self.min = min(self.min, seconds)
+        self.max = max(self.max, seconds)
+
+    def percentile(self, percent: float) -> float:
+        """Return the approximate latency below which ``percent`` % of samples fall."""
+        if not self.count:
+            return 0.0
+
+        rank = math.ceil(self.count * percent / 100)
+        seen = 0
+        for bucket in sorted(self.buckets):
+            seen += self.buckets[bucket]
+            if seen >= rank:
+                # Geometric middle of the bucket, clamped to the observed range
+                value = 2 ** ((bucket + 0.5) / self.BUCKETS_PER_DOUBLING)
+                return min(max(value, self.min), self.max)
+        return self.max
+
+    def summary(self) -> Dict[str, float]:
+        return {
+            "count": self.count,
+            "total": self.total,
+            "p50": self.percentile(50),
+            "p95": self.percentile(95),
+            "p99": self.percentile(99),
+            "max": self.max,
+        }